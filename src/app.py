@@ -1,4 +1,9 @@
 # src/app.py
+import time
+from typing import Dict
+
+from PyQt6.QtWidgets import QApplication
+
 from src.database.user_database import initialize_user_database
 from src.database.product_database import initialize_product_database
 from src.database.setting_database import initialize_setting_database
@@ -27,20 +32,55 @@ from src.controllers.setting_controller import (
     SettingUserDataDirController,
 )
 from src.controllers.robot_controller import RobotController
+from src.services.db_job_runner import DbJobRunner
+from src.services import instrumentation, sql_trace
+from src.my_constants import (
+    CONNECTION_DB_PRODUCT,
+    CONNECTION_DB_SETTING,
+    CONNECTION_DB_USER,
+    INSTRUMENTATION_DUMP_INTERVAL_MS,
+    INSTRUMENTATION_ENABLED,
+    PATH_INSTRUMENTATION_DUMP,
+    SQL_SLOW_QUERY_MS,
+    SQL_TRACE_ENABLED,
+)
 
 from src.views.mainwindow import MainWindow
 
 
 class Application:
     def __init__(self):
+        start_time = time.perf_counter()
+        self.startup_timings: Dict[str, float] = {}
+        if SQL_TRACE_ENABLED:
+            sql_trace.enable(slow_ms=SQL_SLOW_QUERY_MS)
+            print(
+                f"INFO: [Application] SQL tracing enabled, slow query threshold {SQL_SLOW_QUERY_MS:g} ms."
+            )
         self.initial_database()
-        user_model = UserModel()
-        user_listed_product_model = UserListedProductModel()
-        real_estate_product_model = RealEstateProductModel()
-        real_estate_template_model = RealEstateTemplateModel()
-        misc_product_model = MiscProductModel()
-        setting_proxy_model = SettingProxyModel()
-        setting_user_data_dir_model = SettingUserDataDirModel()
+        self._record_timing("database", start_time)
+        # Models are lazy: rows are selected when a view first shows them or a
+        # service first looks a record up.
+        self.models = [
+            self._build_model(UserModel),
+            self._build_model(UserListedProductModel),
+            self._build_model(RealEstateProductModel),
+            self._build_model(RealEstateTemplateModel),
+            self._build_model(MiscProductModel),
+            self._build_model(SettingProxyModel),
+            self._build_model(SettingUserDataDirModel),
+        ]
+        (
+            user_model,
+            user_listed_product_model,
+            real_estate_product_model,
+            real_estate_template_model,
+            misc_product_model,
+            setting_proxy_model,
+            setting_user_data_dir_model,
+        ) = self.models
+
+        services_start_time = time.perf_counter()
 
         user_service = UserService(user_model)
         user_listed_product_service = UserListedProductService(
@@ -58,6 +98,8 @@ class Application:
             setting_user_data_dir_model
         )
 
+        self._record_timing("services", services_start_time)
+
         user_controller = UserController(user_service)
         user_listed_product_controller = UserListedProductController(
             user_listed_product_service
@@ -80,7 +122,29 @@ class Application:
             re_template_service=real_estate_template_service,
             setting_proxy_service=setting_proxy_service,
             setting_udd_service=setting_user_data_dir_service,
+            listed_product_service=user_listed_product_service,
+        )
+        # Imports/exports run on a dedicated DB thread with cloned connections.
+        self.job_runner = DbJobRunner(
+            [CONNECTION_DB_USER, CONNECTION_DB_PRODUCT, CONNECTION_DB_SETTING]
         )
+        for controller in (
+            user_controller,
+            user_listed_product_controller,
+            real_estate_product_controller,
+            real_estate_template_controller,
+            misc_product_controller,
+            setting_proxy_controller,
+            setting_user_data_dir_controller,
+            robot_controller,
+        ):
+            controller.set_job_runner(self.job_runner)
+        QApplication.instance().aboutToQuit.connect(self.job_runner.shutdown)
+
+        if INSTRUMENTATION_ENABLED:
+            self.enable_instrumentation()
+
+        main_window_start_time = time.perf_counter()
         self.mainWindow = MainWindow(
             user_controller=user_controller,
             robot_controller=robot_controller,
@@ -90,8 +154,49 @@ class Application:
             misc_product_controller=misc_product_controller,
             setting_proxy_controller=setting_proxy_controller,
             setting_user_data_dir_controller=setting_user_data_dir_controller,
+            job_runner=self.job_runner,
         )
         self.mainWindow.show()
+        self._record_timing("main window", main_window_start_time)
+        self._record_timing("total", start_time)
+        self.print_startup_report()
+
+    def enable_instrumentation(self):
+        """Times the service and controller calls (the diagnostics panel,
+        Ctrl+Shift+D, shows them) and dumps the stats periodically and on exit."""
+        instrumentation.enable()
+        instrumentation.start_periodic_dump(
+            PATH_INSTRUMENTATION_DUMP, INSTRUMENTATION_DUMP_INTERVAL_MS
+        )
+        QApplication.instance().aboutToQuit.connect(instrumentation.stop_periodic_dump)
+        print(
+            f"INFO: [Application] Instrumentation enabled, dumping to '{PATH_INSTRUMENTATION_DUMP}'."
+        )
+
+    def _build_model(self, model_class):
+        start_time = time.perf_counter()
+        model = model_class(lazy=True)
+        self._record_timing(model_class.__name__, start_time)
+        return model
+
+    def _record_timing(self, name: str, start_time: float):
+        self.startup_timings[name] = time.perf_counter() - start_time
+
+    def print_startup_report(self):
+        """Prints the time spent per startup step and per model. Models still
+        waiting for their first select() are reported as deferred."""
+        print("INFO: [Application] Startup timings:")
+        for name, seconds in self.startup_timings.items():
+            print(f"    {name:<36}{seconds * 1000:>10.1f} ms")
+        for model in self.models:
+            name = f"{model.__class__.__name__}.select"
+            if model.load_seconds is None:
+                print(f"    {name:<36}{'deferred':>13}")
+            else:
+                print(
+                    f"    {name:<36}{model.load_seconds * 1000:>10.1f} ms"
+                    f" ({model.rowCount()} rows)"
+                )
 
     def initial_database(self):
         if not initialize_product_database():
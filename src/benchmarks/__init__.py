@@ -0,0 +1,13 @@
+# src/benchmarks/__init__.py
+"""
+Benchmarks of the service and data layer on synthetic catalogs.
+
+    python -m src.benchmarks --sizes 1000 10000 -o before.json
+    python -m src.benchmarks --sizes 1000 10000 --baseline before.json
+
+Product, template and user datasets of every size are generated into
+temporary SQLite files (datasets.py); each case of cases.py is timed against
+them under the offscreen Qt platform. With --baseline, the time per
+operation of every case is compared with an earlier results file and the
+exit status is 1 when one got slower than --threshold.
+"""
@@ -0,0 +1,104 @@
+# src/benchmarks/__main__.py
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+
+# Set before Qt is imported: the benchmarks never show a window.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from src.benchmarks.datasets import SIZES
+from src.benchmarks.runner import (
+    compare_results,
+    format_comparison,
+    load_results,
+    run_benchmarks,
+    save_results,
+    select_cases,
+)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.benchmarks",
+        description="Times the service and data layer on synthetic datasets.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(SIZES[:3]),
+        help=f"dataset sizes in rows (default: {' '.join(map(str, SIZES[:3]))}; "
+        f"{SIZES[-1]} takes minutes to generate)",
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        help="fnmatch patterns of the cases to run, e.g. 'product.*'",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--data-dir",
+        help="where to keep the datasets between runs (default: a temporary directory)",
+    )
+    parser.add_argument("--output", "-o", help="write the results JSON to this file")
+    parser.add_argument(
+        "--baseline", help="results JSON of an earlier commit to compare against"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown per operation reported as a regression (default: 0.2)",
+    )
+    parser.add_argument("--list", action="store_true", help="list the cases and exit")
+    parser.add_argument(
+        "--verbose", "-v", action="store_true", help="keep the services' output"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.list:
+        for case in select_cases(args.cases):
+            limit = f" (up to {case.max_size} rows)" if case.max_size else ""
+            print(f"{case.name}{limit}")
+        return 0
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    data_dir = args.data_dir or tempfile.mkdtemp(prefix="my-manager-bench-")
+    try:
+        results = run_benchmarks(
+            args.sizes,
+            data_dir,
+            patterns=args.cases,
+            repeat=args.repeat,
+            seed=args.seed,
+            verbose=args.verbose,
+        )
+    finally:
+        if not args.data_dir:
+            shutil.rmtree(data_dir, ignore_errors=True)
+    if args.output:
+        save_results(results, args.output)
+        print(f"INFO: Results written to '{args.output}'.")
+    if not args.baseline:
+        return 0
+    rows = compare_results(load_results(args.baseline), results, args.threshold)
+    print(format_comparison(rows))
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(
+            f"{len(regressions)} regression(s) above {args.threshold:.0%} against '{args.baseline}'."
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
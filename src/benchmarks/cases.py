@@ -0,0 +1,392 @@
+# src/benchmarks/cases.py
+import os
+import json
+import random
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from src.benchmarks.datasets import (
+    generate,
+    make_product,
+    make_template,
+    make_user,
+)
+from src.models.user_model import UserModel, UserListedProductModel
+from src.models.product_model import RealEstateProductModel, RealEstateTemplateModel
+from src.services.base_service import BaseService
+from src.services.user_service import UserService, UserListedProductService
+from src.services.product_service import (
+    RealEstateProductService,
+    RealEstateTemplateService,
+)
+from src.controllers.base_controller import BaseController
+from src.controllers.user_controller import UserController
+from src.controllers.product_controller import (
+    RealEstateProductController,
+    RealEstateTemplateController,
+)
+from src.views.utils.multi_field_model import MultiFieldFilterProxyModel
+from src.views.utils.sql_filter_model import SqlFilterProxyModel
+from src.utils.re_template import init_footer_content, render_many, replace_template
+from src.my_constants import RE_CATEGORY, RE_TRANSACTION
+
+# Operations per timed run of the per-record cases.
+CRUD_OPS = 100
+READ_OPS = 500
+RANDOM_OPS = 1_000
+IMPORT_ROWS = 1_000
+RENDER_OPS = 200
+
+_FILTERS = [
+    ("ward", "phường 1"),
+    ("street", "trần"),
+    ("category", "nhà"),
+    ("pid", "re.b.00001"),
+    ("function", "3 phòng"),
+]
+_SEARCHES = ["da lat", "tran hung dao", "biet thu phuong 2", "RE B 0000", "doi thong"]
+
+
+class BenchmarkContext:
+    """The models, services and controllers of one dataset, wired like in
+    Application, plus helpers shared by the cases."""
+
+    def __init__(self, directory: str, size: int, seed: int = 0):
+        self.directory = directory
+        self.size = size
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.image_dir = os.path.join(directory, "images")
+        self.udd_dir = os.path.join(directory, "user_data_dirs")
+        os.makedirs(self.udd_dir, exist_ok=True)
+
+        self.product_model = RealEstateProductModel(lazy=True)
+        self.template_model = RealEstateTemplateModel(lazy=True)
+        self.user_model = UserModel(lazy=True)
+        self.product_service = RealEstateProductService(self.product_model)
+        self.template_service = RealEstateTemplateService(self.template_model)
+        self.user_service = UserService(self.user_model)
+        self.user_service.listed_product_service = UserListedProductService(
+            UserListedProductModel(lazy=True)
+        )
+        self.services: Dict[str, BaseService] = {
+            "product": self.product_service,
+            "template": self.template_service,
+            "user": self.user_service,
+        }
+        self.controllers: Dict[str, BaseController] = {
+            "product": RealEstateProductController(self.product_service),
+            "template": RealEstateTemplateController(self.template_service),
+            "user": UserController(self.user_service),
+        }
+        self.factories: Dict[str, Callable[[random.Random, int], Any]] = {
+            "product": make_product,
+            "template": make_template,
+            "user": make_user,
+        }
+        # Start index of the next generated batch, past the dataset rows.
+        self._next_index = size
+
+    def new_records(self, entity: str, count: int) -> List[Any]:
+        start = self._next_index
+        self._next_index += count
+        return list(
+            generate(self.factories[entity], count, self.rng.random(), start=start)
+        )
+
+    def sample_ids(self, count: int) -> List[int]:
+        # Dataset rows have the ids 1..size; the cases delete only what they add.
+        return [self.rng.randint(1, self.size) for _ in range(count)]
+
+    def max_id(self, entity: str) -> int:
+        query = self.services[entity]._exec_prepared(
+            f"SELECT COALESCE(MAX(id), 0) FROM {self.services[entity].model.tableName()}",
+            [],
+        )
+        return int(query.value(0)) if query is not None and query.next() else 0
+
+    def ids_after(self, entity: str, max_id: int) -> List[int]:
+        service = self.services[entity]
+        query = service._exec_prepared(
+            f"SELECT id FROM {service.model.tableName()} WHERE id > ?", [max_id]
+        )
+        record_ids = []
+        while query is not None and query.next():
+            record_ids.append(query.value(0))
+        return record_ids
+
+    def trim(self, entity: str, max_id: int):
+        """Deletes the rows added after `max_id`, through the service."""
+        record_ids = self.ids_after(entity, max_id)
+        if record_ids:
+            self.services[entity].delete_multiple(record_ids)
+
+    def create(self, entity: str, payload: Any) -> bool:
+        if entity == "product":
+            return self.product_service.create(self.image_dir, [], payload)
+        return self.services[entity].create(payload)
+
+    def delete(self, entity: str, record_id: int) -> bool:
+        if entity == "user":
+            return self.user_service.delete(self.udd_dir, record_id)
+        return self.services[entity].delete(record_id)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    `run(context, state)` is timed and returns the number of operations it
+    performed. `setup(context)` prepares its state and `teardown(context,
+    state)` undoes its writes, both untimed, around every run. Cases with a
+    `max_size` are skipped on larger datasets.
+    """
+
+    name: str
+    run: Callable[[BenchmarkContext, Any], int]
+    setup: Optional[Callable[[BenchmarkContext], Any]] = None
+    teardown: Optional[Callable[[BenchmarkContext, Any], None]] = None
+    max_size: Optional[int] = None
+
+
+CASES: List[BenchmarkCase] = []
+
+
+def benchmark(
+    name: str,
+    setup: Optional[Callable[[BenchmarkContext], Any]] = None,
+    teardown: Optional[Callable[[BenchmarkContext, Any], None]] = None,
+    max_size: Optional[int] = None,
+):
+    def register(run: Callable[[BenchmarkContext, Any], int]):
+        CASES.append(BenchmarkCase(name, run, setup, teardown, max_size))
+        return run
+
+    return register
+
+
+# ============================================================================
+# CRUD, import and export of every entity
+# ============================================================================
+def _register_crud_cases(entity: str):
+    def setup_create(context: BenchmarkContext):
+        return context.max_id(entity), context.new_records(entity, CRUD_OPS)
+
+    def run_create(context: BenchmarkContext, state) -> int:
+        for payload in state[1]:
+            context.create(entity, payload)
+        return len(state[1])
+
+    def teardown_trim(context: BenchmarkContext, state):
+        context.trim(entity, state[0])
+
+    def setup_read(context: BenchmarkContext):
+        return context.sample_ids(READ_OPS)
+
+    def run_read(context: BenchmarkContext, record_ids) -> int:
+        service = context.services[entity]
+        for record_id in record_ids:
+            service.read(record_id)
+        return len(record_ids)
+
+    def run_read_by_ids(context: BenchmarkContext, record_ids) -> int:
+        context.services[entity].read_by_ids(record_ids)
+        return len(record_ids)
+
+    def setup_update(context: BenchmarkContext):
+        records = context.services[entity].read_by_ids(context.sample_ids(CRUD_OPS))
+        replacements = context.new_records(entity, len(records))
+        for record, replacement in zip(records, replacements):
+            replacement.id = record.id
+            # Keep the unique columns of the row being updated.
+            for column in ("pid", "uid"):
+                if hasattr(record, column):
+                    setattr(replacement, column, getattr(record, column))
+        return replacements
+
+    def run_update(context: BenchmarkContext, records) -> int:
+        service = context.services[entity]
+        for record in records:
+            service.update(record.id, record)
+        return len(records)
+
+    def setup_delete(context: BenchmarkContext):
+        max_id = context.max_id(entity)
+        context.services[entity].import_data(context.new_records(entity, CRUD_OPS))
+        return context.ids_after(entity, max_id)
+
+    def run_delete(context: BenchmarkContext, record_ids) -> int:
+        for record_id in record_ids:
+            context.delete(entity, record_id)
+        return len(record_ids)
+
+    def setup_import(context: BenchmarkContext):
+        file_path = context.path(f"{entity}_import.json")
+        with open(file_path, "w", encoding="utf8") as f:
+            json.dump(
+                [asdict(record) for record in context.new_records(entity, IMPORT_ROWS)],
+                f,
+                ensure_ascii=False,
+            )
+        return context.max_id(entity), file_path
+
+    def run_import(context: BenchmarkContext, state) -> int:
+        context.controllers[entity].import_products(state[1])
+        return IMPORT_ROWS
+
+    def run_export(context: BenchmarkContext, state) -> int:
+        file_path = context.path(f"{entity}_export.json")
+        context.controllers[entity].export_to_file(file_path)
+        os.remove(file_path)
+        return context.size
+
+    benchmark(f"{entity}.create", setup_create, teardown_trim)(run_create)
+    benchmark(f"{entity}.read", setup_read)(run_read)
+    benchmark(f"{entity}.read_by_ids", setup_read)(run_read_by_ids)
+    benchmark(f"{entity}.update", setup_update)(run_update)
+    benchmark(f"{entity}.delete", setup_delete)(run_delete)
+    benchmark(f"{entity}.import", setup_import, teardown_trim)(run_import)
+    benchmark(f"{entity}.export")(run_export)
+
+
+for _entity in ("product", "template", "user"):
+    _register_crud_cases(_entity)
+
+
+# ============================================================================
+# Random picks and search
+# ============================================================================
+@benchmark("product.get_random")
+def product_get_random(context: BenchmarkContext, state) -> int:
+    transaction_types = list(RE_TRANSACTION.values())
+    for i in range(RANDOM_OPS):
+        context.product_service.get_random(transaction_types[i % 3])
+    return RANDOM_OPS
+
+
+@benchmark("template.get_random")
+def template_get_random(context: BenchmarkContext, state) -> int:
+    transaction_types = list(RE_TRANSACTION.values())
+    categories = list(RE_CATEGORY.values())
+    for i in range(RANDOM_OPS):
+        context.template_service.get_random(
+            "title", transaction_types[i % 3], categories[i % len(categories)]
+        )
+    return RANDOM_OPS
+
+
+@benchmark("product.search")
+def product_search(context: BenchmarkContext, state) -> int:
+    for text in _SEARCHES:
+        context.product_service.search(text, limit=100)
+    return len(_SEARCHES)
+
+
+# ============================================================================
+# Streaming reads
+# ============================================================================
+_NUMERIC_COLUMNS = ["price", "area", "structure"]
+
+
+@benchmark("product.iter_all")
+def product_iter_all(context: BenchmarkContext, state) -> int:
+    for _ in context.product_service.iter_all(batch_size=5000):
+        pass
+    return context.size
+
+
+@benchmark("product.iter_rows")
+def product_iter_rows(context: BenchmarkContext, state) -> int:
+    for _ in context.product_service.iter_rows(
+        columns=["pid"] + _NUMERIC_COLUMNS, batch_size=5000
+    ):
+        pass
+    return context.size
+
+
+@benchmark("product.snapshot_columns")
+def product_snapshot_columns(context: BenchmarkContext, state) -> int:
+    context.product_service.snapshot_columns(_NUMERIC_COLUMNS)
+    return context.size
+
+
+# ============================================================================
+# Filtering
+# ============================================================================
+def _filter_columns(model) -> List[tuple]:
+    return [(model.fieldIndex(column), text) for column, text in _FILTERS]
+
+
+def _setup_sql_filter(context: BenchmarkContext) -> SqlFilterProxyModel:
+    proxy = SqlFilterProxyModel(context.product_model)
+    proxy.ensure_selected()
+    return proxy
+
+
+@benchmark("product.filter_sql", setup=_setup_sql_filter)
+def product_filter_sql(context: BenchmarkContext, proxy: SqlFilterProxyModel) -> int:
+    """One filter after the other, as typed in the page's search fields; each
+    re-selects the first page of the matching rows."""
+    filters = _filter_columns(context.product_model)
+    for column, text in filters:
+        proxy.set_filter(column, text)
+        proxy._apply()
+        proxy.rowCount()
+    for column, _ in filters:
+        proxy.set_filter(column, "")
+    proxy._apply()
+    return len(filters)
+
+
+def _setup_python_filter(context: BenchmarkContext) -> MultiFieldFilterProxyModel:
+    proxy = MultiFieldFilterProxyModel()
+    model = RealEstateProductModel(parent=proxy)
+    while model.canFetchMore():
+        model.fetchMore()
+    proxy.setSourceModel(model)
+    return proxy
+
+
+# Every row is loaded into the model first: too much memory past 100k rows.
+@benchmark("product.filter_python", setup=_setup_python_filter, max_size=100_000)
+def product_filter_python(
+    context: BenchmarkContext, proxy: MultiFieldFilterProxyModel
+) -> int:
+    filters = _filter_columns(context.product_model)
+    for column, text in filters:
+        proxy.set_filter(column, text)
+        proxy.rowCount()
+    for column, _ in filters:
+        proxy.set_filter(column, "")
+    return len(filters)
+
+
+# ============================================================================
+# Template rendering
+# ============================================================================
+def _setup_render(context: BenchmarkContext):
+    return context.product_service.read_by_ids(context.sample_ids(RENDER_OPS))
+
+
+@benchmark("template.render", setup=_setup_render)
+def template_render(context: BenchmarkContext, products) -> int:
+    """What the product page does for "random": pick a title and a description
+    template, fill both and add the footer."""
+    template_service = context.template_service
+    for product in products:
+        for part in ("title", "description"):
+            template = template_service.get_random(
+                part, product.transaction_type, product.category
+            )
+            replace_template(product, template)
+        init_footer_content(product)
+    return len(products)
+
+
+@benchmark("template.render_many", setup=_setup_render)
+def template_render_many(context: BenchmarkContext, products) -> int:
+    template = context.template_service.get_random("description", "", "")
+    render_many(products, template)
+    return len(products)
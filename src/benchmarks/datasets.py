@@ -0,0 +1,214 @@
+# src/benchmarks/datasets.py
+import os
+import json
+import random
+from dataclasses import fields
+from typing import Any, Callable, Iterator, List, Optional
+
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+from src.database.user_database import initialize_user_database
+from src.database.product_database import initialize_product_database
+from src.database.setting_database import initialize_setting_database
+from src.services.base_service import transaction
+from src.my_types import RealEstateProductType, RealEstateTemplateType, UserType
+from src.my_constants import (
+    CONNECTION_DB_PRODUCT,
+    CONNECTION_DB_USER,
+    RE_BUILDING_LINE,
+    RE_CATEGORY,
+    RE_DISTRICT,
+    RE_FURNITURE,
+    RE_LEGAL,
+    RE_PROVINCE,
+    RE_TRANSACTION,
+    RE_WARD,
+    TABLE_REAL_ESTATE_PRODUCT,
+    TABLE_REAL_ESTATE_TEMPLATE,
+    TABLE_USER,
+)
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+MANIFEST_NAME = "dataset.json"
+# Rows bound per execBatch() while writing a dataset.
+WRITE_CHUNK_SIZE = 50_000
+
+_STREETS = [
+    "trần hưng đạo",
+    "phan đình phùng",
+    "hai bà trưng",
+    "yersin",
+    "3 tháng 2",
+    "bùi thị xuân",
+    "nguyễn văn cừ",
+    "hoàng văn thụ",
+    "mai anh đào",
+    "khe sanh",
+]
+_TEMPLATE_PARTS = ["title", "description"]
+_TITLE_TEMPLATE = (
+    "<icon> <transaction_type> <category> <street>, <ward> - <price> <unit>"
+)
+_DESCRIPTION_TEMPLATE = (
+    "<icon> <category> <street>, <ward>, <district>\n"
+    "<icon> Diện tích: <area>m2 - Kết cấu: <structure> tầng\n"
+    "<icon> Công năng: <function>\n"
+    "<icon> <building_line>, <furniture>, <legal>\n"
+    "<icon> Giá: <price> <unit>\n"
+    "<description>"
+)
+
+
+def make_product(rng: random.Random, index: int) -> RealEstateProductType:
+    transaction_type = rng.choice(list(RE_TRANSACTION.values()))
+    category = rng.choice(list(RE_CATEGORY.values()))
+    street = rng.choice(_STREETS)
+    ward = rng.choice(list(RE_WARD.values()))
+    return RealEstateProductType(
+        id=None,
+        pid=f"RE.B.{index:07d}",
+        status=rng.randint(0, 1),
+        transaction_type=transaction_type,
+        province=RE_PROVINCE["lam_dong"],
+        district=RE_DISTRICT["da_lat"],
+        ward=ward,
+        street=f"{rng.randint(1, 200)} {street}",
+        category=category,
+        area=round(rng.uniform(30, 1000), 1),
+        price=round(rng.uniform(1, 50), 2),
+        legal=rng.choice(list(RE_LEGAL.values())),
+        structure=float(rng.randint(1, 5)),
+        function=f"{rng.randint(1, 6)} phòng ngủ, {rng.randint(1, 4)} wc",
+        building_line=rng.choice(list(RE_BUILDING_LINE.values())),
+        furniture=rng.choice(list(RE_FURNITURE.values())),
+        description=f"{category} {street} {ward}, gần chợ Đà Lạt, view đồi thông, sân rộng.",
+        image_dir=None,
+        created_at=None,
+        updated_at=None,
+    )
+
+
+def make_template(rng: random.Random, index: int) -> RealEstateTemplateType:
+    part = _TEMPLATE_PARTS[index % len(_TEMPLATE_PARTS)]
+    return RealEstateTemplateType(
+        id=None,
+        transaction_type=rng.choice(list(RE_TRANSACTION.values())),
+        category=rng.choice(list(RE_CATEGORY.values())),
+        is_default=0,
+        part=part,
+        value=_TITLE_TEMPLATE if part == "title" else _DESCRIPTION_TEMPLATE,
+        created_at=None,
+        updated_at=None,
+    )
+
+
+def make_user(rng: random.Random, index: int) -> UserType:
+    return UserType(
+        id=None,
+        uid=f"1000{index:011d}",
+        username=f"user.{index}",
+        password=f"pw{rng.getrandbits(32):08x}",
+        two_fa=None,
+        email=f"user.{index}@example.com",
+        email_password=None,
+        phone_number=f"09{rng.randint(0, 99_999_999):08d}",
+        note=f"group {index % 20}",
+        type=rng.choice(["re.s", "re.r", "misc"]),
+        user_group=index % 20,
+        mobile_ua="Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X)",
+        desktop_ua="Mozilla/5.0 (Macintosh; Intel Mac OS X 14_0)",
+        status=rng.randint(0, 1),
+        created_at=None,
+        updated_at=None,
+    )
+
+
+def generate(
+    factory: Callable[[random.Random, int], Any], count: int, seed: int, start: int = 0
+) -> Iterator[Any]:
+    """Yields `count` synthetic records; the same seed gives the same rows."""
+    rng = random.Random(seed)
+    for index in range(start, start + count):
+        yield factory(rng, index)
+
+
+def write_rows(db: QSqlDatabase, table: str, records: Iterator[Any]) -> int:
+    """Inserts dataclass records with execBatch() in chunks, in one
+    transaction. The id column is left to SQLite. Returns the row count."""
+    written = 0
+    columns: Optional[List[str]] = None
+    with transaction(db):
+        query = QSqlQuery(db)
+        chunk: List[Any] = []
+
+        def flush():
+            nonlocal written
+            for column in columns:
+                query.addBindValue([getattr(record, column) for record in chunk])
+            if not query.execBatch():
+                raise RuntimeError(
+                    f"Cannot write '{table}' rows: {query.lastError().text()}"
+                )
+            written += len(chunk)
+            chunk.clear()
+
+        for record in records:
+            if columns is None:
+                columns = [f.name for f in fields(record) if f.name != "id"]
+                query.prepare(
+                    f"INSERT INTO {table} ({', '.join(columns)}) "
+                    f"VALUES ({', '.join('?' for _ in columns)})"
+                )
+            chunk.append(record)
+            if len(chunk) >= WRITE_CHUNK_SIZE:
+                flush()
+        if chunk:
+            flush()
+    return written
+
+
+def open_dataset(directory: str, size: int, seed: int = 0) -> bool:
+    """
+    Points the named connections at the dataset of `size` rows in
+    `directory`, generating it first unless the directory already holds it
+    (so the slow 1M row datasets can be reused between runs with
+    --data-dir). Returns True when the dataset was generated.
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, MANIFEST_NAME)
+    manifest = {"size": size, "seed": seed}
+    reuse = False
+    if os.path.isfile(manifest_path):
+        with open(manifest_path, "r", encoding="utf8") as f:
+            reuse = json.load(f) == manifest
+    paths = {
+        name: os.path.join(directory, f"{name}.db")
+        for name in ("user", "product", "setting")
+    }
+    if not reuse:
+        for path in paths.values():
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+    initialize_user_database(paths["user"])
+    initialize_product_database(paths["product"])
+    initialize_setting_database(paths["setting"])
+    if reuse:
+        return False
+
+    product_db = QSqlDatabase.database(CONNECTION_DB_PRODUCT)
+    user_db = QSqlDatabase.database(CONNECTION_DB_USER)
+    write_rows(
+        product_db, TABLE_REAL_ESTATE_PRODUCT, generate(make_product, size, seed)
+    )
+    write_rows(
+        product_db,
+        TABLE_REAL_ESTATE_TEMPLATE,
+        generate(make_template, size, seed + 1),
+    )
+    write_rows(user_db, TABLE_USER, generate(make_user, size, seed + 2))
+    for db in (product_db, user_db):
+        QSqlQuery(db).exec("ANALYZE")
+    with open(manifest_path, "w", encoding="utf8") as f:
+        json.dump(manifest, f)
+    return True
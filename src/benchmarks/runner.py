@@ -0,0 +1,202 @@
+# src/benchmarks/runner.py
+import io
+import os
+import gc
+import sys
+import json
+import time
+import fnmatch
+import platform
+import statistics
+import subprocess
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from PyQt6.QtCore import QT_VERSION_STR, QCoreApplication
+
+from src.benchmarks.cases import CASES, BenchmarkCase, BenchmarkContext
+from src.benchmarks.datasets import open_dataset
+
+RESULTS_VERSION = 1
+
+
+def select_cases(patterns: Optional[Sequence[str]] = None) -> List[BenchmarkCase]:
+    """Cases whose name matches one of the fnmatch `patterns` (all cases
+    without patterns), in registration order."""
+    if not patterns:
+        return list(CASES)
+    return [
+        case
+        for case in CASES
+        if any(fnmatch.fnmatchcase(case.name, pattern) for pattern in patterns)
+    ]
+
+
+def time_case(
+    context: BenchmarkContext, case: BenchmarkCase, repeat: int
+) -> Dict[str, Any]:
+    """Runs `case` `repeat` times and returns its result entry. Times are
+    seconds per run; `per_op_us` is the median run divided by its operations."""
+    timings: List[float] = []
+    ops = 0
+    for _ in range(repeat):
+        state = case.setup(context) if case.setup else None
+        # Deferred model work (queued refreshes, deleteLater) of the setup is
+        # not charged to the run.
+        QCoreApplication.processEvents()
+        gc.collect()
+        start = time.perf_counter()
+        ops = case.run(context, state)
+        QCoreApplication.processEvents()
+        timings.append(time.perf_counter() - start)
+        if case.teardown:
+            case.teardown(context, state)
+        state = None
+    median = statistics.median(timings)
+    return {
+        "case": case.name,
+        "size": context.size,
+        "ops": ops,
+        "repeat": repeat,
+        "min_s": min(timings),
+        "median_s": median,
+        "max_s": max(timings),
+        "per_op_us": median / ops * 1e6 if ops else None,
+    }
+
+
+def run_benchmarks(
+    sizes: Sequence[int],
+    data_dir: str,
+    patterns: Optional[Sequence[str]] = None,
+    repeat: int = 3,
+    seed: int = 0,
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    """
+    Runs the selected cases against a synthetic dataset of every size in
+    `sizes` (generated into `data_dir/<size>/`, or reused from there) and
+    returns the results document (see save_results()).
+    """
+    cases = select_cases(patterns)
+    results: List[Dict[str, Any]] = []
+    for size in sizes:
+        directory = os.path.join(data_dir, str(size))
+        start = time.perf_counter()
+        with redirect_stdout(sys.stdout if verbose else io.StringIO()):
+            generated = open_dataset(directory, size, seed)
+        print(
+            f"INFO: [run_benchmarks] {'Generated' if generated else 'Reusing'} "
+            f"the {size} row dataset in {time.perf_counter() - start:.1f}s."
+        )
+        context = BenchmarkContext(directory, size, seed)
+        for case in cases:
+            if case.max_size is not None and size > case.max_size:
+                print(f"  {case.name:<28} {size:>9}  skipped (max {case.max_size})")
+                continue
+            try:
+                with redirect_stdout(sys.stdout if verbose else io.StringIO()):
+                    result = time_case(context, case, repeat)
+            except Exception as e:
+                print(f"[run_benchmarks] Case '{case.name}' failed on {size}: {e}")
+                continue
+            results.append(result)
+            print(
+                f"  {case.name:<28} {size:>9}  {result['median_s'] * 1000:10.2f} ms"
+                f"  {result['per_op_us'] or 0:12.1f} us/op"
+            )
+        context = None
+        gc.collect()
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "qt": QT_VERSION_STR,
+            "platform": platform.platform(),
+            "qpa_platform": os.environ.get("QT_QPA_PLATFORM"),
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def save_results(results: Dict[str, Any], file_path: str):
+    with open(file_path, "w", encoding="utf8") as f:
+        json.dump(results, f, indent=4, ensure_ascii=False)
+
+
+def load_results(file_path: str) -> Dict[str, Any]:
+    with open(file_path, "r", encoding="utf8") as f:
+        results = json.load(f)
+    if results.get("version") != RESULTS_VERSION:
+        raise ValueError(
+            f"'{file_path}' has results version {results.get('version')}, expected {RESULTS_VERSION}."
+        )
+    return results
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.2
+) -> List[Dict[str, Any]]:
+    """
+    Compares the median time per operation of the (case, size) pairs present
+    in both documents. A pair whose `ratio` (current / baseline) exceeds
+    1 + `threshold` is a "regression", below 1 - `threshold` an
+    "improvement", otherwise "ok".
+    """
+    baseline_by_key = {
+        (result["case"], result["size"]): result for result in baseline["results"]
+    }
+    rows = []
+    for result in current["results"]:
+        base = baseline_by_key.get((result["case"], result["size"]))
+        if base is None or not base["per_op_us"] or not result["per_op_us"]:
+            continue
+        ratio = result["per_op_us"] / base["per_op_us"]
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 - threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append(
+            {
+                "case": result["case"],
+                "size": result["size"],
+                "baseline_us": base["per_op_us"],
+                "current_us": result["per_op_us"],
+                "ratio": ratio,
+                "status": status,
+            }
+        )
+    return rows
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    lines = [
+        f"{'case':<28} {'size':>9} {'baseline us/op':>15} {'current us/op':>15} {'ratio':>7}  status"
+    ]
+    for row in rows:
+        lines.append(
+            f"{row['case']:<28} {row['size']:>9} {row['baseline_us']:15.1f} "
+            f"{row['current_us']:15.1f} {row['ratio']:7.2f}  {row['status']}"
+        )
+    return "\n".join(lines)
@@ -1,8 +1,19 @@
 # src/controllers/base_controller.py
-from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 
+import os
 import json
-from typing import Union, Optional, Dict, Type, List, TypeAlias, Any
+from typing import (
+    Union,
+    Optional,
+    Callable,
+    Dict,
+    Iterator,
+    Type,
+    List,
+    TypeAlias,
+    Any,
+)
 from dataclasses import fields, asdict
 from src.my_types import (
     UserType,
@@ -11,6 +22,8 @@ from src.my_types import (
     SettingUserDataDirType,
     RealEstateTemplateType,
 )
+from src.utils.json_stream import JsonArrayWriter, is_json_lines, iter_json_items
+from src.services.db_job_runner import DbJobRunner, JobCancelled, JobContext
 
 DataType: TypeAlias = Union[
     UserType,
@@ -30,10 +43,80 @@ class BaseController(QObject):
     info_signal = pyqtSignal(str)
     data_changed_signal = pyqtSignal()
     task_progress_signal = pyqtSignal(str, list)
+    # (task name, detail, succeeded) of a task run with run_in_background().
+    background_task_finished_signal = pyqtSignal(str, str, bool)
 
     def __init__(self, service: Optional[Any], parent=None):
         super().__init__(parent)
         self.service = service
+        self._job_runner: Optional[DbJobRunner] = None
+        # job id -> (task name, detail)
+        self._background_tasks: Dict[int, tuple] = {}
+
+    # ========================================================================
+    # Background tasks
+    # ========================================================================
+    def set_job_runner(self, job_runner: DbJobRunner):
+        self._job_runner = job_runner
+        job_runner.job_finished.connect(self._on_background_task_finished)
+        job_runner.job_failed.connect(self._on_background_task_failed)
+        job_runner.job_cancelled.connect(self._on_background_task_cancelled)
+
+    def run_in_background(
+        self, task_name: str, detail: str, fn: Callable[..., Any], *args, **kwargs
+    ) -> Optional[int]:
+        """
+        Runs `fn(*args, context=<JobContext>, **kwargs)` on the DB thread and
+        emits background_task_finished_signal(task_name, detail, succeeded)
+        when it is done. Without a job runner, `fn` runs on the calling thread.
+        Returns the job id (None when run synchronously).
+        """
+        if self._job_runner is None:
+            succeeded = bool(fn(*args, **kwargs))
+            self.background_task_finished_signal.emit(task_name, detail, succeeded)
+            return None
+        job_id = self._job_runner.submit(
+            lambda context: fn(*args, context=context, **kwargs)
+        )
+        self._background_tasks[job_id] = (task_name, detail)
+        self.info_signal.emit(f"{task_name.capitalize()} started ...")
+        return job_id
+
+    def cancel_background_tasks(self):
+        if self._job_runner is None:
+            return
+        for job_id in list(self._background_tasks):
+            self._job_runner.cancel(job_id)
+
+    def export_to_file_async(self, file_path: str) -> Optional[int]:
+        return self.run_in_background(
+            "export", file_path, self.export_to_file, file_path
+        )
+
+    def import_products_async(self, file_path: str) -> Optional[int]:
+        return self.run_in_background(
+            "import", file_path, self.import_products, file_path
+        )
+
+    @pyqtSlot(int, object)
+    def _on_background_task_finished(self, job_id: int, result: Any):
+        task = self._background_tasks.pop(job_id, None)
+        if task is not None:
+            self.background_task_finished_signal.emit(*task, bool(result))
+
+    @pyqtSlot(int, str)
+    def _on_background_task_failed(self, job_id: int, error_msg: str):
+        task = self._background_tasks.pop(job_id, None)
+        if task is not None:
+            self.error_signal.emit(f"{task[0].capitalize()} failed: {error_msg}")
+            self.background_task_finished_signal.emit(*task, False)
+
+    @pyqtSlot(int)
+    def _on_background_task_cancelled(self, job_id: int):
+        task = self._background_tasks.pop(job_id, None)
+        if task is not None:
+            self.warning_signal.emit(f"{task[0].capitalize()} cancelled.")
+            self.background_task_finished_signal.emit(*task, False)
 
     def read_json_file(self, file_path: str) -> Optional[List[Dict[str, Any]]]:
         """
@@ -143,63 +226,137 @@ class BaseController(QObject):
                 return None
         return parsed_instances
 
-    def export_to_file(self, file_path: str):
-        data_list: DataTypeList = self.service.read_all()
-        if not data_list:
-            print("Warning: Data list is empty. Nothing to export.")
-            try:
-                with open(file_path, mode="w", encoding="utf8") as f:
-                    json.dump([], f, indent=4)  # Write an empty array
-                return True
-            except IOError as e:
-                print(f"Error: Could not write JSON file '{file_path}'. Details: {e}")
-                return False
-
-        export_data = []
-        for item in data_list:
-            try:
-                # asdict() converts a dataclass instance to a dictionary
-                export_data.append(asdict(item))
-            except TypeError as e:
-                print(
-                    f"Error: Could not convert instance of {type(item).__name__} to dictionary: {e}"
-                )
-                return False
-            except Exception as e:
-                print(f"Unexpected error converting instance to dict: {e}")
-                return False
-
+    def export_to_file(
+        self,
+        file_path: str,
+        batch_size: int = 500,
+        context: Optional[JobContext] = None,
+    ):
+        """
+        Streams every record of the service to `file_path`, batch by batch, as a
+        JSON array (or JSON Lines for .jsonl/.ndjson files).
+        Progress is reported through task_progress_signal. When run as a
+        background job, a cancelled export stops between batches and removes
+        the partial file.
+        """
+        total = self.service.count()
+        written = 0
         try:
-            with open(file_path, mode="w", encoding="utf8") as f:
-                json.dump(export_data, f, indent=4, ensure_ascii=False)
-            self.success_signal.emit("Successfully export real estate products.")
-            self.data_changed_signal.emit()
+            with open(file_path, mode="w", encoding="utf8") as f, JsonArrayWriter(
+                f, json_lines=is_json_lines(file_path)
+            ) as writer:
+                for batch in self.service.iter_all(batch_size):
+                    if context is not None:
+                        context.check_cancelled()
+                    for item in batch:
+                        # asdict() converts a dataclass instance to a dictionary
+                        writer.write(asdict(item))
+                    written += len(batch)
+                    self.task_progress_signal.emit(
+                        f"Exporting {written}/{total} records ...", [written, total]
+                    )
+            if not written:
+                print("Warning: Data list is empty. Nothing to export.")
+            self.success_signal.emit(f"Successfully exported {written} records.")
             return True
+        except JobCancelled:
+            os.remove(file_path)
+            raise
         except IOError as e:
-            self.error_signal(
+            self.error_signal.emit(
                 f"Error: Could not write JSON file '{file_path}'. Details: {e}"
             )
             return False
         except Exception as e:
-            self.error_signal(
+            self.error_signal.emit(
                 f"An unexpected error occurred while exporting JSON file '{file_path}': {e}"
             )
             return False
 
-    def import_products(self, file_path: str, data_type: DataType):
+    def import_products(
+        self,
+        file_path: str,
+        data_type: DataType,
+        batch_size: int = 1000,
+        context: Optional[JobContext] = None,
+    ):
+        """
+        Streams a JSON array (or JSON Lines) file and imports it in batches of
+        `batch_size` records, so the file is never loaded as a whole.
+        All batches are inserted inside one transaction (one execBatch per
+        batch): a failing or cancelled import rolls back every record.
+        Progress (bytes read / file size) is reported through task_progress_signal.
+        """
         try:
-            raw_products = self.read_json_file(file_path)
-            if raw_products:
-                products = self.parse_JSON_to_data_type(raw_products, data_type)
-                self.service.import_data(products)
-                self.success_signal.emit("Successfully imported real estate products.")
-                self.data_changed_signal.emit()
-                return True
-            else:
-                return False
+            file_size = os.path.getsize(file_path)
+        except OSError:
+            self.error_signal.emit(f"Error: File not found at '{file_path}'.")
+            return False
+
+        queued = 0
+
+        def parse(batch: List[Dict[str, Any]]) -> DataTypeList:
+            products = self.parse_JSON_to_data_type(batch, data_type)
+            if products is None:
+                raise ValueError(f"Could not convert records to {data_type.__name__}.")
+            return products
+
+        def batches() -> Iterator[DataTypeList]:
+            nonlocal queued
+            batch: List[Dict[str, Any]] = []
+            for item, bytes_read in iter_json_items(file_path):
+                if not isinstance(item, dict):
+                    raise TypeError(
+                        f"JSON file '{file_path}' contains non-dictionary items in the list."
+                    )
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    if context is not None:
+                        context.check_cancelled()
+                    yield parse(batch)
+                    queued += len(batch)
+                    batch = []
+                    self.task_progress_signal.emit(
+                        f"Importing {queued} records ...", [bytes_read, file_size]
+                    )
+            if batch:
+                if context is not None:
+                    context.check_cancelled()
+                yield parse(batch)
+                queued += len(batch)
+
+        try:
+            imported = self.service.import_batches(batches())
+        except JobCancelled:
+            self.warning_signal.emit(
+                f"Import cancelled; the {queued} records read so far were rolled back."
+            )
+            raise
+        except json.JSONDecodeError as e:
+            msg = f"Error: Invalid JSON syntax in '{file_path}'. Details: {e}"
+            self.error_signal.emit(f"{msg} Nothing was imported.")
+            return False
+        except (TypeError, ValueError) as e:
+            self.error_signal.emit(f"Error: {e} Nothing was imported.")
+            return False
         except Exception as e:
             print(f"[{self.__class__.__name__}.import_products] Error: {e}")
             self.error_signal.emit(
-                "Error occurred while importing real estate products."
+                f"Failed to import records; the {queued} records read so far were rolled back."
             )
             return False
+
+        if not imported:
+            return False
+        self.task_progress_signal.emit(
+            f"Imported {imported} records.", [file_size, file_size]
+        )
+        stats = getattr(self.service, "last_import_stats", None)
+        if stats:
+            self.success_signal.emit(
+                f"Successfully imported {imported} records ({stats['rows_per_sec']:.0f} rows/s)."
+            )
+        else:
+            self.success_signal.emit(f"Successfully imported {imported} records.")
+        self.data_changed_signal.emit()
+        return True
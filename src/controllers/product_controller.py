@@ -1,5 +1,7 @@
 # src/controllers/product_controller.py
-from typing import Optional, List
+import os
+import shutil
+from typing import Optional, List, Set
 
 from src.controllers.base_controller import BaseController
 from src.services.product_service import (
@@ -7,13 +9,20 @@ from src.services.product_service import (
     RealEstateTemplateService,
     MiscProductService,
 )
-from src.my_types import RealEstateProductType, RealEstateTemplateType, MiscProductType
+from src.services.image_ingest import ImageIngestor
+from src.my_types import (
+    IngestedImageType,
+    RealEstateProductType,
+    RealEstateTemplateType,
+    MiscProductType,
+)
 
 
 class RealEstateProductController(BaseController):
     def __init__(self, service: RealEstateProductService, parent=None):
         super().__init__(service, parent)
         self.service = service
+        self._ingestors: Set[ImageIngestor] = set()
 
     def create_product(
         self,
@@ -21,21 +30,83 @@ class RealEstateProductController(BaseController):
         image_paths: List[str],
         product_data: RealEstateProductType,
     ):
+        """Normalizes the images on the ingestion process pool, then creates
+        the product. Per-image timings and savings are reported through
+        info_signal / task_progress_signal as the images complete."""
         try:
             if not isinstance(product_data, RealEstateProductType):
                 raise TypeError(
                     f"Expected RealEstateProductType, got {type(product_data)}"
                 )
-            if not self.service.create(image_dir_container, image_paths, product_data):
+            staging_dir = self.service.get_image_store(
+                image_dir_container
+            ).new_staging_dir()
+            ingestor = ImageIngestor(parent=self)
+            self._ingestors.add(ingestor)
+            ingestor.image_ingested.connect(
+                lambda idx, image: self._on_image_ingested(ingestor, image)
+            )
+            ingestor.finished_signal.connect(
+                lambda images: self._on_images_ingested(
+                    ingestor, image_dir_container, staging_dir, images, product_data
+                )
+            )
+            self.info_signal.emit(f"Processing {len(image_paths)} image(s) ...")
+            ingestor.start(image_paths, staging_dir)
+            return True
+        except Exception as e:
+            print(f"[{self.__class__.__name__}.create_product] Error: {e}")
+            self.error_signal.emit("Error occurred while creating real estate product.")
+            return False
+
+    def _on_image_ingested(self, ingestor: ImageIngestor, image: IngestedImageType):
+        name = os.path.basename(image.source_path)
+        if image.path is None:
+            self.warning_signal.emit(f"Skipped image '{name}': {image.error}")
+        else:
+            saved = image.original_size - image.size
+            self.info_signal.emit(
+                f"Image '{name}': {image.original_size / 1024:.0f} KB -> "
+                f"{image.size / 1024:.0f} KB ({saved / 1024:+.0f} KB saved) "
+                f"in {image.seconds * 1000:.0f} ms"
+            )
+        self.task_progress_signal.emit(
+            "Processing images ...", [ingestor.completed, len(ingestor.results)]
+        )
+
+    def _on_images_ingested(
+        self,
+        ingestor: ImageIngestor,
+        image_dir_container: str,
+        staging_dir: str,
+        images: List[IngestedImageType],
+        product_data: RealEstateProductType,
+    ):
+        self._ingestors.discard(ingestor)
+        ingestor.deleteLater()
+        try:
+            original_size = sum(image.original_size for image in images if image.path)
+            size = sum(image.size for image in images if image.path)
+            if images:
+                print(
+                    f"INFO: [{self.__class__.__name__}.create_product] {len(images)} image(s) processed: {original_size / 1024:.0f} KB -> {size / 1024:.0f} KB."
+                )
+            if not self.service.create_from_ingested(
+                image_dir_container, images, product_data
+            ):
                 self.error_signal.emit("Failed to create real estate product.")
                 return False
-            self.success_signal.emit("Successfully created real estate product.")
+            self.success_signal.emit(
+                f"Successfully created real estate product ({(original_size - size) / 1024:.0f} KB saved on images)."
+            )
             self.data_changed_signal.emit()
             return True
         except Exception as e:
             print(f"[{self.__class__.__name__}.create_product] Error: {e}")
             self.error_signal.emit("Error occurred while creating real estate product.")
             return False
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
 
     def read_product(self, record_id: int) -> Optional[RealEstateProductType]:
         try:
@@ -128,6 +199,36 @@ class RealEstateProductController(BaseController):
             self.error_signal.emit("Error occurred while toggling product status.")
             return False
 
+    def bulk_toggle_status(self, product_ids: List[int]) -> bool:
+        try:
+            result = self.service.bulk_toggle_status(product_ids)
+            if result:
+                self.success_signal.emit(
+                    f"Toggled status for {len(product_ids)} product(s)."
+                )
+                self.data_changed_signal.emit()
+            else:
+                self.warning_signal.emit("Failed to toggle status of the products.")
+            return result
+        except Exception as e:
+            print(f"[{self.__class__.__name__}.bulk_toggle_status] Error: {e}")
+            self.error_signal.emit("Error occurred while toggling product status.")
+            return False
+
+    def bulk_update_products(self, product_ids: List[int], **values) -> bool:
+        try:
+            result = self.service.bulk_update(product_ids, **values)
+            if result:
+                self.success_signal.emit(f"Updated {len(product_ids)} product(s).")
+                self.data_changed_signal.emit()
+            else:
+                self.warning_signal.emit("Failed to update the products.")
+            return result
+        except Exception as e:
+            print(f"[{self.__class__.__name__}.bulk_update_products] Error: {e}")
+            self.error_signal.emit("Error occurred while updating products.")
+            return False
+
     def initialize_new_pid(self, transaction_type: str) -> str:
         try:
             self.success_signal.emit(
@@ -195,8 +296,25 @@ class RealEstateProductController(BaseController):
             # Returning an empty list for a single product type might be misleading.
             return None
 
-    def import_products(self, file_path):
-        return super().import_products(file_path, RealEstateProductType)
+    def search(self, text: str, limit: int = 100) -> List[RealEstateProductType]:
+        try:
+            return self.service.search(text, limit)
+        except Exception as e:
+            print(f"[{self.__class__.__name__}.search] Error: {e}")
+            self.error_signal.emit(f"Error searching products for '{text}'.")
+            return []
+
+    def search_condition(self, text: str) -> str:
+        try:
+            return self.service.search_condition(text)
+        except Exception as e:
+            print(f"[{self.__class__.__name__}.search_condition] Error: {e}")
+            return ""
+
+    def import_products(self, file_path, context=None):
+        return super().import_products(
+            file_path, RealEstateProductType, context=context
+        )
 
 
 class RealEstateTemplateController(BaseController):
@@ -376,8 +494,10 @@ class RealEstateTemplateController(BaseController):
             )
             return False
 
-    def import_products(self, file_path):
-        return super().import_products(file_path, RealEstateTemplateType)
+    def import_products(self, file_path, context=None):
+        return super().import_products(
+            file_path, RealEstateTemplateType, context=context
+        )
 
 
 class MiscProductController(BaseController):
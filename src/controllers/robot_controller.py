@@ -1,31 +1,22 @@
 # src/controllers/robot_controller.py
-import os
-import uuid
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from PyQt6.QtCore import pyqtSlot, pyqtSignal
 from src.robot.browser_manager import BrowserManager
 from src.controllers.base_controller import BaseController
-from src.services.user_service import UserService
+from src.services.user_service import UserService, UserListedProductService
 from src.services.setting_service import SettingProxyService, SettingUserDataDirService
 from src.services.product_service import (
     MiscProductService,
     RealEstateProductService,
     RealEstateTemplateService,
 )
-from src.my_types import (
-    UserType,
-    BrowserType,
-    RealEstateProductType,
-    MiscProductType,
-    SellPayloadType,
-)
-from src.my_constants import RE_TRANSACTION
-
-from src.utils.re_template import replace_template, init_footer_content
+from src.services.listing_payload_builder import ListingPayloadBuilder
+from src.my_types import UserType, BrowserType, UserListingSummaryType
 
 
 class RobotController(BaseController):
     finished_signal = pyqtSignal()
+    actions_ready_signal = pyqtSignal(dict)
 
     def __init__(
         self,
@@ -35,6 +26,7 @@ class RobotController(BaseController):
         re_template_service: RealEstateTemplateService,
         setting_proxy_service: SettingProxyService,
         setting_udd_service: SettingUserDataDirService,
+        listed_product_service: Optional[UserListedProductService] = None,
         parent=None,
     ):
         super().__init__(service=user_service, parent=parent)
@@ -44,100 +36,66 @@ class RobotController(BaseController):
         self._re_template_service = re_template_service
         self._setting_proxy_service = setting_proxy_service
         self._setting_udd_service = setting_udd_service
+        self._listed_product_service = listed_product_service
         self._current_browser_progress: Optional[BrowserManager] = None
+        self._payload_builders: Set[ListingPayloadBuilder] = set()
 
-    def init_actions(
-        self, list_user_data: List[UserType], action_payloads: List
-    ) -> Dict[str, BrowserType]:
-        browser_actions = {}
-        # re_products = self._re_product_service.read_all()
-        # misc_products = self._misc_product_service.read_all()
-        # products = re_products + misc_products
+    def init_actions_async(self, list_user_data: List[UserType], action_payloads: List):
+        """Builds the browser actions: planned on the DB thread, templates
+        rendered on a thread pool. Emits actions_ready_signal with
+        {uid: [BrowserType, ...]} when done ({} if planning failed)."""
+        try:
+            builder = self._new_payload_builder()
+        except Exception as e:
+            self.error_signal.emit(f"Failed to prepare actions: {e}")
+            return
+        self._payload_builders.add(builder)
+        total = len(list_user_data) * len(action_payloads)
+        builder.progress_signal.connect(
+            lambda current, _total: self.task_progress_signal.emit(
+                "Preparing listings ...", [current, _total]
+            )
+        )
+        builder.error_signal.connect(
+            lambda msg: self.error_signal.emit(f"Failed to prepare actions: {msg}")
+        )
+        builder.finished_signal.connect(
+            lambda browser_actions: self._on_payloads_built(builder, browser_actions)
+        )
+        self.info_signal.emit(f"Preparing {total} actions ...")
+        builder.start(list_user_data, action_payloads, self._job_runner)
 
-        for user_data in list_user_data:
-            user_type = user_data.type.strip().lower()
-            browser_actions[user_data.uid] = []
-            for action in action_payloads:
-                if "pid" in action.keys():
-                    pid = action["pid"]
-                    action_payload: Optional[SellPayloadType] = None
-                    product = None
-                    if pid:
-                        product_type = pid.split(".")[0]
-                        if "re" in product_type.lower():
-                            product = self._re_product_service.read_by_pid(pid)
-                        elif "misc" in product_type.lower():
-                            # TODO get random misc.
-                            raise RuntimeError("Invalid logic for misc")
-                    if not product:
-                        if "re.s" in user_type.lower():
-                            product = self._re_product_service.get_random(
-                                RE_TRANSACTION["sell"]
-                            )
-                        elif "re.r" in user_type.lower():
-                            product = self._re_product_service.get_random(
-                                RE_TRANSACTION["rent"]
-                            )
-                        elif "misc." in user_type.lower():
-                            # TODO get random misc.
-                            raise RuntimeError("Invalid logic for misc")
-                    if type(product) == RealEstateProductType:
-                        temp_title = self._re_template_service.get_random(
-                            part="title",
-                            transaction_type=product.transaction_type,
-                            category=product.category,
-                        )
-                        temp_desc = self._re_template_service.get_random(
-                            part="description",
-                            transaction_type=product.transaction_type,
-                            category=product.category,
-                        )
-                        title = replace_template(
-                            product_data=product, template=temp_title
-                        ).upper()
-                        desc = replace_template(
-                            product_data=product, template=temp_desc
-                        )
-                        desc = (
-                            title
-                            + "\n\n"
-                            + desc
-                            + "\n\n"
-                            + init_footer_content(product)
-                        )
-                        image_paths = self._re_product_service.get_images_by_path(
-                            product.image_dir
-                        )
-                        title = title[:90]
-                        action_payload = SellPayloadType(
-                            title=title, description=desc, image_paths=image_paths[:9]
-                        )
+    def read_listing_summaries(
+        self, user_ids: List[int]
+    ) -> Dict[int, UserListingSummaryType]:
+        """{user id: listed / stale counts}, read with one join query."""
+        if self._listed_product_service is None or not user_ids:
+            return {}
+        try:
+            summaries = self._listed_product_service.read_user_summaries(
+                user_ids=user_ids
+            )
+        except Exception as e:
+            print(f"[{self.__class__.__name__}.read_listing_summaries] Error: {e}")
+            return {}
+        return {summary.id_user: summary for summary in summaries}
 
-                    elif type(product) == MiscProductType:
-                        # TODO template misc
-                        continue
-                elif "content" in action.keys():
-                    action_payload = SellPayloadType(
-                        title=action["content"].get("title", ""),
-                        description=action["content"].get("description", ""),
-                        image_paths=action["content"].get("image_paths", []),
-                    )
+    def _new_payload_builder(self) -> ListingPayloadBuilder:
+        return ListingPayloadBuilder(
+            re_product_service=self._re_product_service,
+            re_template_service=self._re_template_service,
+            udd_container=self._setting_udd_service.get_selected(),
+            parent=self,
+        )
 
-                browser_actions[user_data.uid].append(
-                    BrowserType(
-                        user_info=user_data,
-                        action_name=action.get("action_name", None),
-                        action_payload=action_payload,
-                        is_mobile=False,
-                        headless=False,
-                        udd=os.path.join(
-                            self._setting_udd_service.get_selected(),
-                            str(user_data.id),
-                        ),
-                        browser_id=str(uuid.uuid4()),
-                    )
-                )
-        return browser_actions
+    def _on_payloads_built(
+        self,
+        builder: ListingPayloadBuilder,
+        browser_actions: Dict[str, List[BrowserType]],
+    ):
+        self._payload_builders.discard(builder)
+        builder.deleteLater()
+        self.actions_ready_signal.emit(browser_actions)
 
     def init_browser_tasks(
         self, browser_actions: Dict[str, BrowserType]
@@ -91,8 +91,8 @@ class SettingProxyController(BaseController):
             )
             return False
 
-    def import_products(self, file_path):
-        return super().import_products(file_path, SettingProxyType)
+    def import_products(self, file_path, context=None):
+        return super().import_products(file_path, SettingProxyType, context=context)
 
 
 class SettingUserDataDirController(BaseController):
@@ -250,5 +250,7 @@ class SettingUserDataDirController(BaseController):
             )
             return False
 
-    def import_products(self, file_path):
-        return super().import_products(file_path, SettingUserDataDirType)
+    def import_products(self, file_path, context=None):
+        return super().import_products(
+            file_path, SettingUserDataDirType, context=context
+        )
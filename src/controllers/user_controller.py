@@ -223,8 +223,8 @@ class UserController(BaseController):
             self._current_browser_progress.finished.connect(self.on_finished)
             self._current_browser_progress.add_browsers(browsers, raw_proxies)
 
-    def import_products(self, file_path):
-        return super().import_products(file_path, UserType)
+    def import_products(self, file_path, context=None):
+        return super().import_products(file_path, UserType, context=context)
 
     @pyqtSlot(int, str, bool)
     def _on_check_live_task_succeeded(self, record_id: int, uid: str, is_live: bool):
@@ -261,6 +261,7 @@ class UserController(BaseController):
 class UserListedProductController(BaseController):
     def __init__(self, service: UserListedProductService, parent=None):
         super().__init__(service, parent)
+        self._user_service = service
 
     def create_listed_product(self, product_data: UserListedProductType):
         try:
@@ -374,3 +375,39 @@ class UserListedProductController(BaseController):
                 "Error occurred while shifting listed product by user id."
             )
             return None
+
+    def read_listings(
+        self, user_ids: Optional[list] = None, max_age_days: Optional[int] = None
+    ) -> list:
+        try:
+            return self._user_service.read_listings(
+                user_ids=user_ids, max_age_days=max_age_days
+            )
+        except Exception as e:
+            print(f"[{self.__class__.__name__}.read_listings] Error: {e}")
+            self.error_signal.emit("Error occurred while reading listed products.")
+            return []
+
+    def read_stale_listings(
+        self, user_ids: Optional[list] = None, max_age_days: Optional[int] = None
+    ) -> list:
+        try:
+            return self._user_service.read_stale_listings(
+                user_ids=user_ids, max_age_days=max_age_days
+            )
+        except Exception as e:
+            print(f"[{self.__class__.__name__}.read_stale_listings] Error: {e}")
+            self.error_signal.emit("Error occurred while reading stale listings.")
+            return []
+
+    def read_user_summaries(
+        self, user_ids: Optional[list] = None, max_age_days: Optional[int] = None
+    ) -> list:
+        try:
+            return self._user_service.read_user_summaries(
+                user_ids=user_ids, max_age_days=max_age_days
+            )
+        except Exception as e:
+            print(f"[{self.__class__.__name__}.read_user_summaries] Error: {e}")
+            self.error_signal.emit("Error occurred while reading listing summaries.")
+            return []
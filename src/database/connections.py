@@ -0,0 +1,144 @@
+# src/database/connections.py
+import threading
+from typing import Dict, List
+
+from PyQt6.QtCore import Qt, QThread
+from PyQt6.QtSql import QSqlDatabase, QSqlDriver, QSqlQuery
+
+# Applied to every connection: the named ones opened by initialize_*_database
+# and the per-thread clones. WAL lets the clones read while another
+# connection writes; synchronous=NORMAL is durable enough in WAL mode.
+CONNECTION_PRAGMAS: List[str] = [
+    "PRAGMA foreign_keys = ON;",
+    "PRAGMA journal_mode = WAL;",
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA cache_size = -16000;",  # KiB, i.e. 16 MiB of page cache
+    "PRAGMA mmap_size = 268435456;",  # 256 MiB
+    "PRAGMA busy_timeout = 5000;",  # ms to wait for a writer instead of failing
+]
+
+# thread ident -> {connection name: clone}. Not a threading.local: Qt threads
+# re-enter Python with a fresh thread state per slot call, which resets it.
+_thread_connections: Dict[int, Dict[str, QSqlDatabase]] = {}
+_lock = threading.Lock()
+
+
+def apply_pragmas(db: QSqlDatabase) -> bool:
+    query = QSqlQuery(db)
+    for pragma in CONNECTION_PRAGMAS:
+        if not query.exec(pragma):
+            print(
+                f"[apply_pragmas] '{pragma}' failed on '{db.connectionName()}': {query.lastError().text()}"
+            )
+            return False
+    return True
+
+
+def database(connection_name: str) -> QSqlDatabase:
+    """
+    Returns the connection to use for `connection_name` on the calling
+    thread. The main thread gets the named connection itself; any other
+    thread gets its own clone (QSqlDatabase connections may only be used by
+    the thread that opened them), opened on first use and released when the
+    thread finishes. A clone outlives the job that used it: code handing a
+    thread from one task to the next (DbJobRunner after every job) calls
+    reset_thread_connections(), so no transaction is left open for the next.
+    """
+    ident = threading.get_ident()
+    if ident == threading.main_thread().ident:
+        return QSqlDatabase.database(connection_name, False)
+    clone = _thread_connections.get(ident, {}).get(connection_name)
+    if clone is not None:
+        return clone
+    return _open_thread_connection(connection_name, ident)
+
+
+def _open_thread_connection(connection_name: str, ident: int) -> QSqlDatabase:
+    clone = QSqlDatabase.cloneDatabase(connection_name, f"{connection_name}@{ident}")
+    if not clone.open():
+        print(
+            f"[connections.database] Failed to open a clone of '{connection_name}': {clone.lastError().text()}"
+        )
+        return clone
+    apply_pragmas(clone)
+    with _lock:
+        first_connection = ident not in _thread_connections
+        _thread_connections.setdefault(ident, {})[connection_name] = clone
+    if first_connection:
+        # finished is emitted on the finishing thread itself, before it exits.
+        QThread.currentThread().finished.connect(
+            release_thread_connections, Qt.ConnectionType.DirectConnection
+        )
+    return clone
+
+
+def discard_open_transaction(db: QSqlDatabase) -> bool:
+    """
+    Rolls back a transaction left open on `db` (by a job that failed half
+    way). Returns False when `db` could not be rolled back and must not be
+    used again. QSqlDatabase cannot tell whether a transaction is open, so a
+    BEGIN is issued as the probe: it only fails inside a transaction.
+    """
+    if not db.isOpen() or not db.driver().hasFeature(
+        QSqlDriver.DriverFeature.Transactions
+    ):
+        return True
+    if db.transaction():
+        return db.commit()
+    print(
+        f"WARNING: [connections.discard_open_transaction] '{db.connectionName()}' was left inside a transaction; rolling it back."
+    )
+    if db.rollback():
+        return True
+    print(
+        f"[connections.discard_open_transaction] Rollback failed on '{db.connectionName()}': {db.lastError().text()}"
+    )
+    return False
+
+
+def reset_thread_connections():
+    """Rolls back the transactions left open on the calling thread's clones;
+    a clone that cannot be rolled back is closed and reopened on next use."""
+    ident = threading.get_ident()
+    with _lock:
+        connections = dict(_thread_connections.get(ident, {}))
+    for connection_name, clone in connections.items():
+        if not discard_open_transaction(clone):
+            _drop_thread_connection(connection_name, ident)
+
+
+def _drop_thread_connection(connection_name: str, ident: int):
+    with _lock:
+        clone = _thread_connections.get(ident, {}).pop(connection_name, None)
+    if clone is None:
+        return
+    clone_name = clone.connectionName()
+    clone.close()
+    # removeDatabase() needs every QSqlDatabase handle to be gone.
+    clone = None
+    QSqlDatabase.removeDatabase(clone_name)
+
+
+def release_thread_connections():
+    """Closes and removes the clones of the calling thread. Runs on its own
+    when a QThread (or thread pool thread) finishes; plain Python threads
+    should call it before they exit."""
+    with _lock:
+        connections = _thread_connections.pop(threading.get_ident(), None)
+    if not connections:
+        return
+    clone_names = []
+    for clone in connections.values():
+        clone_names.append(clone.connectionName())
+        clone.close()
+    # removeDatabase() needs every QSqlDatabase handle to be gone.
+    clone = None
+    connections = None
+    for clone_name in clone_names:
+        QSqlDatabase.removeDatabase(clone_name)
+
+
+def thread_connection_count() -> int:
+    """Number of threads currently holding clones (diagnostics)."""
+    with _lock:
+        return len(_thread_connections)
@@ -0,0 +1,64 @@
+# src/database/migrations.py
+from typing import List, Tuple
+
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+from src.my_constants import TABLE_SCHEMA_VERSION
+from src.database.sql_commands import CREATE_SCHEMA_VERSION_TABLE
+
+Migration = Tuple[int, str, List[str]]
+
+
+def get_schema_version(db: QSqlDatabase) -> int:
+    """Returns the highest applied migration version, 0 for a fresh schema."""
+    query = QSqlQuery(db)
+    if not query.exec(f"SELECT COALESCE(MAX(version), 0) FROM {TABLE_SCHEMA_VERSION}"):
+        return 0
+    if query.next():
+        return int(query.value(0))
+    return 0
+
+
+def run_migrations(db: QSqlDatabase, migrations: List[Migration]) -> int:
+    """
+    Applies the migrations newer than the recorded schema_version, in version
+    order. Each migration runs in its own transaction together with its
+    schema_version row, so a failure leaves the database at the last applied
+    version. Returns the resulting version; raises on failure.
+    """
+    query = QSqlQuery(db)
+    if not query.exec(CREATE_SCHEMA_VERSION_TABLE):
+        raise Exception(
+            f"[run_migrations] Cannot create {TABLE_SCHEMA_VERSION} table: {query.lastError().text()}"
+        )
+    current_version = get_schema_version(db)
+    for version, description, statements in sorted(migrations, key=lambda m: m[0]):
+        if version <= current_version:
+            continue
+        if not db.transaction():
+            raise Exception(
+                f"[run_migrations] Cannot start transaction: {db.lastError().text()}"
+            )
+        for sql in statements:
+            if not query.exec(sql):
+                error_text = query.lastError().text()
+                db.rollback()
+                raise Exception(
+                    f"[run_migrations] Migration {version} ({description}) failed on '{db.databaseName()}': {error_text}"
+                )
+        query.prepare(
+            f"INSERT INTO {TABLE_SCHEMA_VERSION} (version, description) VALUES (?, ?)"
+        )
+        query.addBindValue(version)
+        query.addBindValue(description)
+        if not query.exec() or not db.commit():
+            error_text = query.lastError().text() or db.lastError().text()
+            db.rollback()
+            raise Exception(
+                f"[run_migrations] Cannot record migration {version} on '{db.databaseName()}': {error_text}"
+            )
+        print(
+            f"INFO: [run_migrations] '{db.databaseName()}' migrated to version {version}: {description}"
+        )
+        current_version = version
+    return current_version
@@ -5,27 +5,31 @@ from src.my_constants import (
     CONNECTION_DB_PRODUCT,
     PATH_DB_PRODUCT,
 )
+from src.database.connections import apply_pragmas
+from src.database.migrations import run_migrations
 from src.database.sql_commands import (
     CREATE_REAL_ESTATE_PRODUCT_TABLE,
     CREATE_MISC_PRODUCT_TABLE,
     CREATE_REAL_ESTATE_TEMPLATE_TABLE,
+    PRODUCT_MIGRATIONS,
 )
 
 
-def initialize_product_database():
+def initialize_product_database(path: str = PATH_DB_PRODUCT):
     if QSqlDatabase.contains(CONNECTION_DB_PRODUCT):
         db = QSqlDatabase.database(CONNECTION_DB_PRODUCT)
     else:
         db = QSqlDatabase.addDatabase("QSQLITE", CONNECTION_DB_PRODUCT)
 
-    db.setDatabaseName(PATH_DB_PRODUCT)
+    if db.isOpen() and db.databaseName() != path:
+        db.close()  # Re-pointed at another file (e.g. the benchmarks).
+    db.setDatabaseName(path)
     if not db.open():
         raise Exception(
             f"An error occurred while opening the database: {db.lastError().text()}"
         )
+    apply_pragmas(db)
     query = QSqlQuery(db)
-    query.exec("PRAGMA foreign_keys = ON;")
-    query.exec("PRAGMA journal_mode = WAL;")
 
     try:
         if db.transaction():
@@ -44,6 +48,7 @@ def initialize_product_database():
                 raise Exception(
                     f"[initialize_product_database] Cannot commit transaction: {db.lastError().text()}"
                 )
+            run_migrations(db, PRODUCT_MIGRATIONS)
             return True
         else:
             return False
@@ -5,26 +5,30 @@ from src.my_constants import (
     CONNECTION_DB_SETTING,
     PATH_DB_SETTING,
 )
+from src.database.connections import apply_pragmas
+from src.database.migrations import run_migrations
 from src.database.sql_commands import (
     CREATE_SETTING_UDD_TABLE,
     CREATE_SETTING_PROXY_TABLE,
+    SETTING_MIGRATIONS,
 )
 
 
-def initialize_setting_database():
+def initialize_setting_database(path: str = PATH_DB_SETTING):
     if QSqlDatabase.contains(CONNECTION_DB_SETTING):
         db = QSqlDatabase.database(CONNECTION_DB_SETTING)
     else:
         db = QSqlDatabase.addDatabase("QSQLITE", CONNECTION_DB_SETTING)
 
-    db.setDatabaseName(PATH_DB_SETTING)
+    if db.isOpen() and db.databaseName() != path:
+        db.close()  # Re-pointed at another file (e.g. the benchmarks).
+    db.setDatabaseName(path)
     if not db.open():
         raise Exception(
             f"An error occurred while opening the database: {db.lastError().text()}"
         )
+    apply_pragmas(db)
     query = QSqlQuery(db)
-    query.exec("PRAGMA foreign_keys = ON;")
-    query.exec("PRAGMA journal_mode = WAL;")
 
     try:
         if db.transaction():
@@ -42,6 +46,7 @@ def initialize_setting_database():
                 raise Exception(
                     f"[initialize_setting_database] Cannot commit transaction: {db.lastError().text()}"
                 )
+            run_migrations(db, SETTING_MIGRATIONS)
             return True
         else:
             return False
@@ -108,6 +108,199 @@ CREATE TABLE IF NOT EXISTS {constants.TABLE_REAL_ESTATE_TEMPLATE} (
 )
 """
 
+CREATE_SCHEMA_VERSION_TABLE = f"""
+CREATE TABLE IF NOT EXISTS {constants.TABLE_SCHEMA_VERSION} (
+    version INTEGER PRIMARY KEY,
+    description TEXT,
+    applied_at TEXT DEFAULT (strftime('%Y-%m-%d %H:%M:%S', 'now'))
+)
+"""
+
+# Full-text index of the product address and description. unicode61 folds
+# case and diacritics ("lạt" -> "lat") but not "đ", which is no "d" plus a
+# mark in Unicode, so it is replaced before indexing (and in the queries, see
+# RealEstateProductService.fts_query).
+RE_PRODUCT_FTS_COLUMNS = (
+    "pid",
+    "street",
+    "ward",
+    "district",
+    "province",
+    "category",
+    "description",
+)
+
+
+def _fts_fold(expression: str) -> str:
+    return f"replace(replace(COALESCE({expression}, ''), 'đ', 'd'), 'Đ', 'D')"
+
+
+def _fts_insert(row: str) -> str:
+    return (
+        f"INSERT INTO {constants.TABLE_REAL_ESTATE_PRODUCT_FTS} "
+        f"(rowid, {', '.join(RE_PRODUCT_FTS_COLUMNS)}) "
+        f"VALUES ({row}.id, {', '.join(_fts_fold(f'{row}.{column}') for column in RE_PRODUCT_FTS_COLUMNS)});"
+    )
+
+
+_FTS_DELETE_OLD = (
+    f"DELETE FROM {constants.TABLE_REAL_ESTATE_PRODUCT_FTS} WHERE rowid = old.id;"
+)
+
+# Trigram indexes behind the substring filters of the product and user pages
+# (SqlFilterProxyModel). LIKE only folds ASCII case, a trigram MATCH folds the
+# case of every script ("đức" finds "ĐỨC"). They are external-content tables:
+# only the index is stored, the text stays in the table.
+RE_PRODUCT_FILTER_COLUMNS = (
+    "pid",
+    "street",
+    "area",
+    "price",
+    "structure",
+    "function",
+)
+USER_FILTER_COLUMNS = (
+    "uid",
+    "note",
+    "type",
+    "email",
+    "email_password",
+    "user_group",
+    "two_fa",
+    "username",
+    "password",
+    "phone_number",
+)
+# Columns the product page filters on with exact matches (combo boxes),
+# compared as lower(column) = value.
+RE_PRODUCT_EXACT_FILTER_COLUMNS = (
+    "category",
+    "ward",
+    "legal",
+    "furniture",
+    "building_line",
+    "transaction_type",
+)
+
+
+def _filter_index_statements(table: str, index_table: str, columns) -> list:
+    names = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    insert_new = (
+        f"INSERT INTO {index_table} (rowid, {names}) VALUES (new.id, {new_values});"
+    )
+    delete_old = (
+        f"INSERT INTO {index_table} ({index_table}, rowid, {names}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {index_table} USING fts5({names}, "
+        f"content = '{table}', content_rowid = 'id', tokenize = 'trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {index_table}_ai AFTER INSERT ON {table} "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {index_table}_ad AFTER DELETE ON {table} "
+        f"BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {index_table}_au "
+        f"AFTER UPDATE OF id, {names} ON {table} "
+        f"BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {index_table} ({index_table}) VALUES ('rebuild')",
+    ]
+
+
+# Schema migrations, one list per database: (version, description, statements).
+# Version 0 is the schema created by the CREATE_*_TABLE commands above. Never
+# edit a migration that has shipped; append a new version instead.
+PRODUCT_MIGRATIONS = [
+    (
+        1,
+        "indexes for product filters and random/default template lookups",
+        [
+            # Columns the product page filters on with exact matches.
+            *[
+                f"CREATE INDEX IF NOT EXISTS idx_{constants.TABLE_REAL_ESTATE_PRODUCT}_{column} "
+                f"ON {constants.TABLE_REAL_ESTATE_PRODUCT} ({column})"
+                for column in (
+                    "category",
+                    "ward",
+                    "legal",
+                    "furniture",
+                    "building_line",
+                )
+            ],
+            f"CREATE INDEX IF NOT EXISTS idx_{constants.TABLE_REAL_ESTATE_PRODUCT}_transaction_type_status "
+            f"ON {constants.TABLE_REAL_ESTATE_PRODUCT} (transaction_type, status)",
+            f"CREATE INDEX IF NOT EXISTS idx_{constants.TABLE_REAL_ESTATE_TEMPLATE}_lookup "
+            f"ON {constants.TABLE_REAL_ESTATE_TEMPLATE} (part, transaction_type, category, is_default)",
+        ],
+    ),
+    (
+        2,
+        "full-text search over product addresses and descriptions",
+        [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {constants.TABLE_REAL_ESTATE_PRODUCT_FTS} "
+            f"USING fts5({', '.join(RE_PRODUCT_FTS_COLUMNS)}, "
+            "tokenize = 'unicode61 remove_diacritics 2')",
+            f"CREATE TRIGGER IF NOT EXISTS {constants.TABLE_REAL_ESTATE_PRODUCT_FTS}_ai "
+            f"AFTER INSERT ON {constants.TABLE_REAL_ESTATE_PRODUCT} "
+            f"BEGIN {_fts_insert('new')} END",
+            f"CREATE TRIGGER IF NOT EXISTS {constants.TABLE_REAL_ESTATE_PRODUCT_FTS}_ad "
+            f"AFTER DELETE ON {constants.TABLE_REAL_ESTATE_PRODUCT} "
+            f"BEGIN {_FTS_DELETE_OLD} END",
+            f"CREATE TRIGGER IF NOT EXISTS {constants.TABLE_REAL_ESTATE_PRODUCT_FTS}_au "
+            f"AFTER UPDATE OF id, {', '.join(RE_PRODUCT_FTS_COLUMNS)} "
+            f"ON {constants.TABLE_REAL_ESTATE_PRODUCT} "
+            f"BEGIN {_FTS_DELETE_OLD} {_fts_insert('new')} END",
+            f"INSERT INTO {constants.TABLE_REAL_ESTATE_PRODUCT_FTS} "
+            f"(rowid, {', '.join(RE_PRODUCT_FTS_COLUMNS)}) "
+            f"SELECT id, {', '.join(_fts_fold(column) for column in RE_PRODUCT_FTS_COLUMNS)} "
+            f"FROM {constants.TABLE_REAL_ESTATE_PRODUCT}",
+        ],
+    ),
+    (
+        3,
+        "case-insensitive indexes for the product page filters",
+        [
+            *_filter_index_statements(
+                constants.TABLE_REAL_ESTATE_PRODUCT,
+                constants.TABLE_REAL_ESTATE_PRODUCT_FILTER,
+                RE_PRODUCT_FILTER_COLUMNS,
+            ),
+            *[
+                f"CREATE INDEX IF NOT EXISTS idx_{constants.TABLE_REAL_ESTATE_PRODUCT}_lower_{column} "
+                f"ON {constants.TABLE_REAL_ESTATE_PRODUCT} (lower({column}))"
+                for column in RE_PRODUCT_EXACT_FILTER_COLUMNS
+            ],
+        ],
+    ),
+]
+USER_MIGRATIONS = [
+    (
+        1,
+        "index listed products by user",
+        [
+            f"CREATE INDEX IF NOT EXISTS idx_{constants.TABLE_USER_LISTED_PRODUCT}_id_user "
+            f"ON {constants.TABLE_USER_LISTED_PRODUCT} (id_user)",
+        ],
+    ),
+    (
+        2,
+        "index listed products by pid for the product joins",
+        [
+            f"CREATE INDEX IF NOT EXISTS idx_{constants.TABLE_USER_LISTED_PRODUCT}_pid "
+            f"ON {constants.TABLE_USER_LISTED_PRODUCT} (pid)",
+        ],
+    ),
+    (
+        3,
+        "case-insensitive index for the user page filters",
+        _filter_index_statements(
+            constants.TABLE_USER, constants.TABLE_USER_FILTER, USER_FILTER_COLUMNS
+        ),
+    ),
+]
+SETTING_MIGRATIONS = []
+
 
 # giả sử tôi sử dụng 3 bản để hiển thị (constants.TABLE_USER,
 # constants.TABLE_USER_LISTED_PRODUCT,
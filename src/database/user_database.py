@@ -5,27 +5,31 @@ from src.my_constants import (
     CONNECTION_DB_USER,
     PATH_DB_USER,
 )
+from src.database.connections import apply_pragmas
+from src.database.migrations import run_migrations
 from src.database.sql_commands import (
     CREATE_USER_TABLE,
     CREATE_USER_LISTED_PRODUCT_TABLE,
     # CREATE_USER_ACTION_TABLE,
+    USER_MIGRATIONS,
 )
 
 
-def initialize_user_database():
+def initialize_user_database(path: str = PATH_DB_USER):
     if QSqlDatabase.contains(CONNECTION_DB_USER):
         db = QSqlDatabase.database(CONNECTION_DB_USER)
     else:
         db = QSqlDatabase.addDatabase("QSQLITE", CONNECTION_DB_USER)
-    db.setDatabaseName(PATH_DB_USER)
+    if db.isOpen() and db.databaseName() != path:
+        db.close()  # Re-pointed at another file (e.g. the benchmarks).
+    db.setDatabaseName(path)
     if not db.open():
         raise Exception(
             f"An error occurred while opening the database: {db.lastError().text()}"
         )
 
+    apply_pragmas(db)
     query = QSqlQuery(db)
-    query.exec("PRAGMA foreign_keys = ON;")
-    query.exec("PRAGMA journal_mode = WAL;")
     try:
         if db.transaction():
             for sql in [
@@ -43,6 +47,7 @@ def initialize_user_database():
                 raise Exception(
                     f"[initialize_db_user] Cannot commit transaction: {db.lastError().text()}"
                 )
+            run_migrations(db, USER_MIGRATIONS)
             return True
         else:
             return False
@@ -1,19 +1,140 @@
 # src/models/base_model.py
-from typing import List, Any
-from PyQt6.QtSql import QSqlTableModel
-from PyQt6.QtCore import Qt, QModelIndex
+import time
+import weakref
+from typing import List, Any, Dict, Optional, Set, Tuple
+from PyQt6 import sip
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery, QSqlRecord, QSqlTableModel
+from PyQt6.QtCore import Qt, QModelIndex, pyqtSignal
 from PyQt6.QtGui import QBrush, QColor
 
+from src.database.connections import apply_pragmas
+from src.my_constants import INSTRUMENTATION_ENABLED
+from src.my_types import RowChangesType
+
 
 class BaseModel(QSqlTableModel):
-    def __init__(self, table_name, db, parent=None):
+    # Columns kept in the key -> rows lookup index. Subclasses extend this with
+    # their natural keys (pid, uid, ...) so the find_* methods stay O(1).
+    INDEXED_FIELDS: Tuple[str, ...] = ("id",)
+    # Trigram index of FILTER_INDEX_COLUMNS (see sql_commands), used by
+    # SqlFilterProxyModel for the substring filters of those columns.
+    FILTER_INDEX: Optional[str] = None
+    FILTER_INDEX_COLUMNS: Tuple[str, ...] = ()
+    # Rows pulled per fetchMore() window. Qt reads SQLite results in blocks of
+    # 255 rows, so the effective window is rounded up to whole blocks.
+    PAGE_SIZE: int = 256
+    # Every live model, for reload_connection().
+    _instances: "weakref.WeakSet[BaseModel]" = weakref.WeakSet()
+    # Emits the RowChangesType applied by apply_changes(), for the models that
+    # mirror this one (SqlFilterProxyModel's display copy).
+    rows_changed = pyqtSignal(object)
+
+    def __init__(self, table_name, db, parent=None, lazy=False, page_size=None):
         super().__init__(parent, db=db)
         self.setTable(table_name)
+        self.page_size: int = page_size or self.PAGE_SIZE
+        self._lazy = lazy
+        self._selected = False
+        # Seconds spent in the first select(), None while it is deferred.
+        self.load_seconds: Optional[float] = None
         self.setEditStrategy(QSqlTableModel.EditStrategy.OnManualSubmit)
         self.status_col = self.fieldIndex("status")
-        self.select()
+
+        self._row_keys: Dict[str, List[Any]] = {}
+        self._key_index: Dict[str, Dict[Any, List[int]]] = {}
+        self._removed_rows: Set[int] = set()
+        # Records inserted since the last select(), shown after the fetched rows.
+        self._appended: List[QSqlRecord] = []
+        self.modelAboutToBeReset.connect(self._appended.clear)
+        self.modelReset.connect(self._rebuild_index)
+        self.modelReset.connect(self._removed_rows.clear)
+        self.rowsInserted.connect(self._on_rows_inserted)
+        self.rowsRemoved.connect(self._on_rows_removed)
+        self.dataChanged.connect(self._on_data_changed)
+        BaseModel._instances.add(self)
+
+        if not lazy:
+            self.select()
+
+    # ========================================================================
+    # Paging
+    # ========================================================================
+    def select(self) -> bool:
+        first_load = not self._selected
+        start_time = time.perf_counter()
+        self._selected = True
+        result = super().select()
+        while result and self.rowCount() < self.page_size and super().canFetchMore():
+            super().fetchMore()
+        if first_load:
+            self.load_seconds = time.perf_counter() - start_time
+            if self._lazy and INSTRUMENTATION_ENABLED:
+                print(
+                    f"INFO: [{self.__class__.__name__}.select] First page loaded in {self.load_seconds * 1000:.1f} ms ({self.rowCount()} rows)."
+                )
+        return result
+
+    @classmethod
+    def reload_connection(cls, connection_name: str):
+        """
+        Re-selects the loaded models of `connection_name` after the database
+        was written through another connection (a worker thread's clone).
+        SQLite keeps a connection on the snapshot of its oldest unfinished
+        statement, and a model keeps its statement open while rows remain to
+        be fetched, so the connection is reopened to drop every statement.
+        """
+        db = QSqlDatabase.database(connection_name, False)
+        models = [
+            model
+            for model in list(cls._instances)
+            if not sip.isdeleted(model)
+            and model.database().connectionName() == connection_name
+        ]
+        db.close()
+        if not db.open():
+            print(
+                f"[{cls.__name__}.reload_connection] Failed to reopen '{connection_name}': {db.lastError().text()}"
+            )
+            return
+        apply_pragmas(db)
+        for model in models:
+            if model.is_selected():
+                model.select()
+
+    def is_selected(self) -> bool:
+        return self._selected
+
+    def ensure_selected(self) -> bool:
+        """Runs the deferred select() of a lazy model. No-op once selected."""
+        if self._selected:
+            return True
+        return self.select()
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        # Views fetch even while hidden, so a lazy model stays empty until
+        # ensure_selected() is called (pages do it when they are first shown).
+        if not self._selected:
+            return False
+        return super().canFetchMore(parent)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        if not self._selected:
+            self.select()
+            return
+        target = self.rowCount() + self.page_size
+        while self.rowCount() < target and super().canFetchMore(parent):
+            super().fetchMore(parent)
+        if self._appended:
+            self._drop_fetched_appended_rows()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return super().rowCount(parent) + len(self._appended)
 
     def flags(self, index):
+        if index.row() in self._removed_rows:
+            return Qt.ItemFlag.NoItemFlags
         return (
             Qt.ItemFlag.ItemIsSelectable
             | Qt.ItemFlag.ItemIsEnabled
@@ -21,19 +142,34 @@ class BaseModel(QSqlTableModel):
         )
 
     def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        appended = self._appended_record(index.row())
         if role == Qt.ItemDataRole.DisplayRole:
+            if appended is not None:
+                return self._record_value(appended, index.column())
             return super().data(index, role)
         if role == Qt.ItemDataRole.BackgroundRole and self.status_col != -1:
             status_index = self.index(index.row(), self.status_col)
-            status = super().data(status_index, Qt.ItemDataRole.DisplayRole)
+            status = self.data(status_index, Qt.ItemDataRole.DisplayRole)
             try:
                 status_value = int(status)
             except Exception:
                 status_value = None
             if status_value == 0:
                 return QBrush(QColor("#e7625f"))
+        if appended is not None:
+            if role == Qt.ItemDataRole.EditRole:
+                return self._record_value(appended, index.column())
+            return None
         return super().data(index, role)
 
+    def record(self, row: Optional[int] = None) -> QSqlRecord:
+        if row is None:
+            return super().record()
+        appended = self._appended_record(row)
+        if appended is not None:
+            return QSqlRecord(appended)
+        return super().record(row)
+
     def get_record_ids(self, row: List[int]) -> List[Any]:
         ids = []
         id_col_index = self.fieldIndex("id")
@@ -49,13 +185,266 @@ class BaseModel(QSqlTableModel):
         return ids
 
     def get_row_by_id(self, db_id: Any) -> int:
-        id_col_index = self.fieldIndex("id")
-        if id_col_index == -1:
-            print("[BaseModel] 'id' field not found for search.")
-            return -1
-
-        for row in range(self.rowCount()):
-            index = self.index(row, id_col_index)
-            if self.data(index) == db_id:
-                return row
-        return -1
+        return self.find_row_by_key("id", db_id)
+
+    def refresh_row(self, row: int) -> bool:
+        """Re-reads a single row from the database (emits dataChanged for it)."""
+        if not 0 <= row < self.rowCount():
+            return False
+        if self._appended_record(row) is not None:
+            record_id = self.data(self.index(row, self.fieldIndex("id")))
+            records = self._select_records([record_id], apply_filter=False)
+            if record_id not in records:
+                return self._remove_appended_row(row)
+            self._appended[row - self._fetched_row_count()] = records[record_id]
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, self.columnCount() - 1)
+            )
+            return True
+        return self.selectRow(row)
+
+    def mark_row_removed(self, row: int) -> bool:
+        """Refreshes a row whose record was deleted directly in the database.
+        QSqlTableModel cannot drop a row from its result set without a full
+        select(), so the row stays as an empty, disabled placeholder until the
+        next select(). Proxy models filter these rows out."""
+        if not 0 <= row < self.rowCount():
+            return False
+        if self._appended_record(row) is not None:
+            # Appended rows are not part of the result set: really remove them.
+            return self._remove_appended_row(row)
+        self._removed_rows.add(row)
+        return self.selectRow(row)
+
+    def is_row_removed(self, row: int) -> bool:
+        return row in self._removed_rows
+
+    # ========================================================================
+    # Row changes
+    # ========================================================================
+    def apply_changes(self, changes: RowChangesType):
+        """
+        Applies the rows written by a service without a select(), so views
+        keep their selection, scroll position and sort: deleted rows are
+        removed (placeholders, see mark_row_removed()), updated rows are
+        re-read, or removed when they no longer match the model's filter, and
+        inserted rows matching the filter are appended after the fetched rows
+        until the next select() puts them in place. Emits rows_changed.
+        """
+        if changes.reset:
+            if self._selected:
+                self.select()
+        elif self._selected:
+            rows_to_remove = [
+                row
+                for record_id in changes.deleted
+                for row in self.find_rows_by_key("id", record_id, fetch_more=False)
+            ]
+            written_ids = list(dict.fromkeys([*changes.updated, *changes.inserted]))
+            records = self._select_records(written_ids) if written_ids else {}
+            inserted_ids = set(changes.inserted)
+            records_to_append = []
+            for record_id in written_ids:
+                rows = self.find_rows_by_key("id", record_id, fetch_more=False)
+                if not rows:
+                    # An updated record that is not loaded is either behind the
+                    # fetched rows (fetched in place later) or was filtered
+                    # out, which is only certain once everything is fetched.
+                    if record_id in records and (
+                        record_id in inserted_ids or not super().canFetchMore()
+                    ):
+                        records_to_append.append(records[record_id])
+                    continue
+                for row in rows:
+                    if record_id not in records:
+                        rows_to_remove.append(row)
+                        continue
+                    self._removed_rows.discard(row)
+                    self.refresh_row(row)
+            for row in sorted(set(rows_to_remove), reverse=True):
+                self.mark_row_removed(row)
+            self._append_records(records_to_append)
+        self.rows_changed.emit(changes)
+
+    def _fetched_row_count(self) -> int:
+        return super().rowCount()
+
+    def _appended_record(self, row: int) -> Optional[QSqlRecord]:
+        if not self._appended:
+            return None
+        offset = row - self._fetched_row_count()
+        if 0 <= offset < len(self._appended):
+            return self._appended[offset]
+        return None
+
+    @staticmethod
+    def _record_value(record: QSqlRecord, column: int) -> Any:
+        return None if record.isNull(column) else record.value(column)
+
+    def _select_records(
+        self, record_ids: List[Any], apply_filter: bool = True, chunk_size: int = 500
+    ) -> Dict[Any, QSqlRecord]:
+        """Reads {id: record} for `record_ids`, restricted to the rows matching
+        the model's filter unless `apply_filter` is False."""
+        condition = f" AND ({self.filter()})" if apply_filter and self.filter() else ""
+        columns = ", ".join(
+            self.record().fieldName(i) for i in range(self.record().count())
+        )
+        records: Dict[Any, QSqlRecord] = {}
+        for start in range(0, len(record_ids), chunk_size):
+            chunk = record_ids[start : start + chunk_size]
+            query = QSqlQuery(self.database())
+            query.setForwardOnly(True)
+            query.prepare(
+                f"SELECT {columns} FROM {self.tableName()} "
+                f"WHERE id IN ({', '.join('?' for _ in chunk)}){condition}"
+            )
+            for record_id in chunk:
+                query.addBindValue(record_id)
+            if not query.exec():
+                print(
+                    f"[{self.__class__.__name__}._select_records] Query failed: {query.lastError().text()}"
+                )
+                return records
+            while query.next():
+                record = query.record()
+                records[record.value("id")] = record
+        return records
+
+    def _append_records(self, records: List[QSqlRecord]):
+        if not records:
+            return
+        first = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        self._appended.extend(records)
+        self.endInsertRows()
+
+    def _remove_appended_row(self, row: int) -> bool:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._appended[row - self._fetched_row_count()]
+        self.endRemoveRows()
+        return True
+
+    def _drop_fetched_appended_rows(self):
+        """Removes the appended rows that fetchMore() has now read in place."""
+        fetched = self._fetched_row_count()
+        fetched_ids = set(self._row_keys.get("id", [])[:fetched])
+        id_col = self.record().indexOf("id")
+        for offset in range(len(self._appended) - 1, -1, -1):
+            if self._appended[offset].value(id_col) in fetched_ids:
+                self._remove_appended_row(fetched + offset)
+
+    # ========================================================================
+    # Key index
+    # ========================================================================
+    def find_row_by_key(self, field_name: str, value: Any, fetch_more: bool = True) -> int:
+        """Returns the first model row whose `field_name` equals `value`, or -1."""
+        rows = self.find_rows_by_key(field_name, value, fetch_more)
+        return rows[0] if rows else -1
+
+    def find_rows_by_key(
+        self, field_name: str, value: Any, fetch_more: bool = True
+    ) -> List[int]:
+        """Returns every model row whose `field_name` equals `value`.
+        Unless `fetch_more` is False, a lazy model is selected and rows not
+        fetched yet are pulled in (fetchMore) until the key is found."""
+        if not self._selected:
+            if not fetch_more:
+                return []
+            self.ensure_selected()
+        index = self._key_index.get(field_name)
+        if index is None:
+            print(
+                f"[{self.__class__.__name__}.find_rows_by_key] '{field_name}' field is not indexed for search."
+            )
+            return []
+        if value is None:
+            return []
+        rows = index.get(value)
+        while not rows and fetch_more and self.canFetchMore():
+            # fetchMore() emits rowsInserted, which extends the index.
+            self.fetchMore()
+            rows = index.get(value)
+        return sorted(rows) if rows else []
+
+    def _indexed_columns(self) -> Dict[str, int]:
+        columns = {}
+        for field_name in self.INDEXED_FIELDS:
+            col_index = self.fieldIndex(field_name)
+            if col_index != -1:
+                columns[field_name] = col_index
+        return columns
+
+    def _key_at(self, row: int, col_index: int) -> Any:
+        return self.data(self.index(row, col_index), Qt.ItemDataRole.DisplayRole)
+
+    def _rebuild_index(self):
+        self._row_keys = {}
+        self._key_index = {}
+        row_count = self.rowCount()
+        for field_name, col_index in self._indexed_columns().items():
+            keys = [self._key_at(row, col_index) for row in range(row_count)]
+            self._row_keys[field_name] = keys
+            self._key_index[field_name] = self._index_keys(keys)
+
+    @staticmethod
+    def _index_keys(keys: List[Any]) -> Dict[Any, List[int]]:
+        index: Dict[Any, List[int]] = {}
+        for row, key in enumerate(keys):
+            if key is not None:
+                index.setdefault(key, []).append(row)
+        return index
+
+    def _on_rows_inserted(self, parent: QModelIndex, first: int, last: int):
+        for field_name, col_index in self._indexed_columns().items():
+            keys = self._row_keys.setdefault(field_name, [])
+            index = self._key_index.setdefault(field_name, {})
+            new_keys = [self._key_at(row, col_index) for row in range(first, last + 1)]
+            keys[first:first] = new_keys
+            if first < len(keys) - len(new_keys):
+                # Rows were inserted in the middle: row numbers behind them shifted.
+                self._key_index[field_name] = self._index_keys(keys)
+                continue
+            for offset, key in enumerate(new_keys):
+                if key is not None:
+                    index.setdefault(key, []).append(first + offset)
+
+    def _on_rows_removed(self, parent: QModelIndex, first: int, last: int):
+        for field_name, keys in self._row_keys.items():
+            removed_tail = last >= len(keys) - 1
+            removed_keys = keys[first : last + 1]
+            del keys[first : last + 1]
+            if not removed_tail:
+                self._key_index[field_name] = self._index_keys(keys)
+                continue
+            index = self._key_index[field_name]
+            for offset, key in enumerate(removed_keys):
+                self._drop_key(index, key, first + offset)
+
+    def _on_data_changed(self, top_left: QModelIndex, bottom_right: QModelIndex, roles=None):
+        for field_name, col_index in self._indexed_columns().items():
+            if not top_left.column() <= col_index <= bottom_right.column():
+                continue
+            keys = self._row_keys.get(field_name)
+            index = self._key_index.get(field_name)
+            if keys is None or index is None:
+                continue
+            for row in range(top_left.row(), min(bottom_right.row(), len(keys) - 1) + 1):
+                new_key = self._key_at(row, col_index)
+                old_key = keys[row]
+                if new_key == old_key:
+                    continue
+                self._drop_key(index, old_key, row)
+                keys[row] = new_key
+                if new_key is not None:
+                    index.setdefault(new_key, []).append(row)
+
+    @staticmethod
+    def _drop_key(index: Dict[Any, List[int]], key: Any, row: int):
+        rows = index.get(key)
+        if not rows:
+            return
+        if row in rows:
+            rows.remove(row)
+        if not rows:
+            del index[key]
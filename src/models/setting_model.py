@@ -9,20 +9,24 @@ from src.models.base_model import BaseModel
 
 
 class SettingProxyModel(BaseModel):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, lazy=False, page_size=None):
         db = QSqlDatabase.database(CONNECTION_DB_SETTING)
         if not db.isValid() or not db.isOpen():
             warning_msg = f"Warning: Database connection '{CONNECTION_DB_SETTING}' is not valid or not open."
             print(warning_msg)
-        super().__init__(TABLE_SETTING_PROXY, db, parent)
+        super().__init__(
+            TABLE_SETTING_PROXY, db, parent, lazy=lazy, page_size=page_size
+        )
         # self.setEditStrategy(QSqlTableModel.EditStrategy.OnFieldChange)
 
 
 class SettingUserDataDirModel(BaseModel):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, lazy=False, page_size=None):
         db = QSqlDatabase.database(CONNECTION_DB_SETTING)
         if not db.isValid() or not db.isOpen():
             warning_msg = f"Warning: Database connection '{CONNECTION_DB_SETTING}' is not valid or not open."
             print(warning_msg)
-        super().__init__(TABLE_SETTING_USER_DATA_DIR, db, parent)
+        super().__init__(
+            TABLE_SETTING_USER_DATA_DIR, db, parent, lazy=lazy, page_size=page_size
+        )
         # self.setEditStrategy(QSqlTableModel.EditStrategy.OnFieldChange)
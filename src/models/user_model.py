@@ -1,35 +1,35 @@
 # src/models/user_model.py
-from typing import List, Optional
+from typing import List
 from PyQt6.QtSql import QSqlDatabase, QSqlTableModel
+from src.database.sql_commands import USER_FILTER_COLUMNS
 from src.models.base_model import BaseModel
 from src.my_constants import (
     CONNECTION_DB_USER,
     TABLE_USER,
+    TABLE_USER_FILTER,
     TABLE_USER_LISTED_PRODUCT,
 )
 
 
 class UserModel(BaseModel):
-    def __init__(self, parent=None):
+    INDEXED_FIELDS = ("id", "uid")
+    FILTER_INDEX = TABLE_USER_FILTER
+    FILTER_INDEX_COLUMNS = USER_FILTER_COLUMNS
+
+    def __init__(self, parent=None, lazy=False, page_size=None):
         db = QSqlDatabase.database(CONNECTION_DB_USER)
         if not db.isValid() or not db.isOpen():
             warning_msg = f"Warning: Database connection '{CONNECTION_DB_USER}' is not valid or not open."
             print(warning_msg)
-        super().__init__(TABLE_USER, db, parent)
+        super().__init__(TABLE_USER, db, parent, lazy=lazy, page_size=page_size)
 
     def find_row_by_uid(self, uid: str) -> int:
-        uid_col_index = self.fieldIndex("uid")
-        if uid_col_index == -1:
+        if self.fieldIndex("uid") == -1:
             print(
                 f"[{self.__class__.__name__}.find_row_by_uid] 'uid' field not found for search."
             )
             return -1
-
-        for row in range(self.rowCount()):
-            index = self.index(row, uid_col_index)
-            if self.data(index) == uid:
-                return row
-        return -1
+        return self.find_row_by_key("uid", uid)
 
     def get_uids_by_record_ids(self, record_ids: List[int]) -> List[str]:
         uid_col_index = self.fieldIndex("uid")
@@ -41,33 +41,29 @@ class UserModel(BaseModel):
             return []
 
         uids = []
-        for row in range(self.rowCount()):
-            id_index = self.index(row, id_col_index)
-            uid_index = self.index(row, uid_col_index)
-            if self.data(id_index) in record_ids:
-                uids.append(self.data(uid_index))
+        for record_id in record_ids:
+            row = self.get_row_by_id(record_id)
+            if row != -1:
+                uids.append(self.data(self.index(row, uid_col_index)))
         return uids
 
 
 class UserListedProductModel(BaseModel):
+    INDEXED_FIELDS = ("id", "id_user")
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, lazy=False, page_size=None):
         db = QSqlDatabase.database(CONNECTION_DB_USER)
         if not db.isValid() or not db.isOpen():
             warning_msg = f"Warning: Database connection '{CONNECTION_DB_USER}' is not valid or not open."
             print(warning_msg)
-        super().__init__(TABLE_USER_LISTED_PRODUCT, db, parent)
+        super().__init__(
+            TABLE_USER_LISTED_PRODUCT, db, parent, lazy=lazy, page_size=page_size
+        )
 
-    def get_rows_by_user_id(self, user_id: int) -> Optional[int]:
-        user_id_col_index = self.fieldIndex("user_id")
-        if user_id_col_index == -1:
+    def get_rows_by_user_id(self, user_id: int) -> List[int]:
+        if self.fieldIndex("id_user") == -1:
             print(
-                f"[{self.__class__.__name__}.get_rows_by_user_id] 'user_id' field not found for search."
+                f"[{self.__class__.__name__}.get_rows_by_user_id] 'id_user' field not found for search."
             )
-            return -1
-        rows = []
-        for row in range(self.rowCount()):
-            index = self.index(row, user_id_col_index)
-            if self.data(index) == user_id:
-                rows.append(row)
-        return rows
+            return []
+        return self.find_rows_by_key("id_user", user_id)
@@ -1,4 +1,6 @@
 # src/my_constants.py
+import os
+
 CONNECTION_DB_USER = "user_connection"
 CONNECTION_DB_PRODUCT = "product_connection"
 CONNECTION_DB_SETTING = "setting_connection"
@@ -6,15 +8,37 @@ CONNECTION_DB_SETTING = "setting_connection"
 PATH_DB_USER = "./src/repositories/db/db_user.db"
 PATH_DB_PRODUCT = "./src/repositories/db/db_product.db"
 PATH_DB_SETTING = "./src/repositories/db/db_setting.db"
+PATH_THUMBNAIL_CACHE = "./src/repositories/cache/thumbnails"
+
+# Opt-in timing of every public service/controller method (see
+# src/services/instrumentation.py); the stats are dumped to the file below.
+INSTRUMENTATION_ENABLED = os.environ.get("MY_MANAGER_INSTRUMENTATION") == "1"
+PATH_INSTRUMENTATION_DUMP = "./src/repositories/diagnostics/instrumentation.json"
+INSTRUMENTATION_DUMP_INTERVAL_MS = 60_000
+
+# Opt-in SQL tracing (src/services/sql_trace.py): statements slower than
+# SQL_SLOW_QUERY_MS are logged with their EXPLAIN QUERY PLAN.
+SQL_TRACE_ENABLED = os.environ.get("MY_MANAGER_SQL_TRACE") == "1"
+SQL_SLOW_QUERY_MS = float(os.environ.get("MY_MANAGER_SQL_SLOW_MS", "100"))
+
+# Product images are downscaled to fit this size and re-encoded on import.
+IMAGE_MAX_DIMENSION = 1920
+IMAGE_JPEG_QUALITY = 85
+# Extensions (lowercase) listed as product images.
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif", ".webp")
 
 TABLE_USER = "user"
 TABLE_USER_LISTED_PRODUCT = "listed_products"
+TABLE_USER_FILTER = "user_filter"
 TABLE_USER_ACTION = "user_actions"
 TABLE_SETTING_USER_DATA_DIR = "user_data_dir"
 TABLE_SETTING_PROXY = "proxy"
 TABLE_REAL_ESTATE_PRODUCT = "real_estate_product"
+TABLE_REAL_ESTATE_PRODUCT_FTS = "real_estate_product_fts"
+TABLE_REAL_ESTATE_PRODUCT_FILTER = "real_estate_product_filter"
 TABLE_MISC_PRODUCT = "misc"
 TABLE_REAL_ESTATE_TEMPLATE = "real_estate_template"
+TABLE_SCHEMA_VERSION = "schema_version"
 
 
 RE_TRANSACTION = {"sell": "bán", "rent": "cho thuê", "assignment": "sang nhượng"}
@@ -1,11 +1,11 @@
 # src/my_types.py
-from dataclasses import dataclass
-from typing import Optional, List
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, List
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
 
-@dataclass
+@dataclass(slots=True)
 class UserType:
     id: Optional[int]
     uid: Optional[str]
@@ -25,7 +25,7 @@ class UserType:
     updated_at: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class UserListedProductType:
     id: Optional[int]
     id_user: int
@@ -34,7 +34,7 @@ class UserListedProductType:
     updated_at: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class SettingProxyType:
     id: Optional[int]
     value: str
@@ -42,7 +42,7 @@ class SettingProxyType:
     updated_at: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class SettingUserDataDirType:
     id: Optional[int]
     value: str
@@ -51,7 +51,7 @@ class SettingUserDataDirType:
     updated_at: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class RealEstateProductType:
     id: Optional[int]
     pid: Optional[str]
@@ -75,7 +75,7 @@ class RealEstateProductType:
     updated_at: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class RealEstateTemplateType:
     id: Optional[int]
     transaction_type: Optional[str]
@@ -87,7 +87,7 @@ class RealEstateTemplateType:
     updated_at: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class MiscProductType:
     id: Optional[int]
     pid: Optional[str]
@@ -98,6 +98,88 @@ class MiscProductType:
     updated_at: Optional[int]
 
 
+@dataclass(slots=True)
+class ListedProductRowType:
+    """A listed product joined with its account and real-estate product.
+    The product fields are None when the product no longer exists."""
+
+    id: int
+    id_user: int
+    uid: Optional[str]
+    username: Optional[str]
+    user_type: Optional[str]
+    user_status: Optional[int]
+    pid: str
+    listed_at: Optional[str]
+    product_id: Optional[int]
+    product_status: Optional[int]
+    transaction_type: Optional[str]
+    category: Optional[str]
+    ward: Optional[str]
+    price: Optional[float]
+    area: Optional[float]
+    is_stale: bool
+
+
+@dataclass(slots=True)
+class UserListingSummaryType:
+    id_user: int
+    uid: Optional[str]
+    username: Optional[str]
+    listed_count: int
+    stale_count: int
+    last_listed_at: Optional[str]
+
+
+@dataclass
+class RowChangesType:
+    """Rows of `table` written by a service, by id. `reset` means the change
+    cannot be described row by row (bulk import, multi-row SQL update): the
+    table has to be re-selected."""
+
+    table: str
+    inserted: List[Any] = field(default_factory=list)
+    updated: List[Any] = field(default_factory=list)
+    deleted: List[Any] = field(default_factory=list)
+    reset: bool = False
+
+
+@dataclass
+class MethodStatsType:
+    """Call count and latencies (ms) of one instrumented method."""
+
+    name: str
+    count: int
+    errors: int
+    total_ms: float
+    mean_ms: float
+    min_ms: float
+    max_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    # bucket label -> calls
+    histogram: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class SqlTraceType:
+    """One traced SQL statement (see src/services/sql_trace.py). For SELECTs,
+    rows and duration include the fetching done through next()."""
+
+    statement: str
+    bind_count: int
+    row_count: int
+    duration_ms: float
+    # "query", "batch" or "<Model>.select" / "<Model>.fetchMore"
+    source: str
+    ok: bool = True
+    slow: bool = False
+    connection: Optional[str] = None
+    # EXPLAIN QUERY PLAN lines, captured for slow statements.
+    plan: List[str] = field(default_factory=list)
+
+
 @dataclass
 class SellPayloadType:
     title: str
@@ -105,6 +187,19 @@ class SellPayloadType:
     image_paths: List[str]
 
 
+@dataclass
+class IngestedImageType:
+    source_path: str
+    path: Optional[str]
+    sha256: Optional[str]
+    original_size: int
+    size: int
+    width: int
+    height: int
+    seconds: float
+    error: Optional[str] = None
+
+
 @dataclass
 class RobotTaskType:
     user_info: UserType
@@ -1,13 +1,30 @@
 # src/services/base_service.py
 
-import sys
+import math
+import time
+import threading
+from array import array
 from datetime import datetime
-from typing import List, Any, Dict, Optional, Type
+from typing import (
+    List,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 from contextlib import contextmanager
-from PyQt6.QtCore import Qt, QVariant
-from PyQt6.QtSql import QSqlDatabase, QSqlRecord, QSqlTableModel
+from PyQt6.QtCore import Qt, QObject, QThread, QVariant, pyqtSignal, pyqtSlot
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery, QSqlRecord, QSqlTableModel
 from dataclasses import fields
 from src.models.base_model import BaseModel
+from src.database import connections
+from src.services.record_mapper import RecordMapper, mapper_for
+from src.my_types import RowChangesType
 
 
 @contextmanager
@@ -27,49 +44,91 @@ def transaction(db: QSqlDatabase):
         raise RuntimeError(error_msg)
     try:
         yield db  # Yield control to the 'with' block
-        # Attempt to commit the transaction
-        if not db.commit():
-            error_msg = (
-                f"[{transaction.__name__}] Failed to commit transaction. Error: { db.lastError().text()}"
-                if db.isOpen()
-                else f"[{transaction.__name__}] Database not open."
-            )
-            print(f"ERROR: {error_msg}")  # Keep print for critical error
-            if (
-                db.isOpen() and db.transaction()
-            ):  # Check if transaction is still active before rollback
-                db.rollback()  # Attempt to roll back if commit fails
-                print(
-                    f"WARNING: [{transaction.__name__}] Attempted rollback after commit failure."
-                )  # Keep print
-            raise RuntimeError(error_msg)
-        # print(f"INFO: [{transaction.__name__}] Transaction committed successfully.") # Removed print for clean
     except Exception as e:
         print(
             f"ERROR: [{transaction.__name__}] Exception during transaction block: {e}"
         )  # Keep print
-        if (
-            db.isOpen() and db.transaction()
-        ):  # Check if transaction is still active before rollback
-            if db.rollback():
-                print(
-                    f"INFO: [{transaction.__name__}] Transaction rolled back due to exception."
-                )  # Keep print
-            else:
-                print(
-                    f"WARNING: [{transaction.__name__}] Failed to rollback transaction due to exception. Error: {db.lastError().text()}"
-                )  # Keep print
+        # Always roll back: the transaction begun above is still open (BEGIN
+        # cannot be used to probe it, it fails inside a transaction).
+        if db.rollback():
+            print(
+                f"INFO: [{transaction.__name__}] Transaction rolled back due to exception."
+            )  # Keep print
+        else:
+            print(
+                f"WARNING: [{transaction.__name__}] Failed to rollback transaction due to exception. Error: {db.lastError().text()}"
+            )  # Keep print
         raise  # Re-raise the exception to be caught by the calling function (e.g., import_data)
+    # Attempt to commit the transaction
+    if not db.commit():
+        error_msg = (
+            f"[{transaction.__name__}] Failed to commit transaction. Error: { db.lastError().text()}"
+            if db.isOpen()
+            else f"[{transaction.__name__}] Database not open."
+        )
+        print(f"ERROR: {error_msg}")  # Keep print for critical error
+        # A failed COMMIT (e.g. SQLITE_BUSY) leaves the transaction open, and
+        # the connection would keep its write lock.
+        db.rollback()
+        print(
+            f"WARNING: [{transaction.__name__}] Attempted rollback after commit failure."
+        )  # Keep print
+        raise RuntimeError(error_msg)
+
+
+# thread ident -> names of the connections written by the thread while its
+# model reloads are deferred (see deferred_reloads()).
+_deferred_reloads: Dict[int, Set[str]] = {}
+
+
+@contextmanager
+def deferred_reloads():
+    """
+    Collects the model reloads requested by the writes of the calling worker
+    thread instead of queueing one per write (one per import batch), and
+    yields the set of connection names whose models have to be reloaded
+    once the work is done (BaseModel.reload_connection on the GUI thread).
+    """
+    ident = threading.get_ident()
+    pending: Set[str] = set()
+    _deferred_reloads[ident] = pending
+    try:
+        yield pending
+    finally:
+        _deferred_reloads.pop(ident, None)
+
+
+class _ModelThreadInvoker(QObject):
+    """Runs callables on the thread of its parent model (queued when emitted
+    from another thread)."""
+
+    invoke = pyqtSignal(object)
+
+    def __init__(self, parent: QObject):
+        super().__init__(parent)
+        self.invoke.connect(self._run)
+
+    @pyqtSlot(object)
+    def _run(self, callback: Callable[[], None]):
+        callback()
 
 
 class BaseService:
     DATA_TYPE: Optional[Type[Any]] = None
+    # When True, create/update/delete run prepared SQL on self._db instead of
+    # going through the QSqlTableModel buffer, and only the touched row of the
+    # model is refreshed.
+    DIRECT_SQL: bool = False
 
     def __init__(self, model: BaseModel):
         if not isinstance(model, BaseModel):
             raise TypeError("model mus be an instance of BaseModel or its subclass.")
         self.model = model
-        self._db = model.database()
+        self._connection_name = model.database().connectionName()
+        self._model_invoker = _ModelThreadInvoker(model)
+        self.last_import_stats: Optional[Dict[str, float]] = None
+        # Called after every successful write (caches derived from the table).
+        self._write_listeners: List[Callable[[], None]] = []
         # print(self._db.isOpen())
         # print()
 
@@ -99,28 +158,61 @@ class BaseService:
                     warning_msg = f"[{self.__class__.__name__}.__init__] Warning: Field '{field_name}' from DATA_TYPE '{self.DATA_TYPE.__name__}' not found as a column in table '{self.model.tableName()}'."
                     print(warning_msg)
 
+    @property
+    def _db(self) -> QSqlDatabase:
+        # The model's connection on its own thread, the thread's clone on a
+        # DB worker thread (see DbJobRunner).
+        return connections.database(self._connection_name)
+
+    def _is_model_thread(self) -> bool:
+        return QThread.currentThread() == self.model.thread()
+
+    def _refresh_model(self, refresh: Callable[[], None]):
+        """Runs `refresh` (a model update after a write) on the model's
+        thread. Writes made from a worker thread go through its cloned
+        connection, so the models of this connection are reloaded instead
+        (queued to the model's thread: models are GUI objects), or once at
+        the end of the work under deferred_reloads()."""
+        if self._is_model_thread():
+            refresh()
+            return
+        pending = _deferred_reloads.get(threading.get_ident())
+        if pending is not None:
+            pending.add(self._connection_name)
+        else:
+            self._model_invoker.invoke.emit(
+                lambda: BaseModel.reload_connection(self._connection_name)
+            )
+
     # ========================================================================
     # Helper method
     # ========================================================================
+    def _record_mapper(self, record: QSqlRecord) -> RecordMapper:
+        """The DATA_TYPE mapper compiled for the column layout of `record`
+        (shared by every service of the same DATA_TYPE and layout)."""
+        return mapper_for(self.DATA_TYPE, record)
+
     def _map_record_to_datatype(self, record: QSqlRecord) -> Optional[Any]:
         """Helper to map a QSqlRecord to an instance of the specific DATA_TYPE dataclass."""
         if self.DATA_TYPE is None:
             info_msg = f"[{self.__class__.__name__}._map_record_to_datatype] DATA_TYPE is not set. Cannot map record. => return None"
             print(info_msg)
             return None
-        data: Dict[str, Any] = {}
-        for i in range(record.count()):
-            field_name = record.fieldName(i)
-            data[field_name] = record.value(i)
         try:
-            dataclass_field_names = {f.name for f in fields(self.DATA_TYPE)}
-            valid_data = {field: data.get(field) for field in dataclass_field_names}
-            return self.DATA_TYPE(**valid_data)
+            return self._record_mapper(record).map_record(record)
         except Exception as e:
-            error_msg = f"[{self.__class__.__name__}._map_record_to_datatype] Error: converting dict to {self.DATA_TYPE.__name__}: {e} -- Data: {data}"
-            print(error_msg)
+            self._report_unmapped_record("_map_record_to_datatype", record, e)
             return None
 
+    def _report_unmapped_record(
+        self, method_name: str, record: QSqlRecord, error: Exception
+    ):
+        """Prints a row that could not be converted to DATA_TYPE; the readers
+        skip it and go on with the next one."""
+        data = {record.fieldName(i): record.value(i) for i in range(record.count())}
+        error_msg = f"[{self.__class__.__name__}.{method_name}] Error: converting record to {self.DATA_TYPE.__name__}: {error} -- Data: {data}"
+        print(error_msg)
+
     def _fill_row_from_payload(self, row: int, payload: Any):
         """Helper to set data in a model row from a DATA_TYPE payload."""
         if self.DATA_TYPE is None:
@@ -164,6 +256,156 @@ class BaseService:
                     print(warning_msg)
         return fields_set_count > 0
 
+    def _payload_columns(self, payload: Any, skip_none: bool) -> Dict[str, Any]:
+        """Collects {column: value} from a DATA_TYPE payload for the table columns,
+        excluding 'id'. created_at/updated_at default to now when None."""
+        values: Dict[str, Any] = {}
+        current_time_str = str(datetime.now())
+        for field_name in self._column_names:
+            if field_name == "id" or not hasattr(payload, field_name):
+                continue
+            value = getattr(payload, field_name)
+            if field_name in ("created_at", "updated_at") and value is None:
+                value = current_time_str
+            if value is None and skip_none:
+                continue
+            values[field_name] = value
+        return values
+
+    def _exec_prepared(self, sql: str, bind_values: List[Any]) -> Optional[QSqlQuery]:
+        """Prepares and executes `sql` on self._db. Returns the query or None on error."""
+        query = QSqlQuery(self._db)
+        if not query.prepare(sql):
+            print(
+                f"[{self.__class__.__name__}._exec_prepared] Failed to prepare query: {query.lastError().text()}"
+            )
+            return None
+        for value in bind_values:
+            query.addBindValue(value)
+        if not query.exec():
+            print(
+                f"[{self.__class__.__name__}._exec_prepared] Query failed: {query.lastError().text()}"
+            )
+            return None
+        return query
+
+    def _create_direct(self, payload: Any) -> bool:
+        values = self._payload_columns(payload, skip_none=False)
+        if not values:
+            print(
+                f"[{self.__class__.__name__}.create] No columns to insert. => return False"
+            )
+            return False
+        columns = ", ".join(values.keys())
+        placeholders = ", ".join("?" for _ in values)
+        sql = (
+            f"INSERT INTO {self.model.tableName()} ({columns}) VALUES ({placeholders})"
+        )
+        query = self._exec_prepared(sql, list(values.values()))
+        if query is None:
+            return False
+        self._notify_written(self._changes(inserted=[query.lastInsertId()]))
+        return True
+
+    def _update_direct(self, record_id: Any, payload: Any) -> bool:
+        payload.updated_at = str(datetime.now())
+        values = self._payload_columns(payload, skip_none=True)
+        if not values:
+            print(
+                f"[{self.__class__.__name__}.update] No fields provided in payload to update for id: {record_id}."
+            )
+            return True
+        assignments = ", ".join(f"{column} = ?" for column in values.keys())
+        sql = f"UPDATE {self.model.tableName()} SET {assignments} WHERE id = ?"
+        query = self._exec_prepared(sql, list(values.values()) + [record_id])
+        if query is None:
+            return False
+        if query.numRowsAffected() == 0:
+            print(
+                f"[{self.__class__.__name__}.update] Record with id {record_id} not found in database. => return False"
+            )
+            return False
+        self._notify_written(self._changes(updated=[record_id]))
+        return True
+
+    def _delete_direct(self, record_ids: List[Any]) -> bool:
+        placeholders = ", ".join("?" for _ in record_ids)
+        sql = f"DELETE FROM {self.model.tableName()} WHERE id IN ({placeholders})"
+        try:
+            with transaction(self._db):
+                if self._exec_prepared(sql, list(record_ids)) is None:
+                    raise RuntimeError(f"Failed to delete ids {record_ids}.")
+        except Exception as e:
+            print(f"[{self.__class__.__name__}.delete] Transaction failed: {e}")
+            return False
+        self._notify_written(self._changes(deleted=list(record_ids)))
+        return True
+
+    def add_write_listener(self, callback: Callable[[], None]):
+        """Registers `callback` to run after every successful write made
+        through this service (create/update/delete/import)."""
+        self._write_listeners.append(callback)
+
+    def _changes(self, **ids: List[Any]) -> RowChangesType:
+        return RowChangesType(table=self.model.tableName(), **ids)
+
+    def _notify_written(
+        self, changes: Optional[RowChangesType] = None, model_updated: bool = False
+    ):
+        """Runs the write listeners, then applies `changes` to the model (see
+        BaseModel.apply_changes), which passes them on to the models mirroring
+        it. With `model_updated`, the model already shows the write (it was
+        submitted through the model buffer) and only the mirrors get them."""
+        for callback in self._write_listeners:
+            callback()
+        if changes is None:
+            return
+        if model_updated and self._is_model_thread():
+            self.model.rows_changed.emit(changes)
+        else:
+            self._refresh_model(lambda: self.model.apply_changes(changes))
+
+    def read_by_ids(self, record_ids: List[Any]) -> List[Any]:
+        """Reads the given records with `SELECT ... WHERE id IN (...)` instead
+        of the model. Returns DATA_TYPE instances in `record_ids` order
+        (duplicates kept, missing ids skipped)."""
+        by_id = self._read_by_column("id", record_ids)
+        return [by_id[record_id] for record_id in record_ids if record_id in by_id]
+
+    def _read_by_column(
+        self, column: str, values: List[Any], chunk_size: int = 500
+    ) -> Dict[Any, Any]:
+        """Returns {value: DATA_TYPE instance} for the rows whose `column` is in
+        `values`, read in chunks of `chunk_size` bound parameters."""
+        if self.DATA_TYPE is None:
+            info_msg = f"[{self.__class__.__name__}._read_by_column] DATA_TYPE is not set. Cannot read. => return {{}}"
+            print(info_msg)
+            return {}
+        if not self._db.isOpen():
+            info_msg = f"[{self.__class__.__name__}._read_by_column] Database is not open. => return {{}}"
+            print(info_msg)
+            return {}
+        unique_values = list(dict.fromkeys(values))
+        results: Dict[Any, Any] = {}
+        for start in range(0, len(unique_values), chunk_size):
+            chunk = unique_values[start : start + chunk_size]
+            placeholders = ", ".join("?" for _ in chunk)
+            query = self._exec_prepared(
+                f"SELECT * FROM {self.model.tableName()} WHERE {column} IN ({placeholders})",
+                chunk,
+            )
+            if query is None:
+                return {}
+            map_query = self._record_mapper(query.record()).map_query
+            while query.next():
+                try:
+                    data_instance = map_query(query)
+                except Exception as e:
+                    self._report_unmapped_record("_read_by_column", query.record(), e)
+                    continue
+                results[getattr(data_instance, column)] = data_instance
+        return results
+
     # ========================================================================
     # CRUD method
     # ========================================================================
@@ -186,6 +428,8 @@ class BaseService:
             info_msg = f"[{self.__class__.__name__}.create] Database is not open. => return False"
             print(info_msg)
             return False
+        if self.DIRECT_SQL:
+            return self._create_direct(payload)
 
         row = self.model.rowCount()
         if not self.model.insertRow(row):
@@ -195,8 +439,12 @@ class BaseService:
         # --- Handle created_at and updated_at if None in payload ---
         self._fill_row_from_payload(row, payload=payload)
 
+        # submitAll() re-selects the model when it succeeds.
         if self.model.submitAll():
-            self.model.select()
+            query = QSqlQuery(self._db)
+            query.exec("SELECT last_insert_rowid()")
+            inserted = [query.value(0)] if query.next() else []
+            self._notify_written(self._changes(inserted=inserted), model_updated=True)
             return True
         else:
             error_msg = f"[{self.__class__.__name__}.create] Failed to submit changes to database. Error: {self.model.lastError().text()}. => return False"
@@ -205,7 +453,8 @@ class BaseService:
             return False
 
     def read(self, record_id: int) -> Optional[Any]:
-        """Reads a record by ID using the model's find method.
+        """Reads a record by ID from the model if the row is already loaded,
+        otherwise with an indexed SQL lookup (the lazy model is not paged).
         Returns an instance of DATA_TYPE or None if not found."""
         if self.DATA_TYPE is None:
             info_msg = f"[{self.__class__.__name__}.read] DATA_TYPE is not set. Cannot read. => return None"
@@ -217,14 +466,11 @@ class BaseService:
             )
             print(info_msg)
             return None
-        row = self.model.get_row_by_id(record_id)
-        if row != -1:
-            record = self.model.record(row)
-            return self._map_record_to_datatype(record)
-        return None
+        return self._find_by_key("id", record_id)
 
     def read_all(self) -> List[Any]:
-        """Reads all records currently loaded in the model.
+        """Reads all records currently loaded in the model (all rows of the
+        table, with SQL, when called from a worker thread).
         Returns a list of DATA_TYPE instances."""
         if self.DATA_TYPE is None:
             info_msg = f"[{self.__class__.__name__}.read] DATA_TYPE is not set. Cannot read. => return []"
@@ -236,15 +482,164 @@ class BaseService:
             )
             print(info_msg)
             return []
+        if not self._is_model_thread():
+            return [item for batch in self.iter_all() for item in batch]
 
+        self.model.ensure_selected()
+        map_record = self._record_mapper(self.model.record()).map_record
         results: List[Any] = []
         for row in range(self.model.rowCount()):
+            if self.model.is_row_removed(row):
+                continue
             record = self.model.record(row)
-            data_instance = self._map_record_to_datatype(record)
-            if data_instance is not None:
-                results.append(data_instance)
+            try:
+                results.append(map_record(record))
+            except Exception as e:
+                self._report_unmapped_record("read_all", record, e)
         return results
 
+    def count(self) -> int:
+        """Returns the number of records in the table (SELECT COUNT(*))."""
+        if not self._db.isOpen():
+            print(
+                f"[{self.__class__.__name__}.count] Database is not open. => return 0"
+            )
+            return 0
+        query = QSqlQuery(self._db)
+        if not query.exec(f"SELECT COUNT(*) FROM {self.model.tableName()}"):
+            print(
+                f"[{self.__class__.__name__}.count] Query failed: {query.lastError().text()}"
+            )
+            return 0
+        return int(query.value(0)) if query.next() else 0
+
+    def iter_all(self, batch_size: int = 500) -> Iterator[List[Any]]:
+        """Yields all records of the table as lists of DATA_TYPE instances of at
+        most `batch_size` items, read with a forward-only query instead of the
+        model, so callers never hold the whole table in memory."""
+        yield from self.iter_rows(batch_size=batch_size)
+
+    def _select_forward_only(
+        self,
+        method_name: str,
+        columns: Optional[List[str]],
+        where: str,
+        bind_values: Optional[List[Any]],
+        order_by: str = "id",
+    ) -> Optional[QSqlQuery]:
+        """Executes `SELECT columns FROM table [WHERE where] [ORDER BY order_by]`
+        as a forward-only query (rows are not cached by Qt). `where` may hold
+        `?` placeholders for `bind_values`. Returns None on error."""
+        if not self._db.isOpen():
+            print(f"[{self.__class__.__name__}.{method_name}] Database is not open.")
+            return None
+        unknown = [c for c in columns or [] if self.model.fieldIndex(c) == -1]
+        if unknown:
+            print(
+                f"[{self.__class__.__name__}.{method_name}] Unknown column(s) {unknown} in table '{self.model.tableName()}'."
+            )
+            return None
+        sql = f"SELECT {', '.join(columns) if columns else '*'} FROM {self.model.tableName()}"
+        if where:
+            sql += f" WHERE {where}"
+        if order_by:
+            sql += f" ORDER BY {order_by}"
+        query = QSqlQuery(self._db)
+        query.setForwardOnly(True)
+        if not query.prepare(sql):
+            print(
+                f"[{self.__class__.__name__}.{method_name}] Failed to prepare query: {query.lastError().text()}"
+            )
+            return None
+        for value in bind_values or []:
+            query.addBindValue(value)
+        if not query.exec():
+            print(
+                f"[{self.__class__.__name__}.{method_name}] Query failed: {query.lastError().text()}"
+            )
+            return None
+        return query
+
+    def iter_rows(
+        self,
+        columns: Optional[List[str]] = None,
+        where: str = "",
+        bind_values: Optional[List[Any]] = None,
+        batch_size: int = 500,
+        order_by: str = "id",
+    ) -> Iterator[List[Any]]:
+        """
+        Streams the rows of the table (those matching `where`, a WHERE fragment
+        with `?` placeholders for `bind_values`) in lists of at most
+        `batch_size` items, from a forward-only query instead of the model.
+        Without `columns` the items are DATA_TYPE instances; with `columns`
+        they are tuples of those columns' values (None for NULL), so callers
+        needing a few columns skip the dataclasses altogether.
+        """
+        if columns is None and self.DATA_TYPE is None:
+            info_msg = f"[{self.__class__.__name__}.iter_rows] DATA_TYPE is not set. Cannot read."
+            print(info_msg)
+            return
+        query = self._select_forward_only(
+            "iter_rows", columns, where, bind_values, order_by
+        )
+        if query is None:
+            return
+        if columns is None:
+            map_row = self._record_mapper(query.record()).map_query
+        else:
+            indexes = range(len(columns))
+            value, is_null = query.value, query.isNull
+
+            def map_row(_query: QSqlQuery) -> Tuple[Any, ...]:
+                return tuple(None if is_null(i) else value(i) for i in indexes)
+
+        batch: List[Any] = []
+        while query.next():
+            try:
+                batch.append(map_row(query))
+            except Exception as e:
+                self._report_unmapped_record("iter_rows", query.record(), e)
+                continue
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def snapshot_columns(
+        self,
+        columns: List[str],
+        where: str = "",
+        bind_values: Optional[List[Any]] = None,
+        order_by: str = "id",
+    ) -> Dict[str, array]:
+        """
+        Reads numeric `columns` (price, area, structure, id, ...) of the rows
+        matching `where` into one array('d') per column, all in row order:
+        8 bytes a value instead of a float object per value and a dataclass
+        per row. NULL and non-numeric values are NaN. Returns {} on error.
+        """
+        query = self._select_forward_only(
+            "snapshot_columns", columns, where, bind_values, order_by
+        )
+        if query is None:
+            return {}
+        vectors = [array("d") for _ in columns]
+        appends = [(i, vector.append) for i, vector in enumerate(vectors)]
+        value, is_null = query.value, query.isNull
+        nan = math.nan
+        while query.next():
+            for i, append in appends:
+                if is_null(i):
+                    append(nan)
+                    continue
+                try:
+                    append(float(value(i)))
+                except (TypeError, ValueError):
+                    append(nan)
+        return dict(zip(columns, vectors))
+
     def update(self, record_id: Any, payload: Any) -> bool:
         """Updates an existing record by ID from a DATA_TYPE payload using the model.
         Updates only the fields present (not None) in the payload.
@@ -262,6 +657,8 @@ class BaseService:
             info_msg = f"[{self.__class__.__name__}.update] Database is not open. => return False"
             print(info_msg)
             return False
+        if self.DIRECT_SQL:
+            return self._update_direct(record_id, payload)
         row = self.model.get_row_by_id(record_id)
         if row == -1:
             info_msg = f"[{self.__class__.__name__}.update] Record with id {record_id} not found in model. => return False"
@@ -298,7 +695,7 @@ class BaseService:
                         print(warning_msg)
 
         if fields_updated_count > 0 and self.model.submitAll():
-            self.model.select()
+            self._notify_written(self._changes(updated=[record_id]), model_updated=True)
             return True
         elif fields_updated_count == 0:
             info_msg = f"[{self.__class__.__name__}.update] No fields provided in payload to update for id: {record_id}."
@@ -309,6 +706,81 @@ class BaseService:
             self.model.revertAll()
             return False
 
+    def bulk_update(self, record_ids: List[Any], **values: Any) -> bool:
+        """
+        Sets the same column values on every record of `record_ids` with one
+        `UPDATE ... WHERE id IN (...)` per chunk of ids, in a single
+        transaction, followed by one change notification. updated_at is set
+        to now unless given. Returns True if at least one record was updated.
+        """
+        if not record_ids or not values:
+            print(
+                f"[{self.__class__.__name__}.bulk_update] No record IDs or values provided."
+            )
+            return False
+        unknown = [
+            column
+            for column in values
+            if column == "id" or column not in self._column_names
+        ]
+        if unknown:
+            print(
+                f"[{self.__class__.__name__}.bulk_update] Invalid columns: {unknown}. => return False"
+            )
+            return False
+        if not self._db.isOpen():
+            print(
+                f"[{self.__class__.__name__}.bulk_update] Database is not open. => return False"
+            )
+            return False
+        if "updated_at" in self._column_names and "updated_at" not in values:
+            values["updated_at"] = str(datetime.now())
+        assignments = ", ".join(f"{column} = ?" for column in values)
+        return self._bulk_exec(
+            "bulk_update",
+            f"UPDATE {self.model.tableName()} SET {assignments} WHERE id IN ({{}})",
+            list(values.values()),
+            record_ids,
+        )
+
+    def _bulk_exec(
+        self,
+        method_name: str,
+        sql_template: str,
+        bind_values: List[Any],
+        record_ids: List[Any],
+        chunk_size: int = 500,
+    ) -> bool:
+        """Runs `sql_template` (its `{}` replaced by the id placeholders) for
+        `record_ids` in chunks inside one transaction, then notifies the
+        updated ids once."""
+        record_ids = list(dict.fromkeys(record_ids))
+        updated_count = 0
+        try:
+            with transaction(self._db):
+                for start in range(0, len(record_ids), chunk_size):
+                    chunk = record_ids[start : start + chunk_size]
+                    query = self._exec_prepared(
+                        sql_template.format(", ".join("?" for _ in chunk)),
+                        bind_values + chunk,
+                    )
+                    if query is None:
+                        raise RuntimeError(f"Failed to update ids {chunk}.")
+                    updated_count += query.numRowsAffected()
+        except Exception as e:
+            print(f"[{self.__class__.__name__}.{method_name}] Transaction failed: {e}")
+            return False
+        if updated_count == 0:
+            print(
+                f"[{self.__class__.__name__}.{method_name}] No record updated for ids {record_ids}."
+            )
+            return False
+        print(
+            f"INFO: [{self.__class__.__name__}.{method_name}] Updated {updated_count} record(s)."
+        )
+        self._notify_written(self._changes(updated=record_ids))
+        return True
+
     def delete(self, record_id: Any) -> bool:
         """Deletes a single record by ID using the model.
         Returns True on success, False on failure."""
@@ -316,6 +788,8 @@ class BaseService:
             info_msg = f"[{self.__class__.__name__}.delete] Database is not open. => return False"
             print(info_msg)
             return False
+        if self.DIRECT_SQL:
+            return self._delete_direct([record_id])
         row = self.model.get_row_by_id(record_id)
         if row == -1:
             info_msg = f"[{self.__class__.__name__}.delete] Record with id {record_id} not found in model for deletion."
@@ -326,7 +800,7 @@ class BaseService:
             print(info_msg)
             return False
         if self.model.submitAll():
-            self.model.select()
+            self._notify_written(self._changes(deleted=[record_id]), model_updated=True)
             return True
         else:
             info_msg = f"[{self.__class__.__name__}.delete] Failed to submit deletion. Error: {self.model.lastError().text()}"
@@ -347,12 +821,14 @@ class BaseService:
             )
             print(info_msg)
             return False
+        if self.DIRECT_SQL:
+            return self._delete_direct(record_ids)
         rows_to_delete = sorted(
-            [
-                self.model.get_row_by_id(db_id)
-                for db_id in record_ids
-                if self.model.get_row_by_id(db_id) != -1
-            ],
+            {
+                row
+                for row in (self.model.get_row_by_id(db_id) for db_id in record_ids)
+                if row != -1
+            },
             reverse=True,
         )
         if not rows_to_delete:
@@ -370,7 +846,9 @@ class BaseService:
                     error_msg = f"[{self.__class__.__name__}.delete_multiple] Failed to submit deletions. Error: {self.model.lastError().text()}"
                     print(error_msg)
                     raise RuntimeError(error_msg)
-            self.model.select()
+            self._notify_written(
+                self._changes(deleted=list(record_ids)), model_updated=True
+            )
             return True
         except Exception as e:
             exception_msg = (
@@ -383,10 +861,13 @@ class BaseService:
 
     def import_data(self, payload: List[Any]) -> bool:
         """
-        Imports multiple records from a list of DATA_TYPE payloads using the model
-        within a transaction.
+        Imports multiple records from a list of DATA_TYPE payloads with one
+        prepared INSERT executed in batch (QSqlQuery.execBatch) inside a
+        single transaction. The model buffer is bypassed and the model is
+        refreshed once at the end.
         Returns True on success (all imported), False on failure (rollback).
         Automatically sets created_at and updated_at if they exist as columns.
+        Throughput is stored in self.last_import_stats.
         """
         if self.DATA_TYPE is None:
             print(
@@ -411,125 +892,106 @@ class BaseService:
             )
             return False
         try:
-            # --- SỬA LỖI QUAN TRỌNG: Đồng bộ hóa QSqlTableModel trước khi chèn hàng loạt ---
-            # Gọi select() ở đây đảm bảo bộ nhớ đệm nội bộ của model được đồng bộ
-            # với trạng thái thực tế của cơ sở dữ liệu, có thể ngăn insertRow bị lỗi
-            # một cách khó hiểu sau vài lần chèn, hoặc nếu có các thay đổi/lỗi chưa được commit.
-            self.model.select()
-
-            # --- Gỡ lỗi bổ sung / Xác thực ---
-            # if not self.model.insertRow():
-            #     error_msg = f"[{self.__class__.__name__}.import_data] QSqlTableModel không thể chèn hàng. Kiểm tra quyền của bảng hoặc trạng thái model. Lỗi cuối cùng: {self.model.lastError().text()}"
-            #     print(f"ERROR: {error_msg}")
-            #     return False
+            self.import_batches([payload])
+        except Exception as e:
+            print(
+                f"ERROR: [{self.__class__.__name__}.import_data] Giao dịch nhập thất bại: {e}"
+            )
+            return False
+        return True
 
-            with transaction(self._db):
-                for i, record_instance in enumerate(payload):
-                    # Chuẩn bị dữ liệu để chèn (xử lý ID và dấu thời gian)
+    def import_batches(self, batches: Iterable[List[Any]]) -> int:
+        """
+        Imports the DATA_TYPE lists yielded by `batches` inside ONE transaction,
+        one execBatch per list, so a streamed import only holds a single batch
+        in memory and is still all-or-nothing.
+        Any error, including one raised by the `batches` iterator itself (bad
+        input, a cancelled job), rolls back every batch and is re-raised.
+        Returns the number of imported rows; throughput is stored in
+        self.last_import_stats.
+        """
+        self.last_import_stats = None
+        if self.DATA_TYPE is None:
+            raise RuntimeError(f"{self.__class__.__name__}.DATA_TYPE is not set.")
+        start_time = time.perf_counter()
+        current_time_str = str(datetime.now())
+        dataclass_field_names = {f.name for f in fields(self.DATA_TYPE)}
+        # Column layout is resolved once for the whole import, not per item.
+        columns = [
+            column
+            for column in self._column_names
+            if column != "id" and column in dataclass_field_names
+        ]
+        sql = (
+            f"INSERT INTO {self.model.tableName()} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' for _ in columns)})"
+        )
+        imported = 0
+        with transaction(self._db):
+            for payload in batches:
+                if not all(isinstance(item, self.DATA_TYPE) for item in payload):
+                    raise TypeError(
+                        f"Expected a list of {self.DATA_TYPE.__name__} instances."
+                    )
+                if not payload:
+                    continue
+                column_values: Dict[str, List[Any]] = {column: [] for column in columns}
+                for record_instance in payload:
                     # Đối với bản ghi mới, ID nên là None cho các cột tự động tăng
                     if hasattr(record_instance, "id"):
                         record_instance.id = None
-
-                    # Xử lý dấu thời gian (created_at và updated_at) nếu chúng tồn tại trong dataclass
-                    current_time_str = str(
-                        datetime.now()
-                    )  # Lấy dấu thời gian hiện tại dưới dạng chuỗi
-
-                    if (
-                        hasattr(record_instance, "created_at")
-                        and self.model.record().indexOf("created_at") != -1
-                    ):
-                        # Chỉ đặt created_at nếu nó hiện là None (đối với bản ghi mới)
-                        if record_instance.created_at is None:
-                            record_instance.created_at = current_time_str
                     if (
-                        hasattr(record_instance, "updated_at")
-                        and self.model.record().indexOf("updated_at") != -1
+                        "created_at" in column_values
+                        and record_instance.created_at is None
                     ):
-                        # Luôn cập nhật updated_at khi nhập
+                        record_instance.created_at = current_time_str
+                    if "updated_at" in column_values:
                         record_instance.updated_at = current_time_str
+                    for column in columns:
+                        column_values[column].append(getattr(record_instance, column))
 
-                    # Chèn một hàng trống mới vào bộ nhớ đệm của model
-                    # rowCount() cung cấp chỉ mục nơi một hàng mới sẽ được thêm vào.
-                    row_index_for_new_item = self.model.rowCount()
-
-                    print(
-                        f"DEBUG: [{self.__class__.__name__}.import_data] Item {i+1}: Đang cố gắng chèn hàng tại chỉ mục {row_index_for_new_item}..."
-                    )  # Thêm debug
-
-                    if not self.model.insertRow(row_index_for_new_item):
-                        error_text = self.model.lastError().text()
-                        error_msg = (
-                            f"[{self.__class__.__name__}.import_data] Thất bại khi chèn hàng {row_index_for_new_item} "
-                            f"vào bộ nhớ đệm của model cho item {i+1} (PID: {getattr(record_instance, 'pid', 'N/A')}). "
-                            f"Lỗi Model: {error_text if error_text else 'Không có thông báo lỗi cụ thể từ model.'}"
-                        )
-                        print(f"ERROR: {error_msg}")
-                        raise RuntimeError(error_msg)
-
-                    # Điền hàng vừa chèn vào bộ nhớ đệm của model bằng dữ liệu từ payload
-                    self._fill_row_from_payload(row_index_for_new_item, record_instance)
-                    print(
-                        f"DEBUG: [{self.__class__.__name__}.import_data] Item {i+1}: Hàng {row_index_for_new_item} đã được điền thành công trong bộ nhớ đệm."
-                    )  # Thêm debug
-
-                # --- Gửi tất cả các thay đổi đã đệm vào cơ sở dữ liệu sau khi tất cả các hàng được chèn ---
-                print(
-                    f"DEBUG: [{self.__class__.__name__}.import_data] Đang cố gắng submit tất cả {len(payload)} hàng đã đệm..."
-                )  # Thêm debug
-                if not self.model.submitAll():
-                    error_text = self.model.lastError().text()
-                    error_msg = (
-                        f"[{self.__class__.__name__}.import_data] Thất bại khi submit tất cả {len(payload)} "
-                        f"các lần chèn vào cơ sở dữ liệu. Lỗi Cơ sở dữ liệu: {error_text if error_text else 'Không có thông báo lỗi cụ thể từ model.'}"
+                query = QSqlQuery(self._db)
+                if not query.prepare(sql):
+                    raise RuntimeError(
+                        f"Failed to prepare batch insert: {query.lastError().text()}"
                     )
-                    print(f"ERROR: {error_msg}")
-                    raise RuntimeError(error_msg)
-
-            # Nếu giao dịch thành công, làm mới model để hiển thị dữ liệu mới được thêm từ DB
-            self.model.select()
-            print(
-                f"INFO: [{self.__class__.__name__}.import_data] Đã nhập thành công {len(payload)} bản ghi."
-            )
-            return True
-
-        except (
-            RuntimeError
-        ) as e:  # Bắt RuntimeError cụ thể từ các lần raise rõ ràng của chúng ta
-            print(
-                f"ERROR: [{self.__class__.__name__}.import_data] Giao dịch nhập thất bại: {e}"
-            )
-            self.model.revertAll()  # Hoàn tác mọi thay đổi đang chờ xử lý trong bộ nhớ đệm của model
-            self.model.select()  # Làm mới model từ DB để xóa mọi trạng thái lỗi
-            return False
-        except (
-            Exception
-        ) as e:  # Bắt bất kỳ ngoại lệ không mong đợi nào khác trong quá trình nhập
-            print(
-                f"CRITICAL ERROR: [{self.__class__.__name__}.import_data] Đã xảy ra lỗi không mong đợi: {e}",
-                file=sys.stderr,
-            )  # In ra stderr
-            self.model.revertAll()  # Hoàn tác mọi thay đổi đang chờ xử lý
-            self.model.select()  # Làm mới model
-            return False
+                for column in columns:
+                    query.addBindValue(column_values[column])
+                if not query.execBatch():
+                    raise RuntimeError(
+                        f"Thất bại khi chèn {len(payload)} bản ghi. Lỗi Cơ sở dữ liệu: {query.lastError().text()}"
+                    )
+                imported += len(payload)
+
+        if not imported:
+            return 0
+        self._notify_written(self._changes(reset=True))
+        elapsed = time.perf_counter() - start_time
+        rows_per_sec = imported / elapsed if elapsed > 0 else float(imported)
+        self.last_import_stats = {
+            "rows": imported,
+            "seconds": elapsed,
+            "rows_per_sec": rows_per_sec,
+        }
+        print(
+            f"INFO: [{self.__class__.__name__}.import_batches] Đã nhập thành công {imported} bản ghi ({elapsed:.3f}s, {rows_per_sec:.0f} rows/s)."
+        )
+        return imported
 
-    def _find_by_model_index(self, find_method_name: str, value: Any) -> Optional[Any]:
-        """Helper to find a single record based on a custom find method in the model.
-        Intended for use by subclasses to implement methods like find_by_uid, find_by_email.
-        find_method_name: The name of the method in the model (e.g., 'find_row_by_uid').
-        value: The value to pass to the model's find method."""
+    def _find_by_key(self, column: str, value: Any) -> Optional[Any]:
+        """Helper to find a single record by an indexed column (id, pid, uid).
+        Intended for use by subclasses to implement methods like find_by_uid.
+        A row the model has already loaded is read from the model (on its
+        thread); otherwise the record is read with `WHERE column = ?`, so a
+        miss never pages the rest of the table into the model."""
 
         if self.DATA_TYPE is None:
-            info_msg = f"[{self.__class__.__name__}._find_one_by_model_index] DATA_TYPE is not set. Cannot find record."
+            info_msg = f"[{self.__class__.__name__}._find_by_key] DATA_TYPE is not set. Cannot find record."
             print(info_msg)
             return None
 
-        find_method = getattr(self.model, find_method_name, None)
-        if find_method is None or not callable(find_method):
-            info_msg = f"[{self.__class__.__name__}._find_one_by_model_index] Error: Model does not have a callable method named '{find_method_name}'."
-            return None
-        row = find_method(value)
-        if row != -1:
-            record = self.model.record(row)
-            return self._map_record_to_datatype(record)
-        return None
+        if self._is_model_thread():
+            row = self.model.find_row_by_key(column, value, fetch_more=False)
+            if row != -1:
+                return self._map_record_to_datatype(self.model.record(row))
+        return self._read_by_column(column, [value]).get(value)
@@ -0,0 +1,179 @@
+# src/services/db_job_runner.py
+import itertools
+import threading
+from typing import Any, Callable, Dict, List
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+from src.database import connections
+from src.models.base_model import BaseModel
+from src.services.base_service import deferred_reloads
+
+
+class JobCancelled(Exception):
+    """Raised by JobContext.check_cancelled() to stop a cancelled job."""
+
+
+class JobContext:
+    """Handed to every job: progress reporting and cancellation checks."""
+
+    def __init__(self, job_id: int, runner: "DbJobRunner"):
+        self.job_id = job_id
+        self._runner = runner
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+
+    def report_progress(self, current: int, total: int, message: str = ""):
+        self._runner.job_progress.emit(self.job_id, current, total, message)
+
+
+class _DbWorker(QObject):
+    """Lives on the DB thread and runs the queued jobs one after the other."""
+
+    run_requested = pyqtSignal(object, object, tuple, dict)
+
+    def __init__(self, runner: "DbJobRunner", connection_names: List[str]):
+        super().__init__()
+        self._runner = runner
+        self._connection_names = connection_names
+        self.run_requested.connect(self._run)
+
+    @pyqtSlot()
+    def open_connections(self):
+        # The thread's clones are opened up front instead of by the first job;
+        # the connection pool releases them when the thread finishes.
+        for name in self._connection_names:
+            connections.database(name)
+
+    @pyqtSlot(object, object, tuple, dict)
+    def _run(self, context: JobContext, fn: Callable, args: tuple, kwargs: dict):
+        runner = self._runner
+        try:
+            if context.is_cancelled():
+                runner.job_cancelled.emit(context.job_id)
+                return
+            runner.job_started.emit(context.job_id)
+            with deferred_reloads() as pending_reloads:
+                try:
+                    result = fn(context, *args, **kwargs)
+                except JobCancelled:
+                    self._after_job(pending_reloads)
+                    runner.job_cancelled.emit(context.job_id)
+                    return
+                except Exception as e:
+                    print(
+                        f"[{self.__class__.__name__}._run] Job {context.job_id} failed: {e}"
+                    )
+                    self._after_job(pending_reloads)
+                    runner.job_failed.emit(context.job_id, str(e))
+                    return
+                self._after_job(pending_reloads)
+            if context.is_cancelled():
+                runner.job_cancelled.emit(context.job_id)
+            else:
+                runner.job_finished.emit(context.job_id, result)
+        finally:
+            runner._forget(context.job_id)
+
+    def _after_job(self, pending_reloads: set):
+        # A job that failed or was cancelled half way may have left a
+        # transaction open on the thread's clones, holding SQLite's write lock
+        # against every other connection. The models are reloaded once per
+        # job, before the job's own signal reaches the GUI thread.
+        connections.reset_thread_connections()
+        if pending_reloads:
+            self._runner.reload_requested.emit(sorted(pending_reloads))
+
+
+class DbJobRunner(QObject):
+    """
+    Runs service operations on a dedicated DB thread, so long imports and
+    exports do not freeze the window.
+
+    The thread gets its own clone of each named connection from the
+    connection pool (src.database.connections), which BaseService uses
+    there. The models written by a job are reloaded once, on the GUI thread,
+    when it ends, and a transaction the job left open is rolled back. Jobs must
+    stick to the SQL paths of the services (read/read_all/iter_all/count,
+    direct-SQL create/update/delete, import_data): QSqlTableModel buffers
+    can only be used on the GUI thread.
+
+    A job is `fn(context, *args, **kwargs)`; jobs run one at a time in
+    submission order. Results come back through the signals below.
+    """
+
+    job_started = pyqtSignal(int)
+    job_progress = pyqtSignal(int, int, int, str)
+    job_finished = pyqtSignal(int, object)
+    job_failed = pyqtSignal(int, str)
+    job_cancelled = pyqtSignal(int)
+    # Connection names whose models are reloaded after a job wrote to them.
+    reload_requested = pyqtSignal(list)
+
+    def __init__(self, connection_names: List[str], parent=None):
+        super().__init__(parent)
+        self.reload_requested.connect(self._reload_connections)
+        self._job_ids = itertools.count(1)
+        self._contexts: Dict[int, JobContext] = {}
+        self._lock = threading.Lock()
+        self._thread = QThread(self)
+        self._thread.setObjectName("db_thread")
+        self._worker = _DbWorker(self, connection_names)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.open_connections)
+        self._thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> int:
+        """Queues `fn(context, *args, **kwargs)` and returns the job id."""
+        job_id = next(self._job_ids)
+        context = JobContext(job_id, self)
+        with self._lock:
+            self._contexts[job_id] = context
+        self._worker.run_requested.emit(context, fn, args, kwargs)
+        return job_id
+
+    def cancel(self, job_id: int) -> bool:
+        """Asks a queued or running job to stop. Running jobs stop at their
+        next check_cancelled()."""
+        with self._lock:
+            context = self._contexts.get(job_id)
+        if context is None:
+            return False
+        context.cancel()
+        return True
+
+    def cancel_all(self):
+        with self._lock:
+            contexts = list(self._contexts.values())
+        for context in contexts:
+            context.cancel()
+
+    def has_pending_jobs(self) -> bool:
+        with self._lock:
+            return bool(self._contexts)
+
+    def shutdown(self, timeout_ms: int = 5000):
+        """Cancels the jobs, stops the thread once the running job returns and
+        closes its connections. Queued jobs are dropped."""
+        if not self._thread.isRunning():
+            return
+        self.cancel_all()
+        self._thread.quit()
+        self._thread.wait(timeout_ms)
+
+    @pyqtSlot(list)
+    def _reload_connections(self, connection_names: List[str]):
+        for connection_name in connection_names:
+            BaseModel.reload_connection(connection_name)
+
+    def _forget(self, job_id: int):
+        with self._lock:
+            self._contexts.pop(job_id, None)
@@ -0,0 +1,286 @@
+# src/services/image_ingest.py
+import os
+import time
+import shutil
+import hashlib
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Optional
+
+from PyQt6.QtCore import QBuffer, QByteArray, QIODevice, QObject, Qt, pyqtSignal
+from PyQt6.QtGui import QImageIOHandler, QImageReader, QImageWriter
+
+from src.my_constants import IMAGE_JPEG_QUALITY, IMAGE_MAX_DIMENSION
+from src.my_types import IngestedImageType
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_ingest_pool() -> ProcessPoolExecutor:
+    """Process pool shared by every ingestion, started on first use. Workers
+    are spawned (not forked) so they never inherit the GUI's Qt state."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=max(1, min(4, (os.cpu_count() or 2) - 1)),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _pool
+
+
+def ingest_image(
+    source_path: str,
+    staging_dir: str,
+    max_dimension: int = IMAGE_MAX_DIMENSION,
+    quality: int = IMAGE_JPEG_QUALITY,
+) -> IngestedImageType:
+    """
+    Normalizes one image into `staging_dir` (runs in a worker process):
+    applies the EXIF orientation, downscales it to fit `max_dimension`,
+    re-encodes it (JPEG, or PNG when it has transparency) without any
+    metadata, and hashes the result. When the image needs neither a downscale
+    nor a rotation and the source is a JPEG or PNG, the source with its
+    metadata stripped is kept instead if it is smaller than the re-encoded
+    image. Animated images and images Qt cannot decode are staged unchanged.
+    The staged file is `<sha256><ext>`.
+    """
+    start_time = time.perf_counter()
+    if not os.path.isfile(source_path):
+        return IngestedImageType(
+            source_path=source_path,
+            path=None,
+            sha256=None,
+            original_size=0,
+            size=0,
+            width=0,
+            height=0,
+            seconds=0.0,
+            error="File not found.",
+        )
+    original_size = os.path.getsize(source_path)
+
+    reader = QImageReader(source_path)
+    reader.setAutoTransform(True)
+    # Queried before read(), which clears the format.
+    source_format = bytes(reader.format())
+    rotated = (
+        reader.transformation() != QImageIOHandler.Transformation.TransformationNone
+    )
+    image = None
+    error = None
+    if reader.supportsAnimation() and reader.imageCount() > 1:
+        error = "Animated image kept unchanged."
+    else:
+        image = reader.read()
+        if image.isNull():
+            error = reader.errorString()
+            image = None
+
+    if image is None:
+        with open(source_path, "rb") as f:
+            data = f.read()
+        ext = os.path.splitext(source_path)[1].lower()
+        size = reader.size()
+        width, height = size.width(), size.height()
+    else:
+        downscaled = max(image.width(), image.height()) > max_dimension
+        if downscaled:
+            image = image.scaled(
+                max_dimension,
+                max_dimension,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+        image_format = b"png" if image.hasAlphaChannel() else b"jpg"
+        ext = "." + image_format.decode()
+        buffer_data = QByteArray()
+        buffer = QBuffer(buffer_data)
+        buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+        writer = QImageWriter(buffer, image_format)
+        if image_format == b"jpg":
+            writer.setQuality(quality)
+            writer.setOptimizedWrite(True)
+        if not writer.write(image):
+            raise RuntimeError(writer.errorString())
+        buffer.close()
+        data = bytes(buffer_data)
+        width, height = image.width(), image.height()
+
+        stripper = _METADATA_STRIPPERS.get(source_format)
+        if stripper is not None and not downscaled and not rotated:
+            # Re-encoding a small, already compressed image can make it bigger.
+            with open(source_path, "rb") as f:
+                stripped = stripper(f.read())
+            if stripped is not None and len(stripped) <= len(data):
+                data = stripped
+                ext = _FORMAT_EXTENSIONS[source_format]
+
+    digest = hashlib.sha256(data).hexdigest()
+    staged_path = os.path.join(staging_dir, digest + ext)
+    if not os.path.exists(staged_path):
+        tmp_path = f"{staged_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, staged_path)
+    return IngestedImageType(
+        source_path=source_path,
+        path=staged_path,
+        sha256=digest,
+        original_size=original_size,
+        size=len(data),
+        width=width,
+        height=height,
+        seconds=time.perf_counter() - start_time,
+        error=error,
+    )
+
+
+# JPEG APPn markers dropped by _strip_jpeg_metadata: APP1 (EXIF, XMP), APP13
+# (IPTC) and the other vendor segments. APP0 (JFIF), APP2 (ICC profile) and
+# APP14 (Adobe color transform) change how the image decodes and are kept.
+_JPEG_KEPT_APP_MARKERS = frozenset([0xE0, 0xE2, 0xEE])
+_JPEG_COMMENT_MARKER = 0xFE
+_JPEG_START_OF_SCAN = 0xDA
+# PNG ancillary chunks holding metadata only.
+_PNG_METADATA_CHUNKS = frozenset([b"tEXt", b"zTXt", b"iTXt", b"eXIf", b"tIME"])
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _strip_jpeg_metadata(data: bytes) -> Optional[bytes]:
+    """`data` without its EXIF/XMP/IPTC segments and comments, or None when
+    the JPEG cannot be parsed. The compressed image data is copied as is."""
+    if data[:2] != b"\xff\xd8":
+        return None
+    parts = [data[:2]]
+    pos = 2
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:  # Fill byte before a marker.
+            pos += 1
+            continue
+        if marker == _JPEG_START_OF_SCAN:
+            parts.append(data[pos:])
+            return b"".join(parts)
+        length = int.from_bytes(data[pos + 2 : pos + 4], "big")
+        end = pos + 2 + length
+        if length < 2 or end > len(data):
+            return None
+        is_app = 0xE0 <= marker <= 0xEF
+        if not (
+            (is_app and marker not in _JPEG_KEPT_APP_MARKERS)
+            or marker == _JPEG_COMMENT_MARKER
+        ):
+            parts.append(data[pos:end])
+        pos = end
+    return None
+
+
+def _strip_png_metadata(data: bytes) -> Optional[bytes]:
+    """`data` without its text, EXIF and time chunks, or None when the PNG
+    cannot be parsed. Chunks are copied whole, CRCs included."""
+    if not data.startswith(_PNG_SIGNATURE):
+        return None
+    parts = [_PNG_SIGNATURE]
+    pos = len(_PNG_SIGNATURE)
+    while pos + 12 <= len(data):
+        length = int.from_bytes(data[pos : pos + 4], "big")
+        chunk_type = data[pos + 4 : pos + 8]
+        end = pos + 12 + length
+        if end > len(data):
+            return None
+        if chunk_type not in _PNG_METADATA_CHUNKS:
+            parts.append(data[pos:end])
+        pos = end
+        if chunk_type == b"IEND":
+            return b"".join(parts)
+    return None
+
+
+# Qt image format -> metadata stripper / extension of the stripped source.
+_METADATA_STRIPPERS = {b"jpeg": _strip_jpeg_metadata, b"png": _strip_png_metadata}
+_FORMAT_EXTENSIONS = {b"jpeg": ".jpg", b"png": ".png"}
+
+
+class ImageIngestor(QObject):
+    """
+    Runs ingest_image() for a list of images on the shared process pool.
+
+    image_ingested: Emits (index, IngestedImageType) as each image completes.
+    finished_signal: Emits the IngestedImageType list, in input order, once
+                     every image is done.
+    """
+
+    image_ingested = pyqtSignal(int, object)
+    finished_signal = pyqtSignal(list)
+    # Emitted from the pool's callback thread, delivered on this object's thread.
+    _image_done = pyqtSignal(int, object)
+
+    def __init__(
+        self,
+        max_dimension: int = IMAGE_MAX_DIMENSION,
+        quality: int = IMAGE_JPEG_QUALITY,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.max_dimension = max_dimension
+        self.quality = quality
+        self.results: List[Optional[IngestedImageType]] = []
+        self._remaining = 0
+        self.completed = 0
+        self._image_done.connect(self._on_image_done)
+
+    def start(self, image_paths: List[str], staging_dir: str):
+        self.results = [None] * len(image_paths)
+        self._remaining = len(image_paths)
+        self.completed = 0
+        if not image_paths:
+            self.finished_signal.emit([])
+            return
+        pool = get_ingest_pool()
+        for idx, image_path in enumerate(image_paths):
+            future = pool.submit(
+                ingest_image,
+                image_path,
+                staging_dir,
+                self.max_dimension,
+                self.quality,
+            )
+            future.add_done_callback(
+                lambda f, idx=idx, image_path=image_path: self._emit_done(
+                    idx, image_path, staging_dir, f
+                )
+            )
+
+    def _emit_done(self, idx: int, image_path: str, staging_dir: str, future: Future):
+        try:
+            result = future.result()
+        except Exception as e:
+            result = self._stage_original(image_path, staging_dir, str(e))
+        self._image_done.emit(idx, result)
+
+    @staticmethod
+    def _stage_original(
+        image_path: str, staging_dir: str, error: str
+    ) -> IngestedImageType:
+        """Fallback when the worker failed: the original file is staged as is."""
+        if not os.path.isfile(image_path):
+            return IngestedImageType(
+                image_path, None, None, 0, 0, 0, 0, 0.0, error=error
+            )
+        ext = os.path.splitext(image_path)[1].lower()
+        staged_path = os.path.join(staging_dir, os.urandom(8).hex() + ext)
+        shutil.copyfile(image_path, staged_path)
+        size = os.path.getsize(image_path)
+        return IngestedImageType(
+            image_path, staged_path, None, size, size, 0, 0, 0.0, error=error
+        )
+
+    def _on_image_done(self, idx: int, result: IngestedImageType):
+        self.results[idx] = result
+        self._remaining -= 1
+        self.completed += 1
+        self.image_ingested.emit(idx, result)
+        if self._remaining == 0:
+            self.finished_signal.emit(list(self.results))
@@ -0,0 +1,370 @@
+# src/services/image_store.py
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import threading
+from stat import S_IRGRP, S_IROTH, S_IRUSR, S_IWRITE
+from typing import Dict, List, Optional, Set, Tuple
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+BLOB_DIR_NAME = ".blobs"
+MANIFEST_NAME = "manifest.json"
+# ioctl request number of FICLONE (Linux reflink: btrfs, xfs, ...).
+_FICLONE = 0x40049409
+# Mode of the blobs, and so of the product files hardlinked to them.
+_READ_ONLY = S_IRUSR | S_IRGRP | S_IROTH
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _reflink(src: str, dest: str) -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    try:
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdest:
+            fcntl.ioctl(fdest.fileno(), _FICLONE, fsrc.fileno())
+        return True
+    except OSError:
+        if os.path.exists(dest):
+            os.remove(dest)
+        return False
+
+
+def _force_remove(path: str):
+    """os.remove() that also removes read-only files on Windows."""
+    try:
+        os.remove(path)
+    except PermissionError:
+        os.chmod(path, S_IWRITE)
+        os.remove(path)
+
+
+class ImageStore:
+    """
+    Content-addressed store for product images under one image container.
+
+    Every image is kept once in `<container>/.blobs/<sha[:2]>/<sha><ext>`.
+    Product directories (`<container>/<pid>/`) keep their usual file names,
+    but the files are hardlinks to the blobs (reflinks or plain copies where
+    hardlinks are not supported), and a manifest.json listing the blob hash
+    of every file. Blobs that no manifest references any more are removed by
+    collect_garbage().
+
+    A hardlinked product file is the blob itself: editing it in place would
+    change the image of every product sharing the blob and break their
+    manifest hashes. Blobs are therefore read-only, and so are the product
+    files linked to them; replace a product's images through the store
+    instead. Reflinked and copied files are independent and stay writable.
+    """
+
+    # Blobs written or reused more recently than this are never collected, so
+    # a product being created while the collector runs keeps its blobs.
+    GC_GRACE_SECONDS = 3600
+
+    def __init__(self, container: str):
+        self.container = os.path.abspath(container)
+        self.blob_dir = os.path.join(self.container, BLOB_DIR_NAME)
+        self._lock = threading.Lock()
+        self._gc_running = False
+
+    # ========================================================================
+    # Blobs
+    # ========================================================================
+    def blob_path(self, digest: str, ext: str) -> str:
+        return os.path.join(self.blob_dir, digest[:2], digest + ext.lower())
+
+    def put(
+        self, src_path: str, digest: Optional[str] = None, move: bool = False
+    ) -> Tuple[str, str]:
+        """Stores the content of `src_path` (unless already stored) and returns
+        (digest, blob_path). With `move`, the source file is moved into the
+        store (or removed if its content is already stored). Must be called
+        with the store lock held."""
+        digest = digest or hash_file(src_path)
+        blob_path = self.blob_path(digest, os.path.splitext(src_path)[1])
+        if os.path.isfile(blob_path):
+            # Refresh mtime so the garbage collector's grace period applies.
+            os.utime(blob_path)
+            # Blobs stored before they were made read-only.
+            os.chmod(blob_path, _READ_ONLY)
+            if move and os.path.exists(src_path):
+                os.remove(src_path)
+            return digest, blob_path
+        os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+        if move:
+            os.replace(src_path, blob_path)
+        else:
+            tmp_path = f"{blob_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            shutil.copyfile(src_path, tmp_path)
+            os.replace(tmp_path, blob_path)
+        os.chmod(blob_path, _READ_ONLY)
+        return digest, blob_path
+
+    def materialize(self, blob_path: str, dest_path: str) -> str:
+        """Places the blob at `dest_path`: hardlink, reflink or copy, in that
+        order of preference. Returns the method used."""
+        if os.path.lexists(dest_path):
+            self.remove_product_file(dest_path)
+        try:
+            os.link(blob_path, dest_path)
+            return "hardlink"
+        except OSError:
+            pass
+        if _reflink(blob_path, dest_path):
+            return "reflink"
+        shutil.copyfile(blob_path, dest_path)
+        return "copy"
+
+    # ========================================================================
+    # Products
+    # ========================================================================
+    def store_product_images(
+        self,
+        pid: str,
+        image_paths: List[str],
+        base_name: Optional[str] = None,
+        digests: Optional[List[Optional[str]]] = None,
+        move: bool = False,
+    ) -> str:
+        """
+        Stores the images of a product and returns its directory. Files are
+        named `<base_name>_<n><ext>` as before; paths that are not files are
+        skipped (their number is kept). `digests` may give the already known
+        hash of each path, `move` consumes the source files (staged images).
+        """
+        product_dir = os.path.join(self.container, pid)
+        os.makedirs(product_dir, exist_ok=True)
+        base_name = base_name or pid or "img"
+        entries = []
+        for idx, image_path in enumerate(image_paths):
+            ext = os.path.splitext(image_path)[1]
+            digest = digests[idx] if digests else None
+            # A moved duplicate is gone from the staging area but already stored.
+            stored = digest is not None and os.path.isfile(self.blob_path(digest, ext))
+            if not stored and not os.path.isfile(image_path):
+                continue
+            name = f"{base_name}_{idx+1}{ext}"
+            entries.append(self.add_file(product_dir, name, image_path, digest, move))
+        self.write_manifest(product_dir, pid, entries)
+        return product_dir
+
+    def add_file(
+        self,
+        product_dir: str,
+        name: str,
+        src_path: str,
+        digest: Optional[str] = None,
+        move: bool = False,
+    ) -> Dict:
+        """Stores `src_path` and links it into `product_dir` as `name`.
+        Returns its manifest entry."""
+        with self._lock:
+            digest, blob_path = self.put(src_path, digest, move)
+            self.materialize(blob_path, os.path.join(product_dir, name))
+        return {
+            "name": name,
+            "sha256": digest,
+            "size": os.path.getsize(blob_path),
+        }
+
+    def adopt_product_dir(self, product_dir: str) -> int:
+        """Moves the files of a product directory created before the store
+        existed into it. Returns the number of bytes freed by deduplication."""
+        entries = []
+        freed = 0
+        for entry in sorted(os.scandir(product_dir), key=lambda e: e.name):
+            if not entry.is_file() or entry.name == MANIFEST_NAME:
+                continue
+            digest = hash_file(entry.path)
+            already_stored = os.path.isfile(
+                self.blob_path(digest, os.path.splitext(entry.name)[1])
+            )
+            size = entry.stat().st_size
+            entries.append(self.add_file(product_dir, entry.name, entry.path, digest))
+            if already_stored:
+                freed += size
+        self.write_manifest(product_dir, os.path.basename(product_dir), entries)
+        return freed
+
+    def remove_product_file(self, path: str):
+        """Removes a product file. Windows only removes a read-only file once
+        it is made writable, which makes the blob it is linked to (and every
+        other product file of that blob) writable too, so the blob is made
+        read-only again afterwards."""
+        try:
+            os.remove(path)
+            return
+        except PermissionError:
+            pass
+        blob_path = self.blob_path(hash_file(path), os.path.splitext(path)[1])
+        os.chmod(path, S_IWRITE)
+        os.remove(path)
+        if os.path.isfile(blob_path):
+            os.chmod(blob_path, _READ_ONLY)
+
+    def remove_product_dir(self, product_dir: str):
+        """Removes a product directory (see remove_product_file()). The
+        blobs are left to collect_garbage()."""
+        with self._lock:
+            for entry in os.scandir(product_dir):
+                if entry.is_file(follow_symlinks=False):
+                    self.remove_product_file(entry.path)
+        shutil.rmtree(product_dir)
+
+    @staticmethod
+    def write_manifest(product_dir: str, pid: str, entries: List[Dict]):
+        manifest_path = os.path.join(product_dir, MANIFEST_NAME)
+        tmp_path = manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf8") as f:
+            json.dump({"pid": pid, "images": entries}, f, indent=4, ensure_ascii=False)
+        os.replace(tmp_path, manifest_path)
+
+    @staticmethod
+    def read_manifest(product_dir: str) -> Optional[Dict]:
+        manifest_path = os.path.join(product_dir, MANIFEST_NAME)
+        if not os.path.isfile(manifest_path):
+            return None
+        try:
+            with open(manifest_path, "r", encoding="utf8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(
+                f"[ImageStore.read_manifest] Warning: Invalid manifest '{manifest_path}': {e}"
+            )
+            return None
+
+    def new_staging_dir(self) -> str:
+        """Creates a private directory for images waiting to be stored. It is
+        on the container's filesystem, so staged files are moved, not copied."""
+        os.makedirs(self.container, exist_ok=True)
+        return tempfile.mkdtemp(prefix=".staging-", dir=self.container)
+
+    def product_dirs(self) -> List[str]:
+        if not os.path.isdir(self.container):
+            return []
+        return [
+            entry.path
+            for entry in os.scandir(self.container)
+            # Dot directories are the store's own (blobs, staging areas).
+            if entry.is_dir() and not entry.name.startswith(".")
+        ]
+
+    # ========================================================================
+    # Garbage collection
+    # ========================================================================
+    def referenced_digests(self) -> Optional[Set[str]]:
+        """Hashes referenced by any product manifest, or None if a manifest
+        could not be read (the collector then does nothing)."""
+        digests = set()
+        for product_dir in self.product_dirs():
+            if not os.path.isfile(os.path.join(product_dir, MANIFEST_NAME)):
+                continue
+            manifest = self.read_manifest(product_dir)
+            if manifest is None:
+                return None
+            digests.update(image["sha256"] for image in manifest.get("images", []))
+        return digests
+
+    def collect_garbage(self, grace_seconds: Optional[int] = None) -> Tuple[int, int]:
+        """Removes the blobs no product references. Returns (blobs, bytes)."""
+        if grace_seconds is None:
+            grace_seconds = self.GC_GRACE_SECONDS
+        if not os.path.isdir(self.blob_dir):
+            return 0, 0
+        referenced = self.referenced_digests()
+        if referenced is None:
+            print(
+                f"[{self.__class__.__name__}.collect_garbage] Skipped: unreadable manifest in '{self.container}'."
+            )
+            return 0, 0
+        deadline = time.time() - grace_seconds
+        removed = 0
+        freed = 0
+        for bucket in os.scandir(self.blob_dir):
+            if not bucket.is_dir():
+                continue
+            for blob in os.scandir(bucket.path):
+                digest = blob.name.split(".", 1)[0]
+                if digest in referenced:
+                    continue
+                with self._lock:
+                    try:
+                        stat = blob.stat()
+                        if stat.st_mtime > deadline:
+                            continue
+                        _force_remove(blob.path)
+                    except FileNotFoundError:
+                        continue
+                removed += 1
+                # Space is only returned once no product file links the inode.
+                if stat.st_nlink <= 1:
+                    freed += stat.st_size
+        return removed, freed
+
+    def start_garbage_collection(
+        self, threadpool: Optional[QThreadPool] = None
+    ) -> bool:
+        """Runs collect_garbage() on a thread pool. Returns False if a
+        collection of this store is already running."""
+        with self._lock:
+            if self._gc_running:
+                return False
+            self._gc_running = True
+        worker = GarbageCollectWorker(self)
+        worker.signals.finished.connect(self._on_garbage_collected)
+        worker.signals.error_signal.connect(self._on_garbage_collect_error)
+        (threadpool or QThreadPool.globalInstance()).start(worker)
+        return True
+
+    def _on_garbage_collected(self, removed: int, freed: int):
+        self._gc_running = False
+        if removed:
+            print(
+                f"INFO: [{self.__class__.__name__}] Removed {removed} unreferenced image blob(s), {freed / 1024:.1f} KiB freed."
+            )
+
+    def _on_garbage_collect_error(self, error_msg: str):
+        self._gc_running = False
+        print(f"[{self.__class__.__name__}.collect_garbage] Error: {error_msg}")
+
+
+class GarbageCollectWorkerSignals(QObject):
+    """
+    finished: Emits (removed_blobs, freed_bytes) when the collection is done.
+    error_signal: Emits the error message on failure.
+    """
+
+    finished = pyqtSignal(int, int)
+    error_signal = pyqtSignal(str)
+
+
+class GarbageCollectWorker(QRunnable):
+    """Runs ImageStore.collect_garbage() off the GUI thread."""
+
+    def __init__(self, store: ImageStore):
+        super().__init__()
+        self.store = store
+        self.signals = GarbageCollectWorkerSignals()
+        self.setAutoDelete(True)
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            removed, freed = self.store.collect_garbage()
+        except Exception as e:
+            self.signals.error_signal.emit(str(e))
+            return
+        self.signals.finished.emit(removed, freed)
@@ -0,0 +1,280 @@
+# src/services/instrumentation.py
+import os
+import json
+import time
+import inspect
+import threading
+import functools
+from dataclasses import asdict
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Set, Tuple, Type
+
+from PyQt6.QtCore import QTimer
+
+from src.services.base_service import BaseService
+from src.controllers.base_controller import BaseController
+from src.my_types import MethodStatsType
+
+# Upper bounds (ms) of the latency histogram buckets; the last one is open.
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+)
+INSTRUMENTED_BASES: Tuple[type, ...] = (BaseService, BaseController)
+
+# (class, method name) -> original function, while enabled.
+_originals: Dict[Tuple[type, str], Callable] = {}
+# "Class.method" -> stats
+_stats: Dict[str, "_MethodStats"] = {}
+# thread ident -> (id(instance), method name) of the calls being timed, so the
+# super() calls of an overridden method are not counted twice.
+_active_calls: Dict[int, Set[Tuple[int, str]]] = {}
+_lock = threading.Lock()
+_dump_timer: Optional[QTimer] = None
+_dump_path: Optional[str] = None
+
+
+class _MethodStats:
+    __slots__ = ("count", "errors", "total", "min", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, elapsed_ms: float, failed: bool):
+        self.count += 1
+        self.errors += failed
+        self.total += elapsed_ms
+        self.min = min(self.min, elapsed_ms)
+        self.max = max(self.max, elapsed_ms)
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the `fraction` quantile, capped
+        by the slowest call."""
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.buckets):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return min(LATENCY_BUCKETS_MS[index], self.max)
+                break
+        return self.max
+
+
+def _bucket_label(index: int) -> str:
+    if index < len(LATENCY_BUCKETS_MS):
+        return f"<={LATENCY_BUCKETS_MS[index]:g}ms"
+    return f">{LATENCY_BUCKETS_MS[-1]:g}ms"
+
+
+def _record(key: str, elapsed_ms: float, failed: bool):
+    with _lock:
+        stats = _stats.get(key)
+        if stats is None:
+            stats = _stats[key] = _MethodStats()
+        stats.add(elapsed_ms, failed)
+
+
+def _enter(instance, name: str) -> Optional[Tuple[int, str]]:
+    active = _active_calls.setdefault(threading.get_ident(), set())
+    call = (id(instance), name)
+    if call in active:
+        return None
+    active.add(call)
+    return call
+
+
+def _leave(call: Tuple[int, str]):
+    ident = threading.get_ident()
+    active = _active_calls[ident]
+    active.discard(call)
+    if not active:
+        del _active_calls[ident]
+
+
+def _wrap(name: str, function: Callable) -> Callable:
+    if inspect.isgeneratorfunction(function):
+        # Timed from the first to the last item (iter_all and friends).
+        @functools.wraps(function)
+        def generator_wrapper(self, *args, **kwargs):
+            call = _enter(self, name)
+            if call is None:
+                yield from function(self, *args, **kwargs)
+                return
+            failed = True
+            start = time.perf_counter()
+            try:
+                yield from function(self, *args, **kwargs)
+                failed = False
+            finally:
+                _leave(call)
+                _record(
+                    f"{type(self).__name__}.{name}",
+                    (time.perf_counter() - start) * 1000,
+                    failed,
+                )
+
+        return generator_wrapper
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        call = _enter(self, name)
+        if call is None:
+            return function(self, *args, **kwargs)
+        failed = True
+        start = time.perf_counter()
+        try:
+            result = function(self, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            _leave(call)
+            _record(
+                f"{type(self).__name__}.{name}",
+                (time.perf_counter() - start) * 1000,
+                failed,
+            )
+
+    return wrapper
+
+
+def _instrumented_classes() -> List[type]:
+    classes: List[type] = []
+    pending = list(INSTRUMENTED_BASES)
+    while pending:
+        cls = pending.pop()
+        if cls not in classes:
+            classes.append(cls)
+            pending.extend(cls.__subclasses__())
+    return classes
+
+
+def _public_methods(cls: Type) -> List[Tuple[str, Callable]]:
+    return [
+        (name, value)
+        for name, value in vars(cls).items()
+        if not name.startswith("_") and inspect.isfunction(value)
+    ]
+
+
+def enable():
+    """
+    Wraps every public method defined by BaseService, BaseController and
+    their (imported) subclasses with a timer. Calls are keyed by the class
+    of the instance and the method name. Slots connected to signals before
+    enable() keep calling the unwrapped methods.
+    """
+    with _lock:
+        if _originals:
+            return
+        for cls in _instrumented_classes():
+            for name, function in _public_methods(cls):
+                _originals[(cls, name)] = function
+                setattr(cls, name, _wrap(name, function))
+
+
+def disable():
+    """Restores the original methods; disabled instrumentation costs nothing.
+    The collected stats are kept until reset()."""
+    with _lock:
+        for (cls, name), function in _originals.items():
+            setattr(cls, name, function)
+        _originals.clear()
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def reset():
+    with _lock:
+        _stats.clear()
+
+
+def snapshot() -> List[MethodStatsType]:
+    """The stats of every method called so far, slowest in total first."""
+    with _lock:
+        items = list(_stats.items())
+        results = [
+            MethodStatsType(
+                name=key,
+                count=stats.count,
+                errors=stats.errors,
+                total_ms=stats.total,
+                mean_ms=stats.total / stats.count,
+                min_ms=stats.min,
+                max_ms=stats.max,
+                p50_ms=stats.percentile(0.5),
+                p95_ms=stats.percentile(0.95),
+                p99_ms=stats.percentile(0.99),
+                histogram={
+                    _bucket_label(index): n
+                    for index, n in enumerate(stats.buckets)
+                    if n
+                },
+            )
+            for key, stats in items
+        ]
+    return sorted(results, key=lambda item: item.total_ms, reverse=True)
+
+
+def dump(file_path: str) -> bool:
+    """Writes snapshot() to `file_path` as JSON (atomically)."""
+    payload = {
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "enabled": is_enabled(),
+        "methods": [asdict(item) for item in snapshot()],
+    }
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        tmp_path = file_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf8") as f:
+            json.dump(payload, f, indent=4)
+        os.replace(tmp_path, file_path)
+        return True
+    except OSError as e:
+        print(f"[instrumentation.dump] Cannot write '{file_path}': {e}")
+        return False
+
+
+def start_periodic_dump(file_path: str, interval_ms: int = 60_000):
+    """Dumps the stats to `file_path` every `interval_ms` (on the calling
+    thread's event loop, normally the GUI thread) until stop_periodic_dump()."""
+    global _dump_timer, _dump_path
+    stop_periodic_dump(final_dump=False)
+    _dump_path = file_path
+    _dump_timer = QTimer()
+    _dump_timer.setInterval(interval_ms)
+    _dump_timer.timeout.connect(lambda: dump(file_path))
+    _dump_timer.start()
+
+
+def stop_periodic_dump(final_dump: bool = True):
+    global _dump_timer, _dump_path
+    if _dump_timer is None:
+        return
+    _dump_timer.stop()
+    _dump_timer = None
+    if final_dump and _dump_path:
+        dump(_dump_path)
+    _dump_path = None
@@ -0,0 +1,377 @@
+# src/services/listing_payload_builder.py
+import os
+import uuid
+import random
+from typing import Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+from src.services.db_job_runner import DbJobRunner, JobContext
+from src.services.product_service import (
+    RealEstateProductService,
+    RealEstateTemplateService,
+)
+from src.my_types import (
+    BrowserType,
+    RealEstateProductType,
+    SellPayloadType,
+    UserType,
+)
+from src.my_constants import RE_TRANSACTION
+from src.utils.re_template import compile_template, init_footer_content
+
+# (product, title template, description template, image paths)
+ListingJob = Tuple[RealEstateProductType, str, str, List[str]]
+
+
+def render_listing(job: ListingJob) -> SellPayloadType:
+    """Builds the sell payload of one product. Runs on worker threads: it only
+    renders templates, no database or file system access."""
+    product, title_template, description_template, image_paths = job
+    title = compile_template(title_template).render(product).upper()
+    description = compile_template(description_template).render(product)
+    description = title + "\n\n" + description + "\n\n" + init_footer_content(product)
+    return SellPayloadType(
+        title=title[:90], description=description, image_paths=image_paths[:9]
+    )
+
+
+class RenderWorkerSignals(QObject):
+    """
+    result_signal: Emits (batch_index, payloads) when a batch is rendered.
+    error_signal: Emits (batch_index, error_message) on failure.
+    """
+
+    result_signal = pyqtSignal(int, list)
+    error_signal = pyqtSignal(int, str)
+
+
+class RenderWorker(QRunnable):
+    """Renders one batch of listing jobs."""
+
+    def __init__(self, batch_index: int, jobs: List[ListingJob]):
+        super().__init__()
+        self.batch_index = batch_index
+        self.jobs = jobs
+        self.signals = RenderWorkerSignals()
+        self.setAutoDelete(True)
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            payloads = [render_listing(job) for job in self.jobs]
+        except Exception as e:
+            self.signals.error_signal.emit(self.batch_index, str(e))
+            return
+        self.signals.result_signal.emit(self.batch_index, payloads)
+
+
+class ListingPayloadBuilder(QObject):
+    """
+    Builds the BrowserType actions of RobotController.init_actions_async in
+    batch.
+
+    Planning is a job of the DbJobRunner, so it runs on the DB thread with
+    that thread's connections: products referenced by pid are read with one
+    query, random products and templates are drawn per
+    (transaction_type[, category]) group from the services' in-memory
+    samplers, and the image directories are listed (once per directory).
+    Rendering the templates then runs on a thread pool; the render workers
+    share no mutable state. finished_signal is emitted exactly once, with the
+    actions built so far (empty if planning failed or was cancelled).
+    """
+
+    BATCH_SIZE = 50
+
+    progress_signal = pyqtSignal(int, int)
+    finished_signal = pyqtSignal(dict)
+    error_signal = pyqtSignal(str)
+
+    def __init__(
+        self,
+        re_product_service: RealEstateProductService,
+        re_template_service: RealEstateTemplateService,
+        udd_container: str,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self._re_product_service = re_product_service
+        self._re_template_service = re_template_service
+        self._udd_container = udd_container
+        self._image_cache: Dict[str, List[str]] = {}
+        self._browser_actions: Dict[str, List[BrowserType]] = {}
+        self._pending: List[BrowserType] = []
+        self._jobs: List[ListingJob] = []
+        self._remaining_batches = 0
+        self._done_jobs = 0
+        self._job_runner: Optional[DbJobRunner] = None
+        self._plan_job_id: Optional[int] = None
+        self.threadpool = QThreadPool(self)
+
+    def start(
+        self,
+        list_user_data: List[UserType],
+        action_payloads: List,
+        job_runner: Optional[DbJobRunner] = None,
+    ):
+        """Plans the actions on `job_runner`'s DB thread, then renders them on
+        the thread pool. Emits progress_signal per batch and finished_signal
+        with the actions. Without a job runner, planning runs on the calling
+        thread."""
+        if job_runner is None:
+            try:
+                self._plan(list_user_data, action_payloads)
+            except Exception as e:
+                self._on_plan_failed(str(e))
+                return
+            self._render()
+            return
+        self._job_runner = job_runner
+        job_runner.job_finished.connect(self._on_plan_job_finished)
+        job_runner.job_failed.connect(self._on_plan_job_failed)
+        job_runner.job_cancelled.connect(self._on_plan_job_cancelled)
+        # The job writes the plan attributes on the DB thread; they are read
+        # here only once job_finished has been delivered.
+        self._plan_job_id = job_runner.submit(
+            lambda context: self._plan(list_user_data, action_payloads, context)
+        )
+
+    # ========================================================================
+    # Planning job results (GUI thread)
+    # ========================================================================
+    @pyqtSlot(int, object)
+    def _on_plan_job_finished(self, job_id: int, _result):
+        if job_id != self._plan_job_id:
+            return
+        self._release_job_runner()
+        self._render()
+
+    @pyqtSlot(int, str)
+    def _on_plan_job_failed(self, job_id: int, error_msg: str):
+        if job_id != self._plan_job_id:
+            return
+        self._release_job_runner()
+        self._on_plan_failed(error_msg)
+
+    @pyqtSlot(int)
+    def _on_plan_job_cancelled(self, job_id: int):
+        if job_id != self._plan_job_id:
+            return
+        self._release_job_runner()
+        self._on_plan_failed("Cancelled.")
+
+    def _release_job_runner(self):
+        self._job_runner.job_finished.disconnect(self._on_plan_job_finished)
+        self._job_runner.job_failed.disconnect(self._on_plan_job_failed)
+        self._job_runner.job_cancelled.disconnect(self._on_plan_job_cancelled)
+        self._job_runner = None
+        self._plan_job_id = None
+
+    def _on_plan_failed(self, error_msg: str):
+        print(
+            f"[{self.__class__.__name__}._on_plan_failed] Planning failed: {error_msg}"
+        )
+        self.error_signal.emit(error_msg)
+        self.finished_signal.emit({})
+
+    # ========================================================================
+    # Rendering (thread pool)
+    # ========================================================================
+    def _render(self):
+        batches = [
+            self._jobs[start : start + self.BATCH_SIZE]
+            for start in range(0, len(self._jobs), self.BATCH_SIZE)
+        ]
+        self._remaining_batches = len(batches)
+        if not batches:
+            self.finished_signal.emit(self._browser_actions)
+            return
+        for batch_index, jobs in enumerate(batches):
+            worker = RenderWorker(batch_index, jobs)
+            worker.signals.result_signal.connect(self._on_batch_rendered)
+            worker.signals.error_signal.connect(self._on_batch_error)
+            self.threadpool.start(worker)
+
+    @pyqtSlot(int, list)
+    def _on_batch_rendered(self, batch_index: int, payloads: List[SellPayloadType]):
+        start = batch_index * self.BATCH_SIZE
+        for offset, payload in enumerate(payloads):
+            self._pending[start + offset].action_payload = payload
+        self._done_jobs += len(payloads)
+        self.progress_signal.emit(self._done_jobs, len(self._jobs))
+        self._finish_batch()
+
+    @pyqtSlot(int, str)
+    def _on_batch_error(self, batch_index: int, error_msg: str):
+        print(
+            f"[{self.__class__.__name__}._on_batch_error] Batch {batch_index} failed: {error_msg}"
+        )
+        self.error_signal.emit(error_msg)
+        self._finish_batch()
+
+    def _finish_batch(self):
+        self._remaining_batches -= 1
+        if self._remaining_batches == 0:
+            self.finished_signal.emit(self._browser_actions)
+
+    # ========================================================================
+    # Planning (database and file system access, DB thread)
+    # ========================================================================
+    def _plan(
+        self,
+        list_user_data: List[UserType],
+        action_payloads: List,
+        context: Optional[JobContext] = None,
+    ):
+        self._browser_actions = {}
+        self._pending = []
+        self._jobs = []
+        self._done_jobs = 0
+        if not list_user_data:
+            return
+
+        pids = set()
+        for action in action_payloads:
+            pid = action.get("pid") if "pid" in action.keys() else None
+            if not pid:
+                continue
+            product_type = pid.split(".")[0]
+            if "re" in product_type.lower():
+                pids.add(pid)
+            elif "misc" in product_type.lower():
+                # TODO get random misc.
+                raise RuntimeError("Invalid logic for misc")
+        products_by_pid = self._re_product_service.read_by_pids(list(pids))
+        if context is not None:
+            context.check_cancelled()
+
+        # (user, action, product or None) for every listing action, in order.
+        listings: List[Tuple[UserType, dict, Optional[RealEstateProductType]]] = []
+        random_needed: Dict[str, int] = {}
+        for user_data in list_user_data:
+            user_type = user_data.type.strip().lower()
+            for action in action_payloads:
+                if "pid" not in action.keys():
+                    continue
+                product = products_by_pid.get(action["pid"]) if action["pid"] else None
+                if not product:
+                    transaction_type = self._random_transaction_type(user_type)
+                    if transaction_type:
+                        random_needed[transaction_type] = (
+                            random_needed.get(transaction_type, 0) + 1
+                        )
+                listings.append((user_data, action, product))
+
+        random_products = {
+            transaction_type: self._re_product_service.get_random_many(
+                transaction_type, count
+            )
+            for transaction_type, count in random_needed.items()
+        }
+        resolved: List[Optional[RealEstateProductType]] = []
+        for user_data, action, product in listings:
+            if not product:
+                transaction_type = self._random_transaction_type(
+                    user_data.type.strip().lower()
+                )
+                drawn = random_products.get(transaction_type)
+                product = drawn.pop() if drawn else None
+            resolved.append(product)
+
+        templates = self._draw_templates([p for p in resolved if p is not None])
+        if context is not None:
+            context.check_cancelled()
+
+        listing_iter = iter(resolved)
+        for user_data in list_user_data:
+            self._browser_actions[user_data.uid] = []
+            udd = os.path.join(self._udd_container, str(user_data.id))
+            for action in action_payloads:
+                browser = BrowserType(
+                    user_info=user_data,
+                    action_name=action.get("action_name", None),
+                    action_payload=None,
+                    is_mobile=False,
+                    headless=False,
+                    udd=udd,
+                    browser_id=str(uuid.uuid4()),
+                )
+                if "pid" in action.keys():
+                    product = next(listing_iter)
+                    if type(product) == RealEstateProductType:
+                        title_template, description_template = templates.pop()
+                        self._jobs.append(
+                            (
+                                product,
+                                title_template,
+                                description_template,
+                                self._get_images(product.image_dir),
+                            )
+                        )
+                        self._pending.append(browser)
+                elif "content" in action.keys():
+                    browser.action_payload = SellPayloadType(
+                        title=action["content"].get("title", ""),
+                        description=action["content"].get("description", ""),
+                        image_paths=action["content"].get("image_paths", []),
+                    )
+                self._browser_actions[user_data.uid].append(browser)
+
+    def _get_images(self, image_dir: Optional[str]) -> List[str]:
+        if not image_dir:
+            return []
+        image_paths = self._image_cache.get(image_dir)
+        if image_paths is None:
+            image_paths = self._re_product_service.get_images_by_path(image_dir)
+            self._image_cache[image_dir] = image_paths
+        return image_paths
+
+    @staticmethod
+    def _random_transaction_type(user_type: str) -> Optional[str]:
+        if "re.s" in user_type:
+            return RE_TRANSACTION["sell"]
+        if "re.r" in user_type:
+            return RE_TRANSACTION["rent"]
+        if "misc." in user_type:
+            # TODO get random misc.
+            raise RuntimeError("Invalid logic for misc")
+        return None
+
+    def _draw_templates(
+        self, products: List[RealEstateProductType]
+    ) -> List[Tuple[str, str]]:
+        """Returns one (title, description) template pair per product, drawn per
+        (transaction_type, category) group, in reverse order (for pop())."""
+        counts: Dict[Tuple[str, str], int] = {}
+        for product in products:
+            key = (product.transaction_type, product.category)
+            counts[key] = counts.get(key, 0) + 1
+        drawn: Dict[Tuple[str, str], Tuple[List[str], List[str]]] = {}
+        for (transaction_type, category), count in counts.items():
+            titles = self._re_template_service.get_random_many(
+                "title", transaction_type, category, count
+            )
+            descriptions = self._re_template_service.get_random_many(
+                "description", transaction_type, category, count
+            )
+            drawn[(transaction_type, category)] = (
+                self._top_up(titles, count),
+                self._top_up(descriptions, count),
+            )
+        pairs = []
+        for product in products:
+            titles, descriptions = drawn[(product.transaction_type, product.category)]
+            pairs.append((titles.pop(), descriptions.pop()))
+        pairs.reverse()
+        return pairs
+
+    @staticmethod
+    def _top_up(values: List[str], count: int) -> List[str]:
+        """`values` completed to `count` entries: get_random_many() skips the
+        templates deleted since they were sampled, so it can return fewer.
+        The shortfall is drawn again from `values`, or "" when none is left."""
+        if not values:
+            return [""] * count
+        if len(values) < count:
+            values = values + random.choices(values, k=count - len(values))
+        return values
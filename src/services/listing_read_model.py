@@ -0,0 +1,205 @@
+# src/services/listing_read_model.py
+from datetime import datetime, timedelta, timezone
+from typing import Any, List, Optional, Sequence
+
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+from src.database import connections
+from src.my_constants import (
+    CONNECTION_DB_PRODUCT,
+    CONNECTION_DB_USER,
+    PATH_DB_PRODUCT,
+    TABLE_REAL_ESTATE_PRODUCT,
+    TABLE_USER,
+    TABLE_USER_LISTED_PRODUCT,
+)
+from src.my_types import ListedProductRowType, UserListingSummaryType
+
+
+class ListingReadModel:
+    """
+    Read-only join queries over the user and product databases.
+
+    The product database is ATTACHed (as PRODUCT_SCHEMA) to the user
+    connection of the calling thread on first use, so "what has each account
+    listed, and which listings are stale" is one SQL statement instead of a
+    read_by_pid() per listed product. A listing is stale when its product no
+    longer exists, is not available (status != 1), or, with `max_age_days`,
+    was listed before that many days ago.
+    """
+
+    PRODUCT_SCHEMA = "product_db"
+
+    def __init__(
+        self,
+        user_connection_name: str = CONNECTION_DB_USER,
+        product_connection_name: str = CONNECTION_DB_PRODUCT,
+    ):
+        self._user_connection_name = user_connection_name
+        # Resolved now: the named connection can only be looked up from the
+        # thread that owns it, and queries may run on the DB thread.
+        product_db = QSqlDatabase.database(product_connection_name, False)
+        self._product_path = (
+            product_db.databaseName() if product_db.isValid() else PATH_DB_PRODUCT
+        )
+
+    def _database(self) -> Optional[QSqlDatabase]:
+        db = connections.database(self._user_connection_name)
+        if not db.isOpen():
+            print(
+                f"[{self.__class__.__name__}._database] Database '{self._user_connection_name}' is not open."
+            )
+            return None
+        if not self._attach_product_database(db):
+            return None
+        return db
+
+    def _attach_product_database(self, db: QSqlDatabase) -> bool:
+        # Checked on every call: reopening a connection (BaseModel.reload_connection)
+        # drops its attachments.
+        query = QSqlQuery(db)
+        query.prepare("SELECT 1 FROM pragma_database_list WHERE name = ?")
+        query.addBindValue(self.PRODUCT_SCHEMA)
+        if query.exec() and query.next():
+            return True
+        query = QSqlQuery(db)
+        query.prepare(f"ATTACH DATABASE ? AS {self.PRODUCT_SCHEMA}")
+        query.addBindValue(self._product_path)
+        if not query.exec():
+            print(
+                f"[{self.__class__.__name__}._attach_product_database] Cannot attach '{self._product_path}': {query.lastError().text()}"
+            )
+            return False
+        return True
+
+    def _stale_sql(self, max_age_days: Optional[int], bind_values: List[Any]) -> str:
+        condition = "p.id IS NULL OR COALESCE(p.status, 0) != 1"
+        if max_age_days is not None:
+            # created_at is written by SQLite's strftime('now'), i.e. in UTC.
+            cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+            condition += " OR l.created_at < ?"
+            bind_values.append(cutoff.strftime("%Y-%m-%d %H:%M:%S"))
+        return condition
+
+    def _exec(self, sql: str, bind_values: List[Any]) -> Optional[QSqlQuery]:
+        db = self._database()
+        if db is None:
+            return None
+        query = QSqlQuery(db)
+        query.setForwardOnly(True)
+        if not query.prepare(sql):
+            print(
+                f"[{self.__class__.__name__}._exec] Failed to prepare query: {query.lastError().text()}"
+            )
+            return None
+        for value in bind_values:
+            query.addBindValue(value)
+        if not query.exec():
+            print(
+                f"[{self.__class__.__name__}._exec] Query failed: {query.lastError().text()}"
+            )
+            return None
+        return query
+
+    @staticmethod
+    def _value(query: QSqlQuery, index: int) -> Any:
+        # NULLs (the LEFT JOIN columns of a missing product) read back as "".
+        return None if query.isNull(index) else query.value(index)
+
+    # ========================================================================
+    # Queries
+    # ========================================================================
+    def listings(
+        self,
+        user_ids: Optional[Sequence[int]] = None,
+        pids: Optional[Sequence[str]] = None,
+        only_stale: bool = False,
+        max_age_days: Optional[int] = None,
+    ) -> List[ListedProductRowType]:
+        """Listed products with their account and product, newest first per
+        account. `user_ids` / `pids` restrict the accounts / products."""
+        bind_values: List[Any] = []
+        stale_sql = self._stale_sql(max_age_days, bind_values)
+        conditions = []
+        if user_ids is not None:
+            if not user_ids:
+                return []
+            conditions.append(f"l.id_user IN ({', '.join('?' for _ in user_ids)})")
+            bind_values.extend(user_ids)
+        if pids is not None:
+            if not pids:
+                return []
+            conditions.append(f"l.pid IN ({', '.join('?' for _ in pids)})")
+            bind_values.extend(pids)
+        sql = f"""
+            SELECT l.id, l.id_user, u.uid, u.username, u.type, u.status,
+                   l.pid, l.created_at, p.id, p.status, p.transaction_type,
+                   p.category, p.ward, p.price, p.area,
+                   CASE WHEN {stale_sql} THEN 1 ELSE 0 END AS is_stale
+            FROM {TABLE_USER_LISTED_PRODUCT} l
+            JOIN {TABLE_USER} u ON u.id = l.id_user
+            LEFT JOIN {self.PRODUCT_SCHEMA}.{TABLE_REAL_ESTATE_PRODUCT} p ON p.pid = l.pid
+        """
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        if only_stale:
+            sql = f"SELECT * FROM ({sql}) WHERE is_stale = 1"
+        sql += " ORDER BY 2, 8 DESC, 1 DESC"
+        query = self._exec(sql, bind_values)
+        if query is None:
+            return []
+        results = []
+        while query.next():
+            values = [self._value(query, i) for i in range(15)]
+            results.append(ListedProductRowType(*values, bool(query.value(15))))
+        return results
+
+    def stale_listings(
+        self,
+        user_ids: Optional[Sequence[int]] = None,
+        max_age_days: Optional[int] = None,
+    ) -> List[ListedProductRowType]:
+        return self.listings(
+            user_ids=user_ids, only_stale=True, max_age_days=max_age_days
+        )
+
+    def user_summaries(
+        self,
+        user_ids: Optional[Sequence[int]] = None,
+        max_age_days: Optional[int] = None,
+    ) -> List[UserListingSummaryType]:
+        """One row per account (accounts without listings included): how many
+        products it has listed, how many of those are stale, and when it last
+        listed one."""
+        bind_values: List[Any] = []
+        stale_sql = self._stale_sql(max_age_days, bind_values)
+        sql = f"""
+            SELECT u.id, u.uid, u.username, COUNT(l.id),
+                   COALESCE(SUM(CASE WHEN l.id IS NOT NULL AND ({stale_sql}) THEN 1 ELSE 0 END), 0),
+                   MAX(l.created_at)
+            FROM {TABLE_USER} u
+            LEFT JOIN {TABLE_USER_LISTED_PRODUCT} l ON l.id_user = u.id
+            LEFT JOIN {self.PRODUCT_SCHEMA}.{TABLE_REAL_ESTATE_PRODUCT} p ON p.pid = l.pid
+        """
+        if user_ids is not None:
+            if not user_ids:
+                return []
+            sql += f" WHERE u.id IN ({', '.join('?' for _ in user_ids)})"
+            bind_values.extend(user_ids)
+        sql += " GROUP BY u.id ORDER BY u.id"
+        query = self._exec(sql, bind_values)
+        if query is None:
+            return []
+        results = []
+        while query.next():
+            results.append(
+                UserListingSummaryType(
+                    id_user=query.value(0),
+                    uid=query.value(1),
+                    username=query.value(2),
+                    listed_count=int(query.value(3)),
+                    stale_count=int(query.value(4)),
+                    last_listed_at=self._value(query, 5),
+                )
+            )
+        return results
@@ -1,24 +1,39 @@
 # src/services/product_service.py
 import uuid
-import glob
 import os
-import shutil
-from typing import Optional, List
+import re
+import time
+from datetime import datetime
+from typing import Dict, Optional, List, Tuple
 from PyQt6.QtSql import QSqlQuery
 
 from src.services.base_service import BaseService, transaction
+from src.services.random_sampler import RandomSampler
+from src.services.image_store import ImageStore
 from src.models.product_model import (
     RealEstateProductModel,
     RealEstateTemplateModel,
     MiscProductModel,
 )
-from src.my_types import RealEstateProductType, RealEstateTemplateType, MiscProductType
-from src.my_constants import RE_TRANSACTION, TABLE_REAL_ESTATE_TEMPLATE
-import random
+from src.my_types import (
+    IngestedImageType,
+    RealEstateProductType,
+    RealEstateTemplateType,
+    MiscProductType,
+)
+from src.my_constants import (
+    IMAGE_EXTENSIONS,
+    RE_TRANSACTION,
+    TABLE_REAL_ESTATE_PRODUCT_FTS,
+    TABLE_REAL_ESTATE_TEMPLATE,
+)
 
 
 class RealEstateProductService(BaseService):
     DATA_TYPE = RealEstateProductType
+    DIRECT_SQL = True
+    # FAT/exFAT volumes store mtimes with a 2 second resolution.
+    LISTING_CACHE_SETTLE_NS = 2_000_000_000
 
     def __init__(self, model: RealEstateProductModel):
         if not isinstance(model, RealEstateProductModel):
@@ -26,6 +41,13 @@ class RealEstateProductService(BaseService):
                 "model must be an instance of RealEstateProductModel or its subclass."
             )
         super().__init__(model)
+        self._random_sampler = RandomSampler(
+            self._db, self.model.tableName(), ("transaction_type", "status")
+        )
+        self.add_write_listener(self._random_sampler.invalidate)
+        self._image_stores: Dict[str, ImageStore] = {}
+        # image dir -> (dir mtime_ns, sorted image paths)
+        self._image_listing_cache: Dict[str, Tuple[int, List[str]]] = {}
 
     def create(
         self,
@@ -33,25 +55,44 @@ class RealEstateProductService(BaseService):
         image_paths: List[str],
         payload: RealEstateProductType,
     ) -> bool:
-        product_dir = os.path.abspath(os.path.join(image_dir_container, payload.pid))
-        if not os.path.exists(product_dir):
-            os.makedirs(product_dir)
-
-        for idx, image_path in enumerate(image_paths):
-            if os.path.isfile(image_path):
-                ext = os.path.splitext(image_path)[1]
-                base_name = getattr(payload, "uid", None) or getattr(
-                    payload, "pid", "img"
-                )
-                new_name = f"{base_name}_{idx+1}{ext}"
-                dest_path = os.path.join(product_dir, new_name)
-                shutil.copy(image_path, dest_path)
+        base_name = getattr(payload, "uid", None) or getattr(payload, "pid", "img")
+        product_dir = self.get_image_store(image_dir_container).store_product_images(
+            payload.pid, image_paths, base_name
+        )
+        payload.image_dir = product_dir
+        return super().create(payload)
+
+    def create_from_ingested(
+        self,
+        image_dir_container: str,
+        images: List[IngestedImageType],
+        payload: RealEstateProductType,
+    ) -> bool:
+        """Same as create(), for images already normalized into a staging
+        directory by ImageIngestor. The staged files are moved into the store."""
+        base_name = getattr(payload, "uid", None) or getattr(payload, "pid", "img")
+        product_dir = self.get_image_store(image_dir_container).store_product_images(
+            payload.pid,
+            [image.path or image.source_path for image in images],
+            base_name,
+            digests=[image.sha256 for image in images],
+            move=True,
+        )
         payload.image_dir = product_dir
         return super().create(payload)
 
     def read(self, record_id: int) -> Optional[RealEstateProductType]:
         return super().read(record_id)
 
+    def get_image_store(self, image_dir_container: str) -> ImageStore:
+        """Returns the (shared) content-addressed image store of a container."""
+        container = os.path.abspath(image_dir_container)
+        store = self._image_stores.get(container)
+        if store is None:
+            store = ImageStore(container)
+            self._image_stores[container] = store
+        return store
+
     def read_all(self) -> List[RealEstateProductType]:
         return super().read_all()
 
@@ -62,13 +103,16 @@ class RealEstateProductService(BaseService):
         product_data = self.read(record_id)
         if product_data and getattr(product_data, "image_dir", None):
             image_dir = product_data.image_dir
+            image_store = self.get_image_store(os.path.dirname(image_dir))
             if os.path.isdir(image_dir):
                 try:
-                    shutil.rmtree(image_dir)
+                    image_store.remove_product_dir(image_dir)
                 except Exception as e:
                     print(
                         f"[{self.__class__.__name__}.delete] Warning: Failed to remove image directory '{image_dir}': {e}"
                     )
+            # Blobs shared with other products survive; the rest are collected.
+            image_store.start_garbage_collection()
         return super().delete(record_id)
 
     def delete_multiple(self, record_ids: List[int]):
@@ -78,39 +122,36 @@ class RealEstateProductService(BaseService):
         return super().import_data(payload)
 
     def read_by_pid(self, pid: str) -> Optional[RealEstateProductType]:
-        return self._find_by_model_index(find_method_name="find_row_by_pid", value=pid)
+        return self._find_by_key("pid", pid)
+
+    def read_by_pids(self, pids: List[str]) -> Dict[str, RealEstateProductType]:
+        """Reads the products with the given pids in one query: {pid: product}."""
+        return self._read_by_column("pid", pids)
 
     def toggle_status(self, record_id: int) -> bool:
-        product = self.read(record_id)
-        if product is None:
-            print(
-                f"[{self.__class__.__name__}.toggle_status] Product with record_id '{record_id}' not found."
-            )
-            return False
+        return self.bulk_toggle_status([record_id])
 
-        current_status = product.status
-        if current_status == 0:
-            new_status = 1
-        elif current_status == 1:
-            new_status = 0
-        else:
+    def bulk_toggle_status(self, record_ids: List[int]) -> bool:
+        """Flips the status (0 <-> 1) of the given products with one UPDATE.
+        Products with another status value are left unchanged."""
+        if not record_ids:
             print(
-                f"[{self.__class__.__name__}.toggle_status] Unexpected status value for record_id '{record_id}': {current_status}. Cannot toggle."
+                f"[{self.__class__.__name__}.bulk_toggle_status] No record IDs provided."
             )
             return False
-
-        product.status = new_status
-        update_success = self.update(record_id, product)
-        if update_success:
-            print(
-                f"[{self.__class__.__name__}.toggle_status] Successfully toggled status for record_id '{record_id}' to {new_status}."
-            )
-            return True
-        else:
+        if not self._db.isOpen():
             print(
-                f"[{self.__class__.__name__}.toggle_status] Failed to update status for record_id '{record_id}'."
+                f"[{self.__class__.__name__}.bulk_toggle_status] Database is not open. => return False"
             )
             return False
+        return self._bulk_exec(
+            "bulk_toggle_status",
+            f"UPDATE {self.model.tableName()} "
+            "SET status = 1 - status, updated_at = ? "
+            "WHERE status IN (0, 1) AND id IN ({})",
+            [str(datetime.now())],
+            record_ids,
+        )
 
     def initialize_new_pid(self, transaction_type: str) -> str:
         """
@@ -168,7 +209,8 @@ class RealEstateProductService(BaseService):
 
         This method scans the directory provided by `path` and collects all
         image file paths found directly within it. It does not recurse into
-        subdirectories.
+        subdirectories. Extensions are matched case-insensitively, and the
+        listing is cached until the directory's mtime changes.
 
         Args:
             path (str): The absolute or relative path to the directory from which
@@ -179,23 +221,31 @@ class RealEstateProductService(BaseService):
                        specified directory. Returns an empty list if no images
                        are found or if the directory does not exist.
         """
-        if not path or not os.path.isdir(path):
+        if not path:
             return []
-        image_extensions = (
-            "*.png",
-            "*.jpg",
-            "*.jpeg",
-            "*.bmp",
-            "*.gif",
-            "*.webp",
-            "*.PNG",
-            "*.JPG",
-            "*.JPEG",
-        )
-        image_files = []
-        for ext in image_extensions:
-            image_files.extend(glob.glob(os.path.join(path, ext)))
-        return sorted(image_files)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return []
+        cached = self._image_listing_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1])
+        try:
+            with os.scandir(path) as entries:
+                image_files = sorted(
+                    os.path.join(path, entry.name)
+                    for entry in entries
+                    if not entry.name.startswith(".")
+                    and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+                    and entry.is_file()
+                )
+        except NotADirectoryError:
+            return []
+        # A directory changed within the mtime granularity of its filesystem
+        # could change again without a new mtime: only cache settled listings.
+        if time.time_ns() - mtime_ns > self.LISTING_CACHE_SETTLE_NS:
+            self._image_listing_cache[path] = (mtime_ns, image_files)
+        return list(image_files)
 
     def get_all_pid(self):
         """
@@ -203,49 +253,88 @@ class RealEstateProductService(BaseService):
         Returns:
             List[str]: List of all product IDs.
         """
-        if not self._db.isOpen():
-            print(f"[{self.__class__.__name__}.get_all_pid] Database is not open.")
-            return []
-        query = QSqlQuery(self._db)
-        # Assuming the table name is available as self.model.tableName()
-        sql = f"SELECT pid FROM {self.model.tableName()}"
-        if not query.exec(sql):
-            print(
-                f"[{self.__class__.__name__}.get_all_pid] Query failed: {query.lastError().text()}"
+        return [
+            row[0]
+            for batch in self.iter_rows(
+                columns=["pid"],
+                where="pid IS NOT NULL",
+                batch_size=5000,
+                order_by="",
             )
-            return []
-        pids = []
-        while query.next():
-            pid = query.value(0)
-            if pid is not None:
-                pids.append(pid)
-        return pids
+            for row in batch
+        ]
 
     def get_random(self, transaction_type: str):
+        products = self.get_random_many(transaction_type, 1)
+        return products[0] if products else None
+
+    def get_random_many(
+        self, transaction_type: str, k: int, unique: bool = False
+    ) -> List[RealEstateProductType]:
+        """Draws `k` random available products (status = 1) of
+        `transaction_type`, with replacement unless `unique`."""
         if not self._db.isOpen():
-            print(f"[{self.__class__.__name__}.get_random] Database is not open.")
-            return None
-
-        query = QSqlQuery(self._db)
-        # Giả sử cột transaction_type lưu đúng kiểu dữ liệu, có thể cần chỉnh lại tên cột nếu khác
-        sql = f"""
-            SELECT id FROM {self.model.tableName()}
-            WHERE transaction_type = ? AND status = 1
-            ORDER BY RANDOM() LIMIT 1
+            print(f"[{self.__class__.__name__}.get_random_many] Database is not open.")
+            return []
+        record_ids = self._random_sampler.sample((transaction_type, 1), k, unique)
+        return self.read_by_ids(record_ids)
+
+    # ========================================================================
+    # Full-text search
+    # ========================================================================
+    # bm25() weights of the FTS columns: pid, street, ward, district,
+    # province, category, description.
+    SEARCH_COLUMN_WEIGHTS = (10.0, 4.0, 4.0, 3.0, 2.0, 2.0, 1.0)
+
+    @staticmethod
+    def fts_query(text: str) -> str:
+        """
+        Turns free text into an FTS5 query: every word must match, as a
+        prefix ("hu" finds "huế"). The index folds case and diacritics, except
+        "đ", which is folded here as in the index triggers. Returns "" when the
+        text has no words.
         """
-        query.prepare(sql)
-        query.addBindValue(transaction_type)
+        text = text.replace("đ", "d").replace("Đ", "D")
+        return " ".join(f'"{word}"*' for word in re.findall(r"\w+", text))
+
+    def search_condition(self, text: str) -> str:
+        """WHERE fragment (for QSqlTableModel.setFilter) keeping the products
+        matching `text`, or "" when the text has no words."""
+        query = self.fts_query(text)
+        if not query:
+            return ""
+        # fts_query() only emits word characters, quotes and stars.
+        return (
+            f"id IN (SELECT rowid FROM {TABLE_REAL_ESTATE_PRODUCT_FTS} "
+            f"WHERE {TABLE_REAL_ESTATE_PRODUCT_FTS} MATCH '{query}')"
+        )
 
-        if not query.exec():
-            print(
-                f"[{self.__class__.__name__}.get_random] Query failed: {query.lastError().text()}"
-            )
-            return None
+    def search_ids(self, text: str, limit: int = 100) -> List[int]:
+        """Ids of the products matching `text`, best match first."""
+        query = self.fts_query(text)
+        if not query:
+            return []
+        if not self._db.isOpen():
+            print(f"[{self.__class__.__name__}.search_ids] Database is not open.")
+            return []
+        weights = ", ".join(str(weight) for weight in self.SEARCH_COLUMN_WEIGHTS)
+        sql_query = self._exec_prepared(
+            f"SELECT rowid FROM {TABLE_REAL_ESTATE_PRODUCT_FTS} "
+            f"WHERE {TABLE_REAL_ESTATE_PRODUCT_FTS} MATCH ? "
+            f"ORDER BY bm25({TABLE_REAL_ESTATE_PRODUCT_FTS}, {weights}) LIMIT ?",
+            [query, limit],
+        )
+        if sql_query is None:
+            return []
+        record_ids = []
+        while sql_query.next():
+            record_ids.append(sql_query.value(0))
+        return record_ids
 
-        if query.next():
-            record_id = query.value(0)
-            return self.read(record_id)
-        return None
+    def search(self, text: str, limit: int = 100) -> List[RealEstateProductType]:
+        """Products whose address, pid, category or description match `text`
+        ("da lat" finds "Đà Lạt"), best match first."""
+        return self.read_by_ids(self.search_ids(text, limit))
 
 
 class RealEstateTemplateService(BaseService):
@@ -257,6 +346,12 @@ class RealEstateTemplateService(BaseService):
                 "model must be an instance of RealEstateTemplateModel or its subclass."
             )
         super().__init__(model)
+        self._random_sampler = RandomSampler(
+            self._db,
+            self.model.tableName(),
+            ("part", "transaction_type", "category"),
+        )
+        self.add_write_listener(self._random_sampler.invalidate)
 
     def create(self, payload: RealEstateTemplateType) -> bool:
         return super().create(payload)
@@ -279,41 +374,42 @@ class RealEstateTemplateService(BaseService):
     def import_data(self, payload: List[RealEstateTemplateType]):
         return super().import_data(payload)
 
+    @staticmethod
+    def _template_conditions(part: str, transaction_type: str, category: str):
+        """Equality conditions for the non-empty filters. An empty value matches
+        any row; leaving it out of the WHERE clause (instead of `? = '' OR ...`)
+        lets SQLite use the (part, transaction_type, category, is_default) index."""
+        conditions, bind_values = [], []
+        for column, value in (
+            ("part", part),
+            ("transaction_type", transaction_type),
+            ("category", category),
+        ):
+            if value:
+                conditions.append(f"{column} = ?")
+                bind_values.append(value)
+        return conditions, bind_values
+
     def get_random(self, part: str, transaction_type: str, category: str) -> str:
         """
         Retrieves a random template value based on part, transaction_type, and category.
         """
-        if not self._db.isOpen():
-            print(f"[{self.__class__.__name__}.get_random] Database is not open.")
-            return ""
+        values = self.get_random_many(part, transaction_type, category, 1)
+        return values[0] if values else ""
 
-        query_obj = QSqlQuery(self._db)  # Khởi tạo QSqlQuery với đối tượng QSqlDatabase
-        query = f"""
-            SELECT value FROM {TABLE_REAL_ESTATE_TEMPLATE}
-            WHERE (? = '' OR part = ?)
-            AND (? = '' OR transaction_type = ?)
-            AND (? = '' OR category = ?)
-            ORDER BY RANDOM() LIMIT 1
+    def get_random_many(
+        self, part: str, transaction_type: str, category: str, k: int
+    ) -> List[str]:
         """
-        query_obj.prepare(query)  # Chuẩn bị truy vấn
-
-        # Binding các tham số
-        query_obj.addBindValue(part)
-        query_obj.addBindValue(part)
-        query_obj.addBindValue(transaction_type)
-        query_obj.addBindValue(transaction_type)
-        query_obj.addBindValue(category)
-        query_obj.addBindValue(category)
-
-        if not query_obj.exec():  # Thực thi truy vấn
-            print(
-                f"[{self.__class__.__name__}.get_random] Query failed: {query_obj.lastError().text()}"
-            )
-            return ""
-
-        if query_obj.next():  # Di chuyển con trỏ đến hàng đầu tiên (nếu có)
-            return query_obj.value(0)  # Lấy giá trị của cột đầu tiên (value)
-        return ""  # Trả về chuỗi rỗng nếu không tìm thấy
+        Draws `k` random template values (with replacement). An empty part,
+        transaction_type or category matches any value. Only the ids are kept
+        in memory; the drawn templates are read with one query.
+        """
+        if not self._db.isOpen():
+            print(f"[{self.__class__.__name__}.get_random_many] Database is not open.")
+            return []
+        record_ids = self._random_sampler.sample((part, transaction_type, category), k)
+        return [template.value for template in self.read_by_ids(record_ids)]
 
     def get_default(self, part: str, transaction_type: str, category: str) -> str:
         """
@@ -324,23 +420,20 @@ class RealEstateTemplateService(BaseService):
             print(f"[{self.__class__.__name__}.get_default] Database is not open.")
             return ""
 
+        conditions, bind_values = self._template_conditions(
+            part, transaction_type, category
+        )
+        conditions.append("is_default = 1")
         query_obj = QSqlQuery(self._db)  # Khởi tạo QSqlQuery với đối tượng QSqlDatabase
         query = f"""
             SELECT value from {TABLE_REAL_ESTATE_TEMPLATE}
-            WHERE (? = '' OR part = ?)
-            AND (? = '' OR transaction_type = ?)
-            AND (? = '' OR category = ?)
-            AND is_default = 1
+            WHERE {" AND ".join(conditions)}
         """
         query_obj.prepare(query)  # Chuẩn bị truy vấn
 
         # Binding các tham số
-        query_obj.addBindValue(part)
-        query_obj.addBindValue(part)
-        query_obj.addBindValue(transaction_type)
-        query_obj.addBindValue(transaction_type)
-        query_obj.addBindValue(category)
-        query_obj.addBindValue(category)
+        for value in bind_values:
+            query_obj.addBindValue(value)
 
         if not query_obj.exec():  # Thực thi truy vấn
             print(
@@ -436,8 +529,8 @@ class RealEstateTemplateService(BaseService):
                     )
                     raise RuntimeError("Failed to set target as default.")
 
-                # Re-select the model to refresh the view (optional, but good practice if model is connected to a view)
-                self.model.select()
+            # Several rows changed: the model and its mirrors are re-selected.
+            self._notify_written(self._changes(reset=True))
             return True  # Transaction committed successfully
 
         except Exception as e:
@@ -452,6 +545,7 @@ class RealEstateTemplateService(BaseService):
 
 class MiscProductService(BaseService):
     DATA_TYPE = MiscProductType
+    DIRECT_SQL = True
 
     def __init__(self, model: MiscProductModel):
         if not isinstance(model, MiscProductModel):
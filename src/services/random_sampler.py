@@ -0,0 +1,95 @@
+# src/services/random_sampler.py
+import random
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from PyQt6.QtSql import QSqlDatabase, QSqlQuery
+
+from src.database import connections
+
+
+class RandomSampler:
+    """
+    Draws random values of `value_column` from `table`, grouped by
+    `key_columns`. The groups are read with one query on first use and kept
+    in memory until invalidate() is called (services do it after every
+    write), so a draw no longer costs an ORDER BY RANDOM() scan. Draws may
+    run on the DB thread while the GUI thread invalidates: both take a lock.
+    """
+
+    def __init__(
+        self,
+        db: QSqlDatabase,
+        table: str,
+        key_columns: Sequence[str],
+        value_column: str = "id",
+    ):
+        self._db = db
+        self._table = table
+        self._key_columns = tuple(key_columns)
+        self._value_column = value_column
+        self._groups: Optional[Dict[Tuple, List[Any]]] = None
+        # Merged groups for keys with wildcards, cleared with the groups.
+        self._merged: Dict[Tuple, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        with self._lock:
+            self._groups = None
+            self._merged = {}
+
+    def sample(self, key: Sequence[Any], k: int = 1, unique: bool = False) -> List[Any]:
+        """
+        Returns `k` random values whose key columns equal `key`. A None or ""
+        component matches any value. With `unique`, values are distinct and at
+        most the size of the group; otherwise they are drawn with replacement.
+        """
+        with self._lock:
+            values = self._values_for(tuple(key))
+        if not values or k <= 0:
+            return []
+        if unique:
+            return random.sample(values, min(k, len(values)))
+        return random.choices(values, k=k)
+
+    def _values_for(self, key: Tuple) -> List[Any]:
+        if len(key) != len(self._key_columns):
+            raise ValueError(
+                f"[{self.__class__.__name__}.sample] Expected {len(self._key_columns)} key values {self._key_columns}, got {key}."
+            )
+        groups = self._load()
+        wildcards = [component in (None, "") for component in key]
+        if not any(wildcards):
+            return groups.get(key, [])
+        if key not in self._merged:
+            self._merged[key] = [
+                value
+                for group_key, values in groups.items()
+                if all(
+                    wildcard or group_component == component
+                    for wildcard, group_component, component in zip(
+                        wildcards, group_key, key
+                    )
+                )
+                for value in values
+            ]
+        return self._merged[key]
+
+    def _load(self) -> Dict[Tuple, List[Any]]:
+        if self._groups is not None:
+            return self._groups
+        groups: Dict[Tuple, List[Any]] = {}
+        query = QSqlQuery(connections.database(self._db.connectionName()))
+        query.setForwardOnly(True)
+        sql = f"SELECT {self._value_column}, {', '.join(self._key_columns)} FROM {self._table}"
+        if not query.exec(sql):
+            print(
+                f"[{self.__class__.__name__}._load] Query failed: {query.lastError().text()}"
+            )
+            return {}
+        key_count = len(self._key_columns)
+        while query.next():
+            key = tuple(query.value(i + 1) for i in range(key_count))
+            groups.setdefault(key, []).append(query.value(0))
+        self._groups = groups
+        return groups
@@ -0,0 +1,115 @@
+# src/services/record_mapper.py
+from dataclasses import fields
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from PyQt6.QtSql import QSqlQuery, QSqlRecord
+
+# (data type, column names of the record layout) -> compiled mapper
+_mappers: Dict[Tuple[type, Tuple[str, ...]], "RecordMapper"] = {}
+
+
+def _to_int(value: str) -> Optional[int]:
+    """'' gives None; decimal text ('12.5') is truncated like CAST AS INTEGER."""
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return int(float(value))
+    except (ValueError, OverflowError):
+        print(f"WARNING: [record_mapper._to_int] Not a number: {value!r}. => None")
+        return None
+
+
+def _to_float(value: str) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        print(f"WARNING: [record_mapper._to_float] Not a number: {value!r}. => None")
+        return None
+
+
+_CONVERTERS: Dict[type, Callable[[Any], Any]] = {int: _to_int, float: _to_float}
+
+
+def _numeric_type(annotation: Any) -> Optional[type]:
+    """int or float for `int`, `float`, `Optional[int]`, `Optional[float]`."""
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else None
+    return annotation if annotation in _CONVERTERS else None
+
+
+class RecordMapper:
+    """
+    Converts the rows of one column layout to `data_type` instances.
+    The position of every dataclass field in the layout is looked up once, so
+    a row is read with positional value() calls and passed to the dataclass
+    positionally. NULL columns give None: value() reports them as '', so
+    isNull() is checked first. Text in an int/float field is converted, ''
+    giving None. Fields missing from the layout are None. Use mapper_for()
+    to share the compiled mappers.
+    """
+
+    __slots__ = ("data_type", "columns", "_indexes", "_converters")
+
+    def __init__(self, data_type: Type, columns: Tuple[str, ...]):
+        self.data_type = data_type
+        self.columns = columns
+        positions = {name: index for index, name in enumerate(columns)}
+        init_fields = [f for f in fields(data_type) if f.init]
+        # -1 (a missing column) is null for QSqlQuery and QSqlRecord alike.
+        self._indexes: List[int] = [positions.get(f.name, -1) for f in init_fields]
+        self._converters: List[Tuple[int, Callable[[Any], Any]]] = []
+        for position, f in enumerate(init_fields):
+            numeric_type = _numeric_type(f.type)
+            if numeric_type is not None:
+                self._converters.append((position, _CONVERTERS[numeric_type]))
+
+    def _build(self, values: List[Any]) -> Any:
+        for position, convert in self._converters:
+            value = values[position]
+            if isinstance(value, str):
+                values[position] = convert(value)
+        return self.data_type(*values)
+
+    def map_record(self, record: QSqlRecord) -> Any:
+        value, is_null = record.value, record.isNull
+        return self._build([None if is_null(i) else value(i) for i in self._indexes])
+
+    def map_query(self, query: QSqlQuery) -> Any:
+        """Maps the current row of `query` without building a QSqlRecord."""
+        value, is_null = query.value, query.isNull
+        return self._build([None if is_null(i) else value(i) for i in self._indexes])
+
+
+def record_columns(record: QSqlRecord) -> Tuple[str, ...]:
+    return tuple(record.fieldName(i) for i in range(record.count()))
+
+
+def mapper_for(data_type: Type, record: QSqlRecord) -> RecordMapper:
+    """
+    The mapper of `data_type` for the column layout of `record` (a model's
+    record(), a query's record() after exec()), compiled on first use.
+    """
+    columns = record_columns(record)
+    key = (data_type, columns)
+    mapper = _mappers.get(key)
+    if mapper is None:
+        mapper = _mappers[key] = RecordMapper(data_type, columns)
+    return mapper
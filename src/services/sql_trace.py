@@ -0,0 +1,259 @@
+# src/services/sql_trace.py
+import time
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from PyQt6 import sip
+from PyQt6.QtSql import QSqlDatabase, QSqlDriver, QSqlQuery
+
+from src.models.base_model import BaseModel
+from src.my_types import SqlTraceType
+
+# Statements EXPLAIN QUERY PLAN is run for (DDL, PRAGMA, ATTACH... are not).
+EXPLAINABLE_PREFIXES = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+RECENT_TRACES = 500
+SLOW_TRACES = 200
+
+# "Class.method" -> original class attribute (QSqlQuery and BaseModel), put
+# back by disable(), and the callable the wrappers delegate to.
+_originals: Dict[str, Any] = {}
+_calls: Dict[str, Callable] = {}
+_recent: Deque[SqlTraceType] = deque(maxlen=RECENT_TRACES)
+_slow: Deque[SqlTraceType] = deque(maxlen=SLOW_TRACES)
+_lock = threading.Lock()
+_slow_ms = 100.0
+_explain = True
+
+
+def _compact(statement: str) -> str:
+    return " ".join(statement.split())
+
+
+def _add(trace: SqlTraceType):
+    with _lock:
+        _recent.append(trace)
+
+
+def _database_for(driver: QSqlDriver) -> Optional[QSqlDatabase]:
+    """The connection of the calling thread that uses `driver`. Only the
+    connections of the calling thread can be looked up: the named ones on
+    the main thread, the `<name>@<thread ident>` clones (see
+    src.database.connections) elsewhere."""
+    ident = threading.get_ident()
+    is_main_thread = ident == threading.main_thread().ident
+    driver_address = sip.unwrapinstance(driver)
+    for name in QSqlDatabase.connectionNames():
+        owner = name.partition("@")[2]
+        if owner != ("" if is_main_thread else str(ident)):
+            continue
+        db = QSqlDatabase.database(name, False)
+        if db.isOpen() and sip.unwrapinstance(db.driver()) == driver_address:
+            return db
+    return None
+
+
+def explain(db: QSqlDatabase, statement: str, bind_values: List[Any]) -> List[str]:
+    """EXPLAIN QUERY PLAN of `statement`: one line per plan step, indented by
+    depth. Full table scans are marked, they usually mean a missing index."""
+    if not _compact(statement).upper().startswith(EXPLAINABLE_PREFIXES):
+        return []
+    run = _calls.get("QSqlQuery.exec", QSqlQuery.exec)
+    fetch = _calls.get("QSqlQuery.next", QSqlQuery.next)
+    query = QSqlQuery(db)
+    if not query.prepare(f"EXPLAIN QUERY PLAN {statement}"):
+        return [f"(cannot explain: {query.lastError().text()})"]
+    for value in bind_values:
+        query.addBindValue(value)
+    if not run(query):
+        return [f"(cannot explain: {query.lastError().text()})"]
+    depths: Dict[int, int] = {0: -1}
+    lines = []
+    while fetch(query):
+        step_id, parent_id, detail = query.value(0), query.value(1), query.value(3)
+        depth = depths.get(parent_id, -1) + 1
+        depths[step_id] = depth
+        full_scan = detail.startswith("SCAN ") and "INDEX" not in detail
+        lines.append(f"{'  ' * depth}{detail}{'  <- full scan' if full_scan else ''}")
+    return lines
+
+
+def _report_slow(trace: SqlTraceType, db: Optional[QSqlDatabase], bind_values):
+    trace.slow = True
+    if db is not None:
+        trace.connection = db.connectionName()
+        if _explain:
+            trace.plan = explain(db, trace.statement, bind_values)
+    with _lock:
+        _slow.append(trace)
+    print(
+        f"WARNING: [sql_trace] Slow {trace.source} ({trace.duration_ms:.1f} ms, "
+        f"{trace.row_count} rows, {trace.bind_count} bind values"
+        f"{f', on {trace.connection}' if trace.connection else ''}): {trace.statement}"
+    )
+    for line in trace.plan:
+        print(f"    {line}")
+
+
+# ============================================================================
+# Wrappers
+# ============================================================================
+def _traced_exec(self: QSqlQuery, *args) -> bool:
+    start = time.perf_counter()
+    ok = _calls["QSqlQuery.exec"](self, *args)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    # exec(sql) runs `sql` as is, exec() the prepared statement.
+    bind_values = [] if args else list(self.boundValues())
+    is_select = ok and self.isSelect()
+    trace = SqlTraceType(
+        statement=_compact(args[0] if args else self.lastQuery()),
+        bind_count=len(bind_values),
+        row_count=0 if is_select or not ok else max(self.numRowsAffected(), 0),
+        duration_ms=elapsed_ms,
+        source="query",
+        ok=ok,
+    )
+    _add(trace)
+    if is_select:
+        # Rows are counted, and their fetch time added, by next().
+        self._sql_trace = (trace, bind_values)
+    else:
+        self._sql_trace = None
+        if elapsed_ms >= _slow_ms:
+            _report_slow(trace, _database_for(self.driver()), bind_values)
+    return ok
+
+
+def _traced_exec_batch(self: QSqlQuery, *args) -> bool:
+    start = time.perf_counter()
+    ok = _calls["QSqlQuery.execBatch"](self, *args)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    bound = list(self.boundValues())
+    trace = SqlTraceType(
+        statement=_compact(self.lastQuery()),
+        # Every bound value is a list of values, one per row.
+        bind_count=sum(len(values) for values in bound if isinstance(values, list)),
+        row_count=max((len(values) for values in bound), default=0) if ok else 0,
+        duration_ms=elapsed_ms,
+        source="batch",
+        ok=ok,
+    )
+    _add(trace)
+    if elapsed_ms >= _slow_ms:
+        # Explained with the first row's values.
+        first_row = [values[0] if values else None for values in bound]
+        _report_slow(trace, _database_for(self.driver()), first_row)
+    return ok
+
+
+def _traced_next(self: QSqlQuery) -> bool:
+    pending = getattr(self, "_sql_trace", None)
+    if pending is None:
+        return _calls["QSqlQuery.next"](self)
+    start = time.perf_counter()
+    has_row = _calls["QSqlQuery.next"](self)
+    trace, bind_values = pending
+    trace.duration_ms += (time.perf_counter() - start) * 1000
+    if has_row:
+        trace.row_count += 1
+    else:
+        # Fully read: the duration is final. Queries read only partly (a
+        # single next()) are only checked at exec().
+        self._sql_trace = None
+        if trace.duration_ms >= _slow_ms:
+            _report_slow(trace, _database_for(self.driver()), bind_values)
+    return has_row
+
+
+def _traced_model_call(name: str) -> Callable:
+    original = _calls[f"BaseModel.{name}"]
+
+    def traced(self: BaseModel, *args, **kwargs):
+        rows_before = self.rowCount()
+        start = time.perf_counter()
+        result = original(self, *args, **kwargs)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        trace = SqlTraceType(
+            statement=_compact(self.selectStatement()),
+            bind_count=0,
+            row_count=self.rowCount() - (0 if name == "select" else rows_before),
+            duration_ms=elapsed_ms,
+            source=f"{self.__class__.__name__}.{name}",
+            ok=result is not False,
+        )
+        _add(trace)
+        if elapsed_ms >= _slow_ms:
+            _report_slow(trace, self.database(), [])
+        return result
+
+    return traced
+
+
+# ============================================================================
+# Public API
+# ============================================================================
+def enable(slow_ms: Optional[float] = None, explain_slow: bool = True):
+    """
+    Traces every QSqlQuery exec()/execBatch() made from Python and every
+    BaseModel select()/fetchMore(): statement, bind count, row count and
+    duration. Queries slower than `slow_ms` are logged, with their EXPLAIN
+    QUERY PLAN when `explain_slow`. The SQL QSqlTableModel runs internally
+    (submitAll(), selectRow()) is not seen.
+    """
+    global _slow_ms, _explain
+    if slow_ms is not None:
+        _slow_ms = slow_ms
+    _explain = explain_slow
+    with _lock:
+        if _originals:
+            return
+        for cls, name, wrapper in (
+            (QSqlQuery, "exec", _traced_exec),
+            (QSqlQuery, "execBatch", _traced_exec_batch),
+            (QSqlQuery, "next", _traced_next),
+        ):
+            # The class dict holds sip's method descriptor, which is what has
+            # to be put back; getattr() gives the callable.
+            _originals[f"{cls.__name__}.{name}"] = vars(cls)[name]
+            _calls[f"{cls.__name__}.{name}"] = getattr(cls, name)
+            setattr(cls, name, wrapper)
+        for name in ("select", "fetchMore"):
+            _originals[f"BaseModel.{name}"] = _calls[f"BaseModel.{name}"] = vars(
+                BaseModel
+            )[name]
+            setattr(BaseModel, name, _traced_model_call(name))
+
+
+def disable():
+    with _lock:
+        for key, function in _originals.items():
+            cls = QSqlQuery if key.startswith("QSqlQuery.") else BaseModel
+            setattr(cls, key.split(".", 1)[1], function)
+        _originals.clear()
+        _calls.clear()
+
+
+def is_enabled() -> bool:
+    return bool(_originals)
+
+
+def slow_query_threshold_ms() -> float:
+    return _slow_ms
+
+
+def recent_queries() -> List[SqlTraceType]:
+    """The last RECENT_TRACES traced statements, oldest first."""
+    with _lock:
+        return list(_recent)
+
+
+def slow_queries() -> List[SqlTraceType]:
+    """The last SLOW_TRACES statements slower than the threshold."""
+    with _lock:
+        return list(_slow)
+
+
+def reset():
+    with _lock:
+        _recent.clear()
+        _slow.clear()
@@ -4,12 +4,19 @@ import shutil
 from fake_useragent import UserAgent
 from typing import Optional, List
 from src.services.base_service import BaseService
+from src.services.listing_read_model import ListingReadModel
 from src.models.user_model import UserModel, UserListedProductModel
-from src.my_types import UserType, UserListedProductType
+from src.my_types import (
+    UserType,
+    UserListedProductType,
+    ListedProductRowType,
+    UserListingSummaryType,
+)
 
 
 class UserService(BaseService):
     DATA_TYPE = UserType
+    DIRECT_SQL = True
 
     def __init__(self, model: UserModel):
         if not isinstance(model, UserModel):
@@ -52,7 +59,7 @@ class UserService(BaseService):
         return super().import_data(payload)
 
     def find_by_uid(self, uid: str) -> Optional[UserType]:
-        return self._find_by_model_index(find_method_name="find_row_by_uid", value=uid)
+        return self._find_by_key("uid", uid)
 
     def update_status(self, record_id: int, new_status: int) -> bool:
         if new_status not in [0, 1]:
@@ -94,6 +101,7 @@ class UserListedProductService(BaseService):
                 "model must be an instance of UserListedProductType or its subclass."
             )
         super().__init__(model)
+        self.read_model = ListingReadModel(self._connection_name)
 
     def create(self, payload: UserListedProductType):
         return super().create(payload)
@@ -126,6 +134,34 @@ class UserListedProductService(BaseService):
             results.append(self._map_record_to_datatype(record))
         return results
 
+    def read_listings(
+        self,
+        user_ids: Optional[List[int]] = None,
+        pids: Optional[List[str]] = None,
+        max_age_days: Optional[int] = None,
+    ) -> List[ListedProductRowType]:
+        return self.read_model.listings(
+            user_ids=user_ids, pids=pids, max_age_days=max_age_days
+        )
+
+    def read_stale_listings(
+        self,
+        user_ids: Optional[List[int]] = None,
+        max_age_days: Optional[int] = None,
+    ) -> List[ListedProductRowType]:
+        return self.read_model.stale_listings(
+            user_ids=user_ids, max_age_days=max_age_days
+        )
+
+    def read_user_summaries(
+        self,
+        user_ids: Optional[List[int]] = None,
+        max_age_days: Optional[int] = None,
+    ) -> List[UserListingSummaryType]:
+        return self.read_model.user_summaries(
+            user_ids=user_ids, max_age_days=max_age_days
+        )
+
     def shift_record_by_user_id(self, user_id: int) -> Optional[UserListedProductType]:
         if self.DATA_TYPE is None:
             info_msg = f"[{self.__class__.__name__}.shift_record_by_user_id] DATA_TYPE is not set. Cannot read. => return None"
@@ -160,6 +196,9 @@ class UserListedProductService(BaseService):
             return None
 
         if self.model.submitAll():
+            self._notify_written(
+                self._changes(deleted=[removed_data_instance.id]), model_updated=True
+            )
             return removed_data_instance
         else:
             error_msg = f"[{self.__class__.__name__}.shift_record_by_user_id] Failed to submit deletion for row {row_index_to_remove}. Error: {self.model.lastError().text()}"
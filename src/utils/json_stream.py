@@ -0,0 +1,172 @@
+# src/utils/json_stream.py
+import os
+import json
+import codecs
+from typing import Any, Dict, Iterator, TextIO, Tuple
+
+JSON_LINES_EXTENSIONS = (".jsonl", ".ndjson")
+_WHITESPACE = " \t\r\n"
+# Characters that end a JSON token: text before one of them cannot be
+# continued by the next chunk.
+_TOKEN_END = _WHITESPACE + ",:]}"
+
+
+def is_json_lines(file_path: str) -> bool:
+    return os.path.splitext(file_path)[1].lower() in JSON_LINES_EXTENSIONS
+
+
+def iter_json_items(
+    file_path: str, chunk_size: int = 64 * 1024
+) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """
+    Yields (item, bytes_read) for every element of a top-level JSON array, or
+    for every line of a JSON Lines file, without loading the whole file.
+    `bytes_read` is the position in the file and can be used for progress.
+    Raises json.JSONDecodeError / ValueError on malformed input.
+    """
+    if is_json_lines(file_path):
+        yield from _iter_json_lines(file_path)
+    else:
+        yield from _iter_json_array(file_path, chunk_size)
+
+
+def _iter_json_lines(file_path: str) -> Iterator[Tuple[Dict[str, Any], int]]:
+    with open(file_path, mode="rb") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line.decode("utf8")), f.tell()
+
+
+def _iter_json_array(
+    file_path: str, chunk_size: int
+) -> Iterator[Tuple[Dict[str, Any], int]]:
+    decoder = json.JSONDecoder()
+    with open(file_path, mode="rb") as raw:
+        f = _TextReader(raw)
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            nonlocal buffer, pos, eof
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            return True
+
+        def skip_whitespace():
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                    pos += 1
+                if pos < len(buffer) or not fill():
+                    return
+
+        skip_whitespace()
+        if pos >= len(buffer) or buffer[pos] != "[":
+            raise ValueError(
+                f"JSON file '{file_path}' does not contain a top-level list."
+            )
+        pos += 1
+        expect_item = True
+        while True:
+            skip_whitespace()
+            if pos >= len(buffer):
+                raise ValueError(f"Unexpected end of JSON file '{file_path}'.")
+            if buffer[pos] == "]":
+                return
+            if not expect_item:
+                if buffer[pos] != ",":
+                    raise ValueError(
+                        f"Expected ',' or ']' in JSON file '{file_path}' near byte {f.bytes_read}."
+                    )
+                pos += 1
+                expect_item = True
+                continue
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    # Only an error at the end of the buffer can come from an
+                    # item cut at the chunk boundary; anything else is malformed.
+                    cut = e.msg.startswith("Unterminated string") or _runs_to_end(
+                        buffer, e.pos
+                    )
+                    if not cut or eof or not fill():
+                        raise
+                    continue
+                # A number (or literal) ending the buffer may continue in the
+                # next chunk ("12" + "3"); decode it again with more data.
+                if eof or not _runs_to_end(buffer, end) or not fill():
+                    break
+            pos = end
+            expect_item = False
+            yield item, f.bytes_read
+
+
+def _runs_to_end(buffer: str, start: int) -> bool:
+    """True if no token boundary follows `start` in `buffer`, i.e. the token
+    at `start` may be cut by the end of the buffer."""
+    for index in range(start, len(buffer)):
+        if buffer[index] in _TOKEN_END:
+            return False
+    return True
+
+
+class _TextReader:
+    """Decodes a binary file incrementally and counts the bytes consumed."""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.bytes_read = 0
+
+    def read(self, size: int) -> str:
+        """Returns "" only at the end of the file: a chunk ending inside a
+        multibyte character (or the BOM) decodes to nothing, so read on."""
+        while True:
+            data = self._raw.read(size)
+            self.bytes_read += len(data)
+            text = self._decoder.decode(data, final=not data)
+            if text or not data:
+                return text
+
+
+class JsonArrayWriter:
+    """
+    Writes items one by one as a JSON array (same layout as json.dump with
+    indent=4) or as JSON Lines, so exports never hold the full dataset.
+    """
+
+    def __init__(self, f: TextIO, json_lines: bool = False):
+        self._f = f
+        self._json_lines = json_lines
+        self._count = 0
+
+    def __enter__(self):
+        if not self._json_lines:
+            self._f.write("[")
+        return self
+
+    def write(self, item: Dict[str, Any]):
+        if self._json_lines:
+            self._f.write(json.dumps(item, ensure_ascii=False))
+            self._f.write("\n")
+        else:
+            body = json.dumps(item, indent=4, ensure_ascii=False)
+            self._f.write(",\n    " if self._count else "\n    ")
+            self._f.write(body.replace("\n", "\n    "))
+        self._count += 1
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self._json_lines:
+            self._f.write("\n]" if self._count else "]")
+        return False
+
+    @property
+    def count(self) -> int:
+        return self._count
@@ -1,35 +1,88 @@
-from dataclasses import fields
+import re
 import random
+from dataclasses import fields
 from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, List, Tuple
 from src.my_constants import ICONS, RE_UNIT
 from src.my_types import RealEstateProductType
 
+_PLACEHOLDER_RE = re.compile(r"<(\w+)>")
+_PRODUCT_FIELDS = frozenset(
+    field_info.name for field_info in fields(RealEstateProductType)
+)
+# Placeholders rendered with str.title(); other fields use str.capitalize().
+_TITLE_FIELDS = frozenset(["street", "district", "ward", "province"])
+
+_KIND_TITLE = 0
+_KIND_CAPITALIZE = 1
+_KIND_UNIT = 2
+_KIND_ICON = 3
+
+
+class CompiledTemplate:
+    """
+    A template parsed once into literal and placeholder segments. render()
+    fills the placeholder slots and joins the segments, instead of running
+    str.replace over the whole template for every product field.
+    """
+
+    __slots__ = ("template", "_parts", "_slots")
+
+    def __init__(self, template: str):
+        self.template = template
+        self._parts: List[str] = []
+        # (position in _parts, kind, field name)
+        self._slots: List[Tuple[int, int, str]] = []
+        position = 0
+        for match in _PLACEHOLDER_RE.finditer(template):
+            name = match.group(1)
+            if name in _PRODUCT_FIELDS:
+                kind = _KIND_TITLE if name in _TITLE_FIELDS else _KIND_CAPITALIZE
+            elif name == "unit":
+                kind = _KIND_UNIT
+            elif name == "icon":
+                kind = _KIND_ICON
+            else:
+                continue  # Unknown placeholders stay in the text.
+            self._parts.append(template[position : match.start()])
+            self._slots.append((len(self._parts), kind, name))
+            self._parts.append("")
+            position = match.end()
+        self._parts.append(template[position:])
+
+    def render(self, product_data: RealEstateProductType) -> str:
+        if not self._slots:
+            return self.template
+        parts = self._parts.copy()
+        for position, kind, name in self._slots:
+            if kind == _KIND_ICON:
+                parts[position] = random.choice(ICONS)
+            elif kind == _KIND_UNIT:
+                parts[position] = RE_UNIT[product_data.transaction_type]
+            else:
+                value = getattr(product_data, name, None)
+                value = "" if value is None else str(value)
+                parts[position] = (
+                    value.title() if kind == _KIND_TITLE else value.capitalize()
+                )
+        return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def compile_template(template: str) -> CompiledTemplate:
+    """Parses `template` once; later calls with the same text hit the cache."""
+    return CompiledTemplate(template)
+
 
 def replace_template(product_data: RealEstateProductType, template: str) -> str:
-    result = template
-    for field_info in fields(RealEstateProductType):
-        field_name = field_info.name
-        field_value = getattr(product_data, field_name, None)
-        if field_value is None:
-            field_value = ""
-        placeholder = f"<{field_name}>"
-        if field_name in [
-            "street",
-            "district",
-            "ward",
-            "province",
-        ]:
-            result = result.replace(placeholder, str(field_value).title())
-        result = result.replace(placeholder, str(field_value).capitalize())
-
-    if "<unit>" in result:
-        result = result.replace("<unit>", RE_UNIT[product_data.transaction_type])
-
-    while "<icon>" in result:
-        random_icon = random.choice(ICONS)
-        result = result.replace("<icon>", random_icon, 1)
-
-    return result
+    return compile_template(template).render(product_data)
+
+
+def render_many(products: Iterable[RealEstateProductType], template: str) -> List[str]:
+    """Renders `template` for every product, compiling it only once."""
+    render = compile_template(template).render
+    return [render(product_data) for product_data in products]
 
 
 def init_footer_content(product_data: RealEstateProductType) -> str:
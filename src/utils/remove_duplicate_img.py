@@ -1,20 +1,43 @@
 import os
 import json
+import argparse
+
+from src.services.image_store import ImageStore
+
+# Usage:
+#   python -m src.utils.remove_duplicate_img <image_container> [--products products.json]
+#       [--adopt] [--gc]
+#
+# Lists the product image folders whose pid is not in the exported products
+# file, moves folders created before the image store into it (--adopt), and
+# removes the blobs no product references any more (--gc).
 
 if __name__ == "__main__":
-    img_container_dir = (
-        "/Volumes/KINGSTON/Dev/python/python.my-manager.v3/src/repositories/images"
+    parser = argparse.ArgumentParser(
+        description="Maintenance of the product image container."
     )
-    product_path = "/Volumes/KINGSTON/Dev/python/python.my-manager.v3/products.json"
+    parser.add_argument("img_container_dir")
+    parser.add_argument("--products", dest="product_path", default=None)
+    parser.add_argument("--adopt", action="store_true")
+    parser.add_argument("--gc", action="store_true")
+    args = parser.parse_args()
 
-    products = []
-    with open(product_path, "r") as f:
-        products = json.load(f)
+    store = ImageStore(args.img_container_dir)
 
-    pids = [product.get("pid") for product in products]
-    img_dirs = os.listdir(img_container_dir)
+    if args.product_path:
+        with open(args.product_path, "r") as f:
+            products = json.load(f)
+        set_pids = set(product.get("pid") for product in products)
+        set_img_dirs = set(os.path.basename(d) for d in store.product_dirs())
+        print(set_img_dirs.difference(set_pids))
 
-    set_pids = set(pids)
-    set_img_dirs = set(img_dirs)
+    if args.adopt:
+        freed = 0
+        for product_dir in store.product_dirs():
+            if store.read_manifest(product_dir) is None:
+                freed += store.adopt_product_dir(product_dir)
+        print(f"Deduplicated: {freed / 1024 / 1024:.1f} MiB")
 
-    print(set_img_dirs.difference(set_pids))
+    if args.gc:
+        removed, freed = store.collect_garbage(grace_seconds=0)
+        print(f"Removed {removed} blob(s), {freed / 1024 / 1024:.1f} MiB freed")
@@ -0,0 +1,184 @@
+# src/views/diagnostics/diagnostics_panel.py
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot
+from PyQt6.QtWidgets import (
+    QCheckBox,
+    QDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QTabWidget,
+    QVBoxLayout,
+)
+
+from src.services import instrumentation, sql_trace
+from src.my_constants import PATH_INSTRUMENTATION_DUMP
+
+
+class DiagnosticsPanel(QDialog):
+    """Live tables of the instrumented service/controller calls and of the
+    slow SQL statements."""
+
+    REFRESH_MS = 1000
+    COLUMNS = [
+        "Method",
+        "Calls",
+        "Errors",
+        "Total ms",
+        "Mean ms",
+        "p50 ms",
+        "p95 ms",
+        "p99 ms",
+        "Max ms",
+    ]
+    SQL_COLUMNS = ["ms", "Rows", "Binds", "Source", "Connection", "Statement"]
+
+    def __init__(self, parent=None):
+        super(DiagnosticsPanel, self).__init__(parent)
+        self.setWindowTitle("Diagnostics")
+        self.setModal(False)
+        self.resize(900, 480)
+
+        self.enabled_checkbox = QCheckBox("Time service and controller calls", self)
+        self.reset_btn = QPushButton("Reset", self)
+        self.dump_btn = QPushButton("Dump to file", self)
+        self.summary_label = QLabel(self)
+        self.stats_table = QTableWidget(0, len(self.COLUMNS), self)
+        self.stats_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.stats_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.stats_table.verticalHeader().setVisible(False)
+        self.stats_table.horizontalHeader().setSectionResizeMode(
+            0, QHeaderView.ResizeMode.Stretch
+        )
+
+        self.sql_trace_checkbox = QCheckBox("Trace SQL", self)
+        self.slow_sql_table = QTableWidget(0, len(self.SQL_COLUMNS), self)
+        self.slow_sql_table.setHorizontalHeaderLabels(self.SQL_COLUMNS)
+        self.slow_sql_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.slow_sql_table.verticalHeader().setVisible(False)
+        self.slow_sql_table.horizontalHeader().setSectionResizeMode(
+            len(self.SQL_COLUMNS) - 1, QHeaderView.ResizeMode.Stretch
+        )
+        self.tabs = QTabWidget(self)
+        self.tabs.addTab(self.stats_table, "Calls")
+        self.tabs.addTab(self.slow_sql_table, "Slow SQL")
+
+        actions_layout = QHBoxLayout()
+        actions_layout.addWidget(self.enabled_checkbox)
+        actions_layout.addWidget(self.sql_trace_checkbox)
+        actions_layout.addStretch()
+        actions_layout.addWidget(self.reset_btn)
+        actions_layout.addWidget(self.dump_btn)
+        layout = QVBoxLayout(self)
+        layout.addLayout(actions_layout)
+        layout.addWidget(self.tabs)
+        layout.addWidget(self.summary_label)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+
+        self.setup_events()
+
+    def setup_events(self):
+        self.enabled_checkbox.toggled.connect(self.on_enabled_toggled)
+        self.sql_trace_checkbox.toggled.connect(self.on_sql_trace_toggled)
+        self.reset_btn.clicked.connect(self.on_reset_clicked)
+        self.dump_btn.clicked.connect(self.on_dump_clicked)
+
+    def showEvent(self, event):
+        self.enabled_checkbox.setChecked(instrumentation.is_enabled())
+        self.sql_trace_checkbox.setChecked(sql_trace.is_enabled())
+        self.refresh()
+        self._timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    @pyqtSlot()
+    def refresh(self):
+        stats = instrumentation.snapshot()
+        self.stats_table.setSortingEnabled(False)
+        self.stats_table.setRowCount(len(stats))
+        for row, item in enumerate(stats):
+            values = [
+                item.count,
+                item.errors,
+                item.total_ms,
+                item.mean_ms,
+                item.p50_ms,
+                item.p95_ms,
+                item.p99_ms,
+                item.max_ms,
+            ]
+            self.stats_table.setItem(row, 0, QTableWidgetItem(item.name))
+            for column, value in enumerate(values, start=1):
+                cell = QTableWidgetItem()
+                cell.setData(
+                    Qt.ItemDataRole.DisplayRole,
+                    value if isinstance(value, int) else round(value, 2),
+                )
+                cell.setTextAlignment(
+                    Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+                )
+                self.stats_table.setItem(row, column, cell)
+        self.stats_table.setSortingEnabled(True)
+        slow_queries = sql_trace.slow_queries()
+        self.refresh_slow_sql(slow_queries)
+        state = "on" if instrumentation.is_enabled() else "off"
+        sql_state = "on" if sql_trace.is_enabled() else "off"
+        self.summary_label.setText(
+            f"Instrumentation {state}, {len(stats)} method(s), "
+            f"{sum(item.count for item in stats)} call(s). SQL tracing {sql_state}, "
+            f"{len(slow_queries)} statement(s) over {sql_trace.slow_query_threshold_ms():g} ms."
+        )
+
+    def refresh_slow_sql(self, slow_queries):
+        self.slow_sql_table.setRowCount(len(slow_queries))
+        # Newest first.
+        for row, trace in enumerate(reversed(slow_queries)):
+            values = [
+                round(trace.duration_ms, 1),
+                trace.row_count,
+                trace.bind_count,
+                trace.source,
+                trace.connection or "",
+                trace.statement,
+            ]
+            for column, value in enumerate(values):
+                cell = QTableWidgetItem()
+                cell.setData(Qt.ItemDataRole.DisplayRole, value)
+                if trace.plan:
+                    cell.setToolTip("\n".join(trace.plan))
+                self.slow_sql_table.setItem(row, column, cell)
+
+    @pyqtSlot(bool)
+    def on_enabled_toggled(self, checked: bool):
+        if checked:
+            instrumentation.enable()
+        else:
+            instrumentation.disable()
+        self.refresh()
+
+    @pyqtSlot(bool)
+    def on_sql_trace_toggled(self, checked: bool):
+        if checked:
+            sql_trace.enable()
+        else:
+            sql_trace.disable()
+        self.refresh()
+
+    @pyqtSlot()
+    def on_reset_clicked(self):
+        instrumentation.reset()
+        sql_trace.reset()
+        self.refresh()
+
+    @pyqtSlot()
+    def on_dump_clicked(self):
+        if instrumentation.dump(PATH_INSTRUMENTATION_DUMP):
+            self.summary_label.setText(f"Written to '{PATH_INSTRUMENTATION_DUMP}'.")
@@ -1,8 +1,15 @@
 # src/views/mainwindow.py
-from typing import List
+from typing import List, Optional
 from PyQt6.QtCore import Qt, pyqtSlot
-from PyQt6.QtWidgets import QMainWindow, QLabel, QMessageBox, QProgressBar
+from PyQt6.QtWidgets import (
+    QMainWindow,
+    QLabel,
+    QMessageBox,
+    QProgressBar,
+    QPushButton,
+)
 from PyQt6.QtCore import QTimer
+from PyQt6.QtGui import QKeySequence, QShortcut
 
 from src.my_types import (
     SettingProxyType,
@@ -21,11 +28,13 @@ from src.controllers.setting_controller import (
     SettingUserDataDirController,
 )
 from src.controllers.robot_controller import RobotController
+from src.services.db_job_runner import DbJobRunner
 
 from src.views.product.real_estate_product_page import RealEstateProductPage
 from src.views.user.user_page import UserPage
 from src.views.robot.robot_page import RobotPage
 from src.views.settings.dialog_settings import DialogSettings
+from src.views.diagnostics.diagnostics_panel import DiagnosticsPanel
 from src.ui.mainwindow_ui import Ui_MainWindow
 from src.views.utils.file_dialogs import dialog_open_file, dialog_save_file
 
@@ -42,6 +51,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         misc_product_controller: MiscProductController,
         setting_proxy_controller: SettingProxyController,
         setting_user_data_dir_controller: SettingUserDataDirController,
+        job_runner: Optional[DbJobRunner] = None,
         parent=None,
     ):
         super(MainWindow, self).__init__(parent)
@@ -67,6 +77,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         )
         self.user_page = UserPage(
             user_controller=self._user_controller,
+            listed_product_controller=self._user_listed_product_controller,
             setting_udd_controller=self._setting_user_data_dir_controller,
             setting_proxy_controller=self._setting_proxy_controller,
             parent=self,
@@ -83,6 +94,13 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.progress_bar.setVisible(False)
         self.status_bar.addPermanentWidget(self.progress_bar)
 
+        self._job_runner = job_runner
+        self.cancel_task_btn = QPushButton("Cancel", self)
+        self.cancel_task_btn.setVisible(False)
+        self.status_bar.addPermanentWidget(self.cancel_task_btn)
+
+        self.diagnostics_panel: Optional[DiagnosticsPanel] = None
+
         self.setup_ui()
         self.setup_events()
 
@@ -105,6 +123,9 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             controller.warning_signal.connect(self.set_status_bar)
             controller.info_signal.connect(self.set_status_bar)
             controller.task_progress_signal.connect(self.set_progress)
+            controller.background_task_finished_signal.connect(
+                self.on_background_task_finished
+            )
 
     def setup_ui(self):
         self.content_container.addWidget(self.real_estate_product_page)
@@ -127,6 +148,23 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             lambda: self.on_sidebar_btn_clicked("robot")
         )
         self.sidebar_robot_settings.clicked.connect(self.on_robot_settings_clicked)
+        diagnostics_shortcut = QShortcut(QKeySequence("Ctrl+Shift+D"), self)
+        diagnostics_shortcut.activated.connect(self.on_diagnostics_requested)
+        if self._job_runner is not None:
+            self.cancel_task_btn.clicked.connect(lambda: self._job_runner.cancel_all())
+            self._job_runner.job_started.connect(
+                lambda _: self.cancel_task_btn.setVisible(True)
+            )
+            for signal in (
+                self._job_runner.job_finished,
+                self._job_runner.job_failed,
+                self._job_runner.job_cancelled,
+            ):
+                signal.connect(
+                    lambda *_: self.cancel_task_btn.setVisible(
+                        self._job_runner.has_pending_jobs()
+                    )
+                )
 
     @pyqtSlot(str)
     def on_sidebar_btn_clicked(self, page_name: str):
@@ -139,6 +177,13 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         elif page_name == "robot":
             self.content_container.setCurrentWidget(self.robot_page)
 
+    @pyqtSlot()
+    def on_diagnostics_requested(self):
+        if self.diagnostics_panel is None:
+            self.diagnostics_panel = DiagnosticsPanel(parent=self)
+        self.diagnostics_panel.show()
+        self.diagnostics_panel.raise_()
+
     @pyqtSlot()
     def on_robot_settings_clicked(self):
         dialog_settings = DialogSettings(
@@ -215,11 +260,7 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             current_controller = self._real_estate_template_controller
         else:
             return
-        is_exported = current_controller.export_to_file(file_path=file_path)
-        if is_exported:
-            QMessageBox.about(self, "Exported file", f"Export to {file_path}")
-        else:
-            QMessageBox.critical(self, "Error", "Failed to export data")
+        current_controller.export_to_file_async(file_path)
 
     @pyqtSlot(str)
     def on_import_clicked(self, setting_option: str):
@@ -235,11 +276,20 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             current_controller = self._real_estate_template_controller
         else:
             return
-        is_imported = current_controller.import_products(file_path)
-        if is_imported:
-            QMessageBox.about(self, "Imported file", f"Import to {file_path}")
-        else:
-            QMessageBox.critical(self, "Error", "Failed to import data")
+        current_controller.import_products_async(file_path)
+
+    @pyqtSlot(str, str, bool)
+    def on_background_task_finished(self, task_name: str, file_path: str, ok: bool):
+        if task_name == "export":
+            if ok:
+                QMessageBox.about(self, "Exported file", f"Export to {file_path}")
+            else:
+                QMessageBox.critical(self, "Error", "Failed to export data")
+        elif task_name == "import":
+            if ok:
+                QMessageBox.about(self, "Imported file", f"Import to {file_path}")
+            else:
+                QMessageBox.critical(self, "Error", "Failed to import data")
 
     @pyqtSlot(str)
     def set_status_bar(self, message: str):
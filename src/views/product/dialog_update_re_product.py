@@ -122,7 +122,7 @@ class DialogUpdateREProduct(QDialog, Ui_Dialog_REProduct):
             self.wards_combobox.setCurrentIndex(idx)
 
         # Street
-        self.street_input.setText(str(self.product_data.street))
+        self.street_input.setText(self.product_data.street or "")
 
         # Category
         idx = self.categories_combobox.findData(self.product_data.category)
@@ -130,10 +130,14 @@ class DialogUpdateREProduct(QDialog, Ui_Dialog_REProduct):
             self.categories_combobox.setCurrentIndex(idx)
 
         # Area
-        self.area_input.setText(str(self.product_data.area))
+        self.area_input.setText(
+            "" if self.product_data.area is None else str(self.product_data.area)
+        )
 
         # Price
-        self.price_input.setText(str(self.product_data.price))
+        self.price_input.setText(
+            "" if self.product_data.price is None else str(self.product_data.price)
+        )
 
         # Legal
         idx = self.legal_s_combobox.findData(self.product_data.legal)
@@ -141,10 +145,14 @@ class DialogUpdateREProduct(QDialog, Ui_Dialog_REProduct):
             self.legal_s_combobox.setCurrentIndex(idx)
 
         # Structure
-        self.structure_input.setText(str(self.product_data.structure))
+        self.structure_input.setText(
+            ""
+            if self.product_data.structure is None
+            else str(self.product_data.structure)
+        )
 
         # Function
-        self.function_input.setText(str(self.product_data.function))
+        self.function_input.setText(self.product_data.function or "")
 
         # Building line
         idx = self.building_line_s_combobox.findData(self.product_data.building_line)
@@ -157,7 +165,7 @@ class DialogUpdateREProduct(QDialog, Ui_Dialog_REProduct):
             self.furniture_s_combobox.setCurrentIndex(idx)
 
         # Description
-        self.description_input.setPlainText(str(self.product_data.description))
+        self.description_input.setPlainText(self.product_data.description or "")
 
     def _display_image(self, image_paths: List[str]):
         if not len(image_paths):
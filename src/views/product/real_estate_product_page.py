@@ -1,8 +1,15 @@
 # src/views/product/product.py
 import os, sys
 from typing import List, Optional
-from PyQt6.QtGui import QAction, QPixmap, QMouseEvent, QShortcut, QKeySequence
-from PyQt6.QtWidgets import QWidget, QMenu, QMessageBox
+from PyQt6.QtGui import (
+    QAction,
+    QImage,
+    QPixmap,
+    QMouseEvent,
+    QShortcut,
+    QKeySequence,
+)
+from PyQt6.QtWidgets import QWidget, QMenu, QMessageBox, QLineEdit
 from PyQt6.QtCore import (
     Qt,
     pyqtSlot,
@@ -21,12 +28,14 @@ from src.controllers.setting_controller import SettingUserDataDirController
 
 from src.views.product.dialog_create_re_product import DialogCreateREProduct
 from src.views.product.dialog_update_re_product import DialogUpdateREProduct
-from src.views.utils.multi_field_model import MultiFieldFilterProxyModel
+from src.views.utils.sql_filter_model import SqlFilterProxyModel
+from src.views.utils.thumbnail_loader import ThumbnailLoader
 from src.ui.page_re_product_ui import Ui_PageREProduct
 
 from src.my_types import RealEstateProductType
 from src.utils.re_template import replace_template, init_footer_content
 from src.views.utils.file_dialogs import dialog_open_file, dialog_save_file
+from src.views.utils.lazy_page import LazyModelPageMixin
 from src.my_constants import (
     RE_WARD,
     RE_TRANSACTION,
@@ -37,7 +46,7 @@ from src.my_constants import (
 )
 
 
-class RealEstateProductPage(QWidget, Ui_PageREProduct):
+class RealEstateProductPage(LazyModelPageMixin, QWidget, Ui_PageREProduct):
     def __init__(
         self,
         product_controller: RealEstateProductController,
@@ -61,11 +70,12 @@ class RealEstateProductPage(QWidget, Ui_PageREProduct):
         self.base_template_model: RealEstateTemplateModel = (
             self._template_controller.service.model
         )
-        self.proxy_product_model = MultiFieldFilterProxyModel()
-        self.proxy_product_model.setSourceModel(self.base_product_model)
+        self.proxy_product_model = SqlFilterProxyModel(self.base_product_model)
 
         self.current_product: Optional[RealEstateProductType] = None
         self.current_image_paths: List[str] = []
+        self.thumbnail_loader = ThumbnailLoader(parent=self)
+        self.thumbnail_loader.thumbnail_ready.connect(self.on_thumbnail_ready)
 
         self.setup_ui()
         self.setup_events()
@@ -74,6 +84,7 @@ class RealEstateProductPage(QWidget, Ui_PageREProduct):
     def setup_ui(self):
         self.set_product_table()
         self.set_comboboxes()
+        self.set_search_input()
 
     def setup_events(self):
         self.action_create_btn.clicked.connect(self.on_create_product)
@@ -115,7 +126,21 @@ class RealEstateProductPage(QWidget, Ui_PageREProduct):
         for key, value in RE_LEGAL.items():
             self.legal_s_combobox.addItem(value.capitalize(), key)
 
+    def set_search_input(self):
+        self.search_input = QLineEdit(parent=self.search_container)
+        self.search_input.setObjectName("search_input")
+        self.search_input.setPlaceholderText(
+            "Tìm kiếm (mã, địa chỉ, mô tả), ví dụ: da lat"
+        )
+        self.search_input.setClearButtonEnabled(True)
+        self.gridLayout_3.addWidget(self.search_input, 1, 0, 1, 1)
+
     def set_filters(self):
+        self.search_input.textChanged.connect(
+            lambda text: self.proxy_product_model.set_search_condition(
+                self._product_controller.search_condition(text)
+            )
+        )
         model = self.base_product_model
         filter_widgets = [
             (self.pid_input, model.fieldIndex("pid")),
@@ -142,7 +167,7 @@ class RealEstateProductPage(QWidget, Ui_PageREProduct):
             elif hasattr(widget, "currentTextChanged"):
                 widget.currentTextChanged.connect(
                     lambda text, col=column: self.proxy_product_model.set_filter(
-                        col, "" if text == "Tất cả" or text == "" else text
+                        col, "" if text == "Tất cả" or text == "" else text, exact=True
                     )
                 )
 
@@ -171,7 +196,7 @@ class RealEstateProductPage(QWidget, Ui_PageREProduct):
             self.products_table.SelectionBehavior.SelectRows
         )
         self.products_table.setSelectionMode(
-            self.products_table.SelectionMode.SingleSelection
+            self.products_table.SelectionMode.ExtendedSelection
         )
         self.products_table.setEditTriggers(
             self.products_table.EditTrigger.NoEditTriggers
@@ -223,7 +248,23 @@ class RealEstateProductPage(QWidget, Ui_PageREProduct):
         global_pos = self.products_table.mapToGlobal(pos)
         menu = QMenu(self.products_table)
 
-        if status_value == 1:
+        selected_ids = self.get_selected_ids()
+        if len(selected_ids) > 1:
+            count = len(selected_ids)
+            set_available = QAction(f"Change {count} products to available", self)
+            set_unavailable = QAction(f"Change {count} products to unavailable", self)
+            toggle_status = QAction(f"Toggle status of {count} products", self)
+            set_available.triggered.connect(
+                lambda _, ids=selected_ids: self.handle_set_status(ids, 1)
+            )
+            set_unavailable.triggered.connect(
+                lambda _, ids=selected_ids: self.handle_set_status(ids, 0)
+            )
+            toggle_status.triggered.connect(self.handle_change_status)
+            menu.addAction(set_available)
+            menu.addAction(set_unavailable)
+            menu.addAction(toggle_status)
+        elif status_value == 1:
             set_unavailable = QAction("Change to unavailable", self)
             menu.addAction(set_unavailable)
             set_unavailable.triggered.connect(self.handle_change_status)
@@ -310,7 +351,10 @@ class RealEstateProductPage(QWidget, Ui_PageREProduct):
     def handle_change_status(self):
         selected_ids = self.get_selected_ids()
         if len(selected_ids):
-            self._product_controller.toggle_status(selected_ids[0])
+            self._product_controller.bulk_toggle_status(selected_ids)
+
+    def handle_set_status(self, record_ids: List[int], status: int):
+        self._product_controller.bulk_update_products(record_ids, status=status)
 
     @pyqtSlot(RealEstateProductType)
     def handle_update_product(self, product_data: RealEstateProductType):
@@ -375,15 +419,15 @@ class RealEstateProductPage(QWidget, Ui_PageREProduct):
         if not len(image_paths):
             self.image_label.setText("Failed to load image.")
             return
-        pixmap = QPixmap(image_paths[0])
-        if not pixmap.isNull():
-            self.image_label.setPixmap(
-                pixmap.scaled(
-                    self.image_label.size(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-            )
+        # Decoded on a worker thread; on_thumbnail_ready sets the pixmap.
+        self.thumbnail_loader.request(image_paths[0], self.image_label.size())
+
+    @pyqtSlot(str, QImage)
+    def on_thumbnail_ready(self, image_path: str, image: QImage):
+        if not self.current_image_paths or self.current_image_paths[0] != image_path:
+            return
+        if not image.isNull():
+            self.image_label.setPixmap(QPixmap.fromImage(image))
         else:
             self.image_label.setText("Failed to load image.")
 
@@ -406,19 +450,12 @@ class RealEstateProductPage(QWidget, Ui_PageREProduct):
         file_path = dialog_save_file(self)
         if not file_path:
             return
-        is_exported = self._product_controller.export_to_file(file_path=file_path)
-        if is_exported:
-            QMessageBox.about(self, "Exported file", f"Export to {file_path}")
-        else:
-            QMessageBox.critical(self, "Error", "Failed to export data")
+        # The result is reported by MainWindow.on_background_task_finished.
+        self._product_controller.export_to_file_async(file_path)
 
     @pyqtSlot()
     def on_import_clicked(self):
         file_path = dialog_open_file(self)
         if not file_path:
             return
-        is_imported = self._product_controller.import_products(file_path)
-        if is_imported:
-            QMessageBox.about(self, "Imported file", f"Import to {file_path}")
-        else:
-            QMessageBox.critical(self, "Error", "Failed to import data")
+        self._product_controller.import_products_async(file_path)
@@ -1,5 +1,5 @@
 # src/views/robot/robot_page.py
-from typing import List, Optional, Dict
+from typing import List, Dict
 from PyQt6.QtWidgets import QWidget, QLineEdit, QCompleter, QTreeWidgetItem, QMessageBox
 from PyQt6.QtCore import Qt, pyqtSlot, QStringListModel
 from PyQt6.QtGui import QShortcut, QKeySequence
@@ -7,14 +7,16 @@ from PyQt6.QtGui import QShortcut, QKeySequence
 from src.controllers.robot_controller import RobotController
 
 from src.views.utils.multi_field_model import MultiFieldFilterProxyModel
+from src.views.utils.lazy_page import LazyModelPageMixin
 from src.views.robot.action_payload import ActionPayload
 from src.views.robot.dialog_run_bot import DialogRobotRun
 from src.ui.page_robot_ui import Ui_PageRobot
 
+from src.services.record_mapper import mapper_for
 from src.my_types import UserType
 
 
-class RobotPage(QWidget, Ui_PageRobot):
+class RobotPage(LazyModelPageMixin, QWidget, Ui_PageRobot):
     def __init__(
         self,
         robot_controller: RobotController,
@@ -44,6 +46,10 @@ class RobotPage(QWidget, Ui_PageRobot):
         self.set_filters()
         self.action_add_btn.clicked.connect(self.on_add_action_clicked)
         self.action_save_btn.clicked.connect(self.on_save_action_clicked)
+        self._robot_controller.actions_ready_signal.connect(self.on_actions_ready)
+        self._robot_controller.error_signal.connect(
+            lambda _msg: self.action_save_btn.setEnabled(True)
+        )
         self.action_run_btn.clicked.connect(self.on_run_action_clicked)
         shortcut_new_action = QShortcut(QKeySequence("Ctrl+N"), self)
         shortcut_new_action.activated.connect(self.on_add_action_clicked)
@@ -100,35 +106,12 @@ class RobotPage(QWidget, Ui_PageRobot):
             )
             return []
 
+        map_record = mapper_for(UserType, source_model.record()).map_record
         for proxy_index in selected_proxy_indexes:
             source_index = self.proxy_model.mapToSource(proxy_index)
-            row = source_index.row()
-            record = source_model.record(row)
-
-            user_data_dict = {}
-            for field_info in UserType.__dataclass_fields__.values():
-                field_name = field_info.name
-                if record.contains(field_name):
-                    value = record.value(field_name)
-                    if field_info.type == Optional[int] and isinstance(value, str):
-                        try:
-                            user_data_dict[field_name] = int(value) if value else None
-                        except ValueError:
-                            user_data_dict[field_name] = None
-                    elif field_info.type == Optional[float] and isinstance(value, str):
-                        try:
-                            user_data_dict[field_name] = float(value) if value else None
-                        except ValueError:
-                            user_data_dict[field_name] = None
-                    else:
-                        user_data_dict[field_name] = value
-            try:
-                user_type_instance = UserType(**user_data_dict)
-                selected_users_data.append(user_type_instance)
-            except TypeError as e:
-                print(f"Error creating UserType instance for row {row}: {e}")
-                print(f"Data tried to assign: {user_data_dict}")
-
+            selected_users_data.append(
+                map_record(source_model.record(source_index.row()))
+            )
         return selected_users_data
 
     def set_action_tree(self):
@@ -149,11 +132,24 @@ class RobotPage(QWidget, Ui_PageRobot):
 
     def fill_actions_tree(self):
         self.actions_tree.clear()
+        summaries = self._robot_controller.read_listing_summaries(
+            [
+                actions[0].user_info.id
+                for actions in self.browser_actions.values()
+                if actions
+            ]
+        )
         for uid, actions in self.browser_actions.items():
             if not actions:
                 continue
             user_info: UserType = actions[0].user_info
-            user_item = QTreeWidgetItem([f"{user_info.username} | {user_info.uid}"])
+            label = f"{user_info.username} | {user_info.uid}"
+            summary = summaries.get(user_info.id)
+            if summary is not None:
+                label += (
+                    f" | listed {summary.listed_count} ({summary.stale_count} stale)"
+                )
+            user_item = QTreeWidgetItem([label])
             for action in actions:
                 action_name = (
                     action.action_name
@@ -196,11 +192,15 @@ class RobotPage(QWidget, Ui_PageRobot):
             return
         action_payloads = [w.get_values() for w in action_widgets]
 
-        new_browser_actions = self._robot_controller.init_actions(
+        self.action_save_btn.setEnabled(False)
+        self._robot_controller.init_actions_async(
             list_user_data=selected_users,
             action_payloads=action_payloads,
         )
 
+    @pyqtSlot(dict)
+    def on_actions_ready(self, new_browser_actions: dict):
+        self.action_save_btn.setEnabled(True)
         for uid, browser_action in new_browser_actions.items():
             self.browser_actions[uid] = browser_action
 
@@ -128,6 +128,8 @@ class DialogSettings(QDialog, Ui_Dialog_Settings):
             self.tableView.setModel(self._proxy_setting_model)
         if "re_template" == setting_option_name:
             self.tableView.setModel(self._re_template_model)
+        if self.tableView.model() is not None:
+            self.tableView.model().ensure_selected()
         self.tableView.hideColumn(0)
 
     @pyqtSlot()
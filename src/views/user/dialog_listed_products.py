@@ -0,0 +1,121 @@
+# src/views/user/dialog_listed_products.py
+from typing import List
+
+from PyQt6.QtCore import Qt, pyqtSlot
+from PyQt6.QtWidgets import (
+    QCheckBox,
+    QDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QSpinBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from src.controllers.user_controller import UserListedProductController
+from src.my_types import ListedProductRowType
+
+
+class DialogListedProducts(QDialog):
+    """The products listed by the selected accounts, joined with the
+    product database in one query (ListingReadModel). Stale listings (product
+    gone, unavailable or older than the age limit) are highlighted."""
+
+    COLUMNS = [
+        "Username",
+        "UID",
+        "PID",
+        "Listed at",
+        "Transaction",
+        "Category",
+        "Ward",
+        "Price",
+        "Area",
+        "Stale",
+    ]
+
+    def __init__(
+        self,
+        listed_product_controller: UserListedProductController,
+        user_ids: List[int],
+        parent=None,
+    ):
+        super(DialogListedProducts, self).__init__(parent)
+        self.setWindowTitle("Listed products")
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        self.resize(960, 480)
+        self._listed_product_controller = listed_product_controller
+        self._user_ids = user_ids
+
+        self.stale_only_checkbox = QCheckBox("Stale only", self)
+        self.max_age_input = QSpinBox(self)
+        self.max_age_input.setRange(0, 3650)
+        self.max_age_input.setSpecialValueText("no age limit")
+        self.max_age_input.setSuffix(" days")
+        self.summary_label = QLabel(self)
+        self.listings_table = QTableWidget(0, len(self.COLUMNS), self)
+        self.listings_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.listings_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.listings_table.verticalHeader().setVisible(False)
+        self.listings_table.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.ResizeToContents
+        )
+
+        filters_layout = QHBoxLayout()
+        filters_layout.addWidget(self.stale_only_checkbox)
+        filters_layout.addWidget(QLabel("Stale after", self))
+        filters_layout.addWidget(self.max_age_input)
+        filters_layout.addStretch()
+        layout = QVBoxLayout(self)
+        layout.addLayout(filters_layout)
+        layout.addWidget(self.listings_table)
+        layout.addWidget(self.summary_label)
+
+        self.stale_only_checkbox.toggled.connect(self.refresh)
+        self.max_age_input.valueChanged.connect(self.refresh)
+        self.refresh()
+
+    @pyqtSlot()
+    def refresh(self):
+        max_age_days = self.max_age_input.value() or None
+        if self.stale_only_checkbox.isChecked():
+            listings = self._listed_product_controller.read_stale_listings(
+                user_ids=self._user_ids, max_age_days=max_age_days
+            )
+        else:
+            listings = self._listed_product_controller.read_listings(
+                user_ids=self._user_ids, max_age_days=max_age_days
+            )
+        self.fill_table(listings)
+
+    def fill_table(self, listings: List[ListedProductRowType]):
+        self.listings_table.setSortingEnabled(False)
+        self.listings_table.setRowCount(len(listings))
+        for row, listing in enumerate(listings):
+            values = [
+                listing.username,
+                listing.uid,
+                listing.pid,
+                listing.listed_at,
+                listing.transaction_type,
+                listing.category,
+                listing.ward,
+                listing.price,
+                listing.area,
+                "yes" if listing.is_stale else "",
+            ]
+            for column, value in enumerate(values):
+                cell = QTableWidgetItem()
+                cell.setData(
+                    Qt.ItemDataRole.DisplayRole, "" if value is None else value
+                )
+                if listing.is_stale:
+                    cell.setForeground(Qt.GlobalColor.darkRed)
+                self.listings_table.setItem(row, column, cell)
+        self.listings_table.setSortingEnabled(True)
+        stale_count = sum(1 for listing in listings if listing.is_stale)
+        self.summary_label.setText(
+            f"{len(listings)} listed product(s), {stale_count} stale."
+        )
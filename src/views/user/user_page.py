@@ -9,7 +9,10 @@ from PyQt6.QtCore import (
 from PyQt6.QtGui import QAction, QShortcut, QKeySequence
 
 from src.my_types import UserType
-from src.controllers.user_controller import UserController
+from src.controllers.user_controller import (
+    UserController,
+    UserListedProductController,
+)
 from src.controllers.setting_controller import (
     SettingUserDataDirController,
     SettingProxyController,
@@ -17,14 +20,17 @@ from src.controllers.setting_controller import (
 from src.ui.page_user_ui import Ui_PageUser
 from src.views.user.dialog_create_user import DialogCreateUser
 from src.views.user.dialog_update_user import DialogUpdateUser
-from src.views.utils.multi_field_model import MultiFieldFilterProxyModel
+from src.views.user.dialog_listed_products import DialogListedProducts
+from src.views.utils.sql_filter_model import SqlFilterProxyModel
 from src.views.utils.file_dialogs import dialog_open_file, dialog_save_file
+from src.views.utils.lazy_page import LazyModelPageMixin
 
 
-class UserPage(QWidget, Ui_PageUser):
+class UserPage(LazyModelPageMixin, QWidget, Ui_PageUser):
     def __init__(
         self,
         user_controller: UserController,
+        listed_product_controller: UserListedProductController,
         setting_udd_controller: SettingUserDataDirController,
         setting_proxy_controller: SettingProxyController,
         parent=None,
@@ -35,11 +41,11 @@ class UserPage(QWidget, Ui_PageUser):
         self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
 
         self._user_controller = user_controller
+        self._listed_product_controller = listed_product_controller
         self._setting_udd_controller = setting_udd_controller
         self._setting_proxy_controller = setting_proxy_controller
         self.base_user_model = user_controller.service.model
-        self.proxy_model = MultiFieldFilterProxyModel()
-        self.proxy_model.setSourceModel(self.base_user_model)
+        self.proxy_model = SqlFilterProxyModel(self.base_user_model)
 
         self.setup_ui()
         self.setup_events()
@@ -131,6 +137,8 @@ class UserPage(QWidget, Ui_PageUser):
         )
         check_action = QAction("Check live", self)
         check_action.triggered.connect(self.on_check_live)
+        listed_products_action = QAction("Listed products", self)
+        listed_products_action.triggered.connect(self.on_listed_products)
         update_action = QAction("Update", self)
         update_action.triggered.connect(
             lambda _, record_id=id_value: self.on_update_product(record_id)
@@ -143,6 +151,7 @@ class UserPage(QWidget, Ui_PageUser):
         menu.addAction(launch_as_desktop_action)
         menu.addAction(launch_as_mobile_action)
         menu.addAction(check_action)
+        menu.addAction(listed_products_action)
         if set_status_action:
             menu.addAction(set_status_action)
         menu.addAction(update_action)
@@ -189,6 +198,16 @@ class UserPage(QWidget, Ui_PageUser):
             ids.append(id_value)
         return sorted(ids)
 
+    @pyqtSlot()
+    def on_listed_products(self):
+        user_ids = self.get_selected_ids()
+        if not user_ids:
+            return
+        self.listed_products_dialog = DialogListedProducts(
+            self._listed_product_controller, user_ids, self
+        )
+        self.listed_products_dialog.show()
+
     @pyqtSlot()
     def on_create_user(self):
         current_time = self._user_controller.handle_new_time()
@@ -283,19 +302,12 @@ class UserPage(QWidget, Ui_PageUser):
         file_path = dialog_save_file(self)
         if not file_path:
             return
-        is_exported = self._user_controller.export_to_file(file_path=file_path)
-        if is_exported:
-            QMessageBox.about(self, "Exported file", f"Export to {file_path}")
-        else:
-            QMessageBox.critical(self, "Error", "Failed to export data")
+        # The result is reported by MainWindow.on_background_task_finished.
+        self._user_controller.export_to_file_async(file_path)
 
     @pyqtSlot()
     def on_import_clicked(self):
         file_path = dialog_open_file(self)
         if not file_path:
             return
-        is_imported = self._user_controller.import_products(file_path)
-        if is_imported:
-            QMessageBox.about(self, "Imported file", f"Import to {file_path}")
-        else:
-            QMessageBox.critical(self, "Error", "Failed to import data")
+        self._user_controller.import_products_async(file_path)
@@ -3,7 +3,7 @@ from PyQt6.QtCore import QUrl
 
 
 def dialog_open_file(parent):
-    json_filter = "Json file (*.json)"
+    json_filter = "Json file (*.json *.jsonl *.ndjson)"
     json_path, _ = QFileDialog.getOpenFileUrl(
         parent,
         "Select json file",
@@ -20,6 +20,6 @@ def dialog_save_file(parent):
         parent,
         "Lưu File Văn Bản",  # Save Text File
         "",  # Thư mục mặc định (rỗng để sử dụng thư mục hiện tại hoặc thư mục đã mở gần đây)
-        "Json file (*.json)",  # Filters
+        "Json file (*.json);;Json lines (*.jsonl)",  # Filters
     )
     return json_path
@@ -0,0 +1,28 @@
+# src/views/utils/lazy_page.py
+from PyQt6.QtCore import QAbstractItemModel, QAbstractProxyModel
+from PyQt6.QtWidgets import QAbstractItemView
+
+
+def lazy_source_model(model: QAbstractItemModel):
+    """The first model of `model`'s proxy chain with ensure_selected() (a
+    BaseModel or SqlFilterProxyModel), or None."""
+    while model is not None and not hasattr(model, "ensure_selected"):
+        model = model.sourceModel() if isinstance(model, QAbstractProxyModel) else None
+    return model
+
+
+class LazyModelPageMixin:
+    """
+    Mixin for the pages showing table models, listed before QWidget in the
+    bases. The application builds its models lazily, so the models of the
+    page's item views are selected when the page is first shown, not at
+    startup.
+    """
+
+    def showEvent(self, event):
+        # The table models are lazy; load their first page when the page is shown.
+        for view in self.findChildren(QAbstractItemView):
+            model = lazy_source_model(view.model())
+            if model is not None:
+                model.ensure_selected()
+        super().showEvent(event)
@@ -18,6 +18,8 @@ class MultiFieldFilterProxyModel(QSortFilterProxyModel):
 
     def filterAcceptsRow(self, source_row, source_parent):
         model = self.sourceModel()
+        if hasattr(model, "is_row_removed") and model.is_row_removed(source_row):
+            return False
         for column, text in self.filters.items():
             if text:
                 index = model.index(source_row, column, source_parent)
@@ -0,0 +1,156 @@
+# src/views/utils/sql_filter_model.py
+from typing import Dict, Tuple
+
+from PyQt6.QtCore import (
+    Qt,
+    QMetaType,
+    QModelIndex,
+    QSortFilterProxyModel,
+    QTimer,
+)
+from PyQt6.QtSql import QSqlField
+
+from src.models.base_model import BaseModel
+from src.my_types import RowChangesType
+
+
+class SqlFilterProxyModel(QSortFilterProxyModel):
+    """
+    Drop-in alternative to MultiFieldFilterProxyModel that filters and sorts in
+    SQLite instead of in Python.
+
+    Active filters are turned into a WHERE clause applied with
+    QSqlTableModel.setFilter, and header clicks into ORDER BY via
+    QSqlTableModel.sort. Both are debounced. The filtered rows live in a private
+    copy of the table model, so the model shared with the services (which
+    resolve ids through its rows) is never filtered. The row changes written
+    through the services are applied to the copy row by row (see
+    BaseModel.apply_changes), so edits do not re-select and re-sort the table.
+    The copy is lazy: nothing is selected until ensure_selected() is called,
+    typically when the page is first shown.
+    """
+
+    DEBOUNCE_MS = 250
+
+    def __init__(self, service_model: BaseModel, parent=None):
+        super().__init__(parent)
+        self._service_model = service_model
+        self._display_model: BaseModel = service_model.__class__(
+            parent=self, lazy=True, page_size=service_model.page_size
+        )
+        self.setSourceModel(self._display_model)
+        # column -> (text, exact)
+        self.filters: Dict[int, Tuple[str, bool]] = {}
+        # Extra SQL condition, e.g. a full-text search subquery.
+        self.search_condition = ""
+        self._applied_filter = ""
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self._apply)
+
+        self._service_model.rows_changed.connect(self._on_service_rows_changed)
+
+    def set_filter(self, column: int, text: str, exact: bool = False):
+        """
+        Filters `column` on `text`, case-insensitively for every script (as
+        MultiFieldFilterProxyModel did with str.lower()):
+        - substring match through the model's trigram FILTER_INDEX for texts
+          of 3+ characters; shorter texts (which trigrams cannot match) and
+          columns outside the index fall back to a LIKE scan;
+        - with `exact`, `lower(column) = text`, backed by the lower(column)
+          indexes. SQLite's lower() only folds ASCII, which is enough for the
+          values the dialogs store (lowercased).
+        """
+        self.filters[column] = (text.strip().lower(), exact)
+        self._timer.start()
+
+    def set_search_condition(self, condition: str):
+        """ANDs `condition`, a trusted SQL fragment such as
+        RealEstateProductService.search_condition(), with the column filters."""
+        self.search_condition = condition
+        self._timer.start()
+
+    def ensure_selected(self) -> bool:
+        return self._display_model.ensure_selected()
+
+    def refresh(self):
+        """Schedules a re-select of the filtered rows."""
+        self._timer.start()
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        # ORDER BY runs in SQLite; the proxy keeps the source order.
+        self._display_model.setSort(column, order)
+        if self._display_model.is_selected():
+            self._display_model.select()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        return not self._display_model.is_row_removed(source_row)
+
+    def build_where_clause(self) -> str:
+        driver = self._display_model.database().driver()
+        index_columns = set(self._display_model.FILTER_INDEX_COLUMNS)
+        conditions = []
+        match_terms = []
+        for column, (text, exact) in sorted(self.filters.items()):
+            if not text or column < 0:
+                continue
+            field_name = self._display_model.record().fieldName(column)
+            if not field_name:
+                continue
+            if exact:
+                conditions.append(
+                    f"lower({field_name}) = {self._literal(driver, text)}"
+                )
+            elif field_name in index_columns and len(text) >= 3:
+                phrase = text.replace('"', '""')
+                match_terms.append(f'{field_name} : "{phrase}"')
+            else:
+                conditions.append(self._like_condition(driver, field_name, text))
+        if match_terms:
+            index = self._display_model.FILTER_INDEX
+            conditions.append(
+                f"id IN (SELECT rowid FROM {index} WHERE {index} MATCH "
+                f"{self._literal(driver, ' AND '.join(match_terms))})"
+            )
+        if self.search_condition:
+            conditions.append(self.search_condition)
+        return " AND ".join(conditions)
+
+    @classmethod
+    def _like_condition(cls, driver, field_name: str, text: str) -> str:
+        # LIKE folds ASCII case only: the other scripts' cases of `text` are
+        # matched as separate patterns.
+        conditions = []
+        for variant in dict.fromkeys([text, text.upper(), text.capitalize()]):
+            pattern = (
+                variant.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            )
+            conditions.append(
+                f"{field_name} LIKE {cls._literal(driver, f'%{pattern}%')} ESCAPE '\\'"
+            )
+        return f"({' OR '.join(conditions)})"
+
+    @staticmethod
+    def _literal(driver, value: str) -> str:
+        # Let the SQL driver quote the value instead of formatting it by hand.
+        field = QSqlField("value", QMetaType(QMetaType.Type.QString.value))
+        field.setValue(value)
+        return driver.formatValue(field)
+
+    def _apply(self):
+        where = self.build_where_clause()
+        changed = where != self._applied_filter
+        self._applied_filter = where
+        if not self._display_model.is_selected():
+            # Picked up by the deferred select() when the table is shown.
+            self._display_model.setFilter(where)
+        elif changed:
+            self._display_model.setFilter(where)  # setFilter() re-selects
+        else:
+            self._display_model.select()
+
+    def _on_service_rows_changed(self, changes: RowChangesType):
+        if self._display_model.is_selected():
+            self._display_model.apply_changes(changes)
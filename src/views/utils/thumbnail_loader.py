@@ -0,0 +1,288 @@
+# src/views/utils/thumbnail_loader.py
+import os
+import time
+import hashlib
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from PyQt6.QtCore import (
+    Qt,
+    QObject,
+    QRunnable,
+    QSize,
+    QThreadPool,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt6.QtGui import QImage, QImageReader
+
+from src.my_constants import PATH_THUMBNAIL_CACHE
+
+# (path, mtime_ns, file size, bucket width, bucket height)
+ThumbnailKey = Tuple[str, int, int, int, int]
+
+# Edges of the square boxes thumbnails are decoded into. A request is served
+# by the smallest box holding its target size, so resizing the image label
+# does not create a new cached thumbnail for every pixel of width.
+SIZE_BUCKETS = (160, 320, 640, 1280)
+
+
+def bucket_size(target_size: QSize) -> QSize:
+    """The SIZE_BUCKETS box a thumbnail fitting `target_size` is decoded into."""
+    longest = max(target_size.width(), target_size.height())
+    for edge in SIZE_BUCKETS:
+        if longest <= edge:
+            return QSize(edge, edge)
+    return QSize(SIZE_BUCKETS[-1], SIZE_BUCKETS[-1])
+
+
+def thumbnail_key(image_path: str, target_size: QSize) -> Optional[ThumbnailKey]:
+    """Cache key of a thumbnail. It changes when the source file is modified."""
+    try:
+        stat = os.stat(image_path)
+    except OSError:
+        return None
+    bucket = bucket_size(target_size)
+    return (
+        os.path.abspath(image_path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        bucket.width(),
+        bucket.height(),
+    )
+
+
+def decode_thumbnail(image_path: str, target_size: QSize, cache_path: str) -> QImage:
+    """
+    Returns the thumbnail of `image_path` fitting `target_size`, read from
+    `cache_path` when present. Otherwise the source is decoded at the scaled
+    size (QImageReader.setScaledSize lets JPEG decode straight to a smaller
+    image) and the result is written to `cache_path`.
+    """
+    if os.path.isfile(cache_path):
+        image = QImageReader(cache_path).read()
+        if not image.isNull():
+            try:
+                # The mtime is the last use: prune_thumbnail_cache drops the
+                # least recently used thumbnails first.
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return image
+
+    reader = QImageReader(image_path)
+    source_size = reader.size()
+    if source_size.isValid() and not source_size.isEmpty():
+        reader.setScaledSize(
+            source_size.scaled(target_size, Qt.AspectRatioMode.KeepAspectRatio)
+        )
+    image = reader.read()
+    if image.isNull():
+        return image
+    if image.size() != image.size().scaled(
+        target_size, Qt.AspectRatioMode.KeepAspectRatio
+    ):
+        # The reader could not scale (unknown size); scale the decoded image.
+        image = image.scaled(
+            target_size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.{id(image)}.tmp"
+        if image.save(tmp_path, "PNG"):
+            os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"[decode_thumbnail] Warning: cannot write thumbnail cache: {e}")
+    return image
+
+
+def prune_thumbnail_cache(cache_dir: str, max_bytes: int, max_age_seconds: float):
+    """
+    Removes the thumbnails of `cache_dir` not used for `max_age_seconds`,
+    then the least recently used ones until the cache holds at most
+    `max_bytes`. Left-over temporary files are removed with the old ones.
+    """
+    entries: List[Tuple[float, int, str]] = []
+    oldest_kept = time.time() - max_age_seconds
+    total = 0
+    for root, _dirs, files in os.walk(cache_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+                if stat.st_mtime < oldest_kept:
+                    os.remove(path)
+                    continue
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+    entries.sort()
+    for _mtime, size, path in entries:
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
+class ThumbnailCachePruneWorker(QRunnable):
+    def __init__(self, cache_dir: str, max_bytes: int, max_age_seconds: float):
+        super().__init__()
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.setAutoDelete(True)
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            prune_thumbnail_cache(self.cache_dir, self.max_bytes, self.max_age_seconds)
+        except Exception as e:
+            print(f"[{self.__class__.__name__}.run] Error: {e}")
+
+
+class ThumbnailWorkerSignals(QObject):
+    """
+    loaded: Emits (request_id, key, image) when the thumbnail is decoded. The
+    image is null if the file could not be read.
+    """
+
+    loaded = pyqtSignal(int, tuple, QImage)
+
+
+class ThumbnailWorker(QRunnable):
+    def __init__(
+        self,
+        request_id: int,
+        key: ThumbnailKey,
+        image_path: str,
+        target_size: QSize,
+        cache_path: str,
+    ):
+        super().__init__()
+        self.request_id = request_id
+        self.key = key
+        self.image_path = image_path
+        self.target_size = target_size
+        self.cache_path = cache_path
+        self.signals = ThumbnailWorkerSignals()
+        self.setAutoDelete(True)
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            image = decode_thumbnail(self.image_path, self.target_size, self.cache_path)
+        except Exception as e:
+            print(f"[{self.__class__.__name__}.run] Error: {e}")
+            image = QImage()
+        self.signals.loaded.emit(self.request_id, self.key, image)
+
+
+class ThumbnailLoader(QObject):
+    """
+    Loads image thumbnails off the GUI thread.
+
+    Thumbnails are decoded into the SIZE_BUCKETS box holding the target size
+    and cached on disk (keyed by path, mtime, size and box); the most recent
+    ones are kept as QImages in an in-memory LRU and scaled down to the
+    requested size on delivery. The disk cache is pruned by age and total
+    size when the loader starts and every PRUNE_EVERY_DECODES decodes. Only
+    the latest request is delivered through `thumbnail_ready`, so fast
+    selection changes never show a stale image.
+    """
+
+    MEMORY_CACHE_SIZE = 64
+    DISK_CACHE_MAX_BYTES = 256 * 1024 * 1024
+    DISK_CACHE_MAX_AGE_SECONDS = 30 * 24 * 3600
+    PRUNE_EVERY_DECODES = 500
+
+    # (image path, image) - image is null when the file cannot be decoded.
+    thumbnail_ready = pyqtSignal(str, QImage)
+
+    def __init__(self, cache_dir: str = PATH_THUMBNAIL_CACHE, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir
+        self._memory: "OrderedDict[ThumbnailKey, QImage]" = OrderedDict()
+        self._request_id = 0
+        self._request_path = ""
+        self._request_size = QSize()
+        self._decodes = 0
+        self.threadpool = QThreadPool(self)
+        self.threadpool.setMaxThreadCount(2)
+        self.prune_cache()
+
+    def prune_cache(self):
+        """Prunes the disk cache on a worker thread."""
+        self.threadpool.start(
+            ThumbnailCachePruneWorker(
+                self.cache_dir,
+                self.DISK_CACHE_MAX_BYTES,
+                self.DISK_CACHE_MAX_AGE_SECONDS,
+            )
+        )
+
+    def request(self, image_path: str, target_size: QSize):
+        """Asks for the thumbnail of `image_path` fitting `target_size`.
+        Emits thumbnail_ready immediately on a memory hit, otherwise when the
+        worker has decoded it (unless a newer request came in meanwhile)."""
+        self._request_id += 1
+        self._request_path = image_path
+        self._request_size = target_size
+        key = thumbnail_key(image_path, target_size)
+        if key is None:
+            self.thumbnail_ready.emit(image_path, QImage())
+            return
+        image = self._memory.get(key)
+        if image is not None:
+            self._memory.move_to_end(key)
+            self.thumbnail_ready.emit(image_path, self._fit(image, target_size))
+            return
+        self._decodes += 1
+        if self._decodes % self.PRUNE_EVERY_DECODES == 0:
+            self.prune_cache()
+        worker = ThumbnailWorker(
+            self._request_id,
+            key,
+            image_path,
+            QSize(key[3], key[4]),
+            self._cache_path(key),
+        )
+        worker.signals.loaded.connect(self._on_loaded)
+        self.threadpool.start(worker)
+
+    @staticmethod
+    def _fit(image: QImage, target_size: QSize) -> QImage:
+        """Scales a bucket-sized thumbnail down to `target_size`."""
+        if image.isNull() or not target_size.isValid() or target_size.isEmpty():
+            return image
+        if image.width() <= target_size.width() and (
+            image.height() <= target_size.height()
+        ):
+            return image
+        return image.scaled(
+            target_size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+
+    def _cache_path(self, key: ThumbnailKey) -> str:
+        digest = hashlib.sha1(repr(key).encode("utf8")).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.png")
+
+    @pyqtSlot(int, tuple, QImage)
+    def _on_loaded(self, request_id: int, key: tuple, image: QImage):
+        if not image.isNull():
+            self._memory[key] = image
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+        if request_id == self._request_id:
+            self.thumbnail_ready.emit(
+                self._request_path, self._fit(image, self._request_size)
+            )
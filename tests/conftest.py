@@ -0,0 +1,59 @@
+# tests/conftest.py
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from src.database.product_database import initialize_product_database
+from src.models.product_model import RealEstateProductModel
+from src.services.product_service import RealEstateProductService
+from src.my_types import RealEstateProductType
+
+
+@pytest.fixture
+def qapp():
+    app = QApplication.instance() or QApplication([])
+    yield app
+    app.processEvents()
+
+
+@pytest.fixture
+def product_service(qapp, tmp_path):
+    initialize_product_database(str(tmp_path / "product.db"))
+    return RealEstateProductService(RealEstateProductModel())
+
+
+@pytest.fixture
+def make_product():
+    """make_product(index, **fields): a product to insert, `pid` RE.T.<index>;
+    keyword arguments override its fields."""
+
+    def factory(index: int, **fields) -> RealEstateProductType:
+        values = dict(
+            id=None,
+            pid=f"RE.T.{index:06d}",
+            status=1,
+            transaction_type="bán",
+            province="lâm đồng",
+            district="đà lạt",
+            ward="phường 1",
+            street=f"đường {index}",
+            category="nhà phố",
+            area=float(index),
+            price=float(index),
+            legal=None,
+            structure=1.0,
+            function=None,
+            building_line=None,
+            furniture=None,
+            description=None,
+            image_dir=None,
+            created_at=None,
+            updated_at=None,
+        )
+        values.update(fields)
+        return RealEstateProductType(**values)
+
+    return factory
@@ -0,0 +1,59 @@
+# tests/test_image_ingest.py
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QColor, QImage, QImageReader, QPainter
+
+from src.services.image_ingest import ingest_image
+
+
+def noisy_image(width: int, height: int) -> QImage:
+    image = QImage(width, height, QImage.Format.Format_RGB32)
+    image.fill(QColor("white"))
+    painter = QPainter(image)
+    for i in range(0, width, 7):
+        painter.setPen(QColor((i * 37) % 256, (i * 11) % 256, (i * 3) % 256))
+        painter.drawLine(i, 0, width - i, height)
+    painter.end()
+    return image
+
+
+def with_jpeg_metadata(data: bytes) -> bytes:
+    exif = b"Exif\x00\x00" + b"GPS" * 200
+    app1 = b"\xff\xe1" + (len(exif) + 2).to_bytes(2, "big") + exif
+    comment = b"\xff\xfe" + (7).to_bytes(2, "big") + b"hello"
+    return data[:2] + app1 + comment + data[2:]
+
+
+def test_small_jpeg_never_grows_and_loses_its_metadata(tmp_path):
+    source = tmp_path / "small.jpg"
+    noisy_image(300, 200).save(str(tmp_path / "plain.jpg"), "JPG", 30)
+    source.write_bytes(with_jpeg_metadata((tmp_path / "plain.jpg").read_bytes()))
+
+    result = ingest_image(str(source), str(tmp_path))
+    staged = open(result.path, "rb").read()
+    assert result.error is None
+    assert result.size <= result.original_size
+    assert b"Exif" not in staged and b"hello" not in staged
+    assert result.path.endswith(".jpg")
+    assert QImageReader(result.path).size() == QSize(300, 200)
+
+
+def test_png_text_chunks_are_stripped(tmp_path):
+    image = noisy_image(64, 64)
+    image.setText("Author", "someone")
+    source = tmp_path / "small.png"
+    assert image.save(str(source), "PNG")
+
+    result = ingest_image(str(source), str(tmp_path))
+    staged = open(result.path, "rb").read()
+    assert result.size <= result.original_size
+    assert b"someone" not in staged
+    assert not QImage(result.path).isNull()
+
+
+def test_large_image_is_downscaled_and_reencoded(tmp_path):
+    source = tmp_path / "large.jpg"
+    noisy_image(800, 400).save(str(source), "JPG", 95)
+
+    result = ingest_image(str(source), str(tmp_path), max_dimension=400)
+    assert (result.width, result.height) == (400, 200)
+    assert result.size < result.original_size
@@ -0,0 +1,67 @@
+# tests/test_image_listing.py
+import os
+import time
+
+from src.services import product_service as product_service_module
+
+HOUR_NS = 3600 * 1_000_000_000
+
+
+def touch(directory, *names):
+    for name in names:
+        (directory / name).write_bytes(b"")
+
+
+def set_mtime(directory, mtime_ns):
+    os.utime(directory, ns=(mtime_ns, mtime_ns))
+
+
+def count_scandir(monkeypatch):
+    calls = []
+    scandir = os.scandir
+
+    def counting_scandir(path):
+        calls.append(path)
+        return scandir(path)
+
+    monkeypatch.setattr(product_service_module.os, "scandir", counting_scandir)
+    return calls
+
+
+def test_listing_is_cached_until_the_directory_mtime_changes(
+    product_service, tmp_path, monkeypatch
+):
+    image_dir = tmp_path / "images"
+    image_dir.mkdir()
+    (image_dir / "sub.jpg").mkdir()
+    touch(image_dir, "b.JPG", "a.webp", "c.Png", ".hidden.jpg", "notes.txt")
+    settled_ns = time.time_ns() - HOUR_NS
+    set_mtime(image_dir, settled_ns)
+    scandir_calls = count_scandir(monkeypatch)
+    path = str(image_dir)
+
+    expected = [os.path.join(path, name) for name in ("a.webp", "b.JPG", "c.Png")]
+    assert product_service.get_images_by_path(path) == expected
+    assert product_service.get_images_by_path(path) == expected
+    assert len(scandir_calls) == 1
+
+    touch(image_dir, "d.jpeg")
+    set_mtime(image_dir, settled_ns + 1_000_000_000)
+    assert product_service.get_images_by_path(path) == expected + [
+        os.path.join(path, "d.jpeg")
+    ]
+    assert len(scandir_calls) == 2
+
+
+def test_recently_changed_directory_is_not_cached(
+    product_service, tmp_path, monkeypatch
+):
+    touch(tmp_path, "a.jpg")
+    scandir_calls = count_scandir(monkeypatch)
+
+    assert product_service.get_images_by_path(str(tmp_path)) == [
+        os.path.join(str(tmp_path), "a.jpg")
+    ]
+    product_service.get_images_by_path(str(tmp_path))
+    assert len(scandir_calls) == 2
+    assert product_service.get_images_by_path(str(tmp_path / "missing")) == []
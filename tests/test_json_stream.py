@@ -0,0 +1,92 @@
+# tests/test_json_stream.py
+import json
+
+import pytest
+
+from src.utils import json_stream
+from src.utils.json_stream import iter_json_items
+
+ITEMS = [
+    {"pid": "RE.T.000001", "area": 12.5, "tags": [1, 2, {"x": None}]},
+    123456789,
+    -1.5e3,
+    "đường Đà Lạt",
+    True,
+    None,
+    {"street": "đường 3/2", "ward": "phường 1"},
+]
+
+
+def write(tmp_path, name: str, text: str) -> str:
+    file_path = tmp_path / name
+    file_path.write_bytes(text.encode("utf8"))
+    return str(file_path)
+
+
+def items_of(file_path: str, chunk_size: int):
+    return [item for item, _ in iter_json_items(file_path, chunk_size=chunk_size)]
+
+
+def test_items_and_numbers_cut_at_every_chunk_boundary(tmp_path):
+    file_path = write(tmp_path, "items.json", json.dumps(ITEMS, ensure_ascii=False))
+    for chunk_size in range(1, 24):
+        assert items_of(file_path, chunk_size) == ITEMS, chunk_size
+
+
+def test_multibyte_utf8_and_bom_at_chunk_boundary(tmp_path):
+    text = "﻿" + json.dumps([{"ward": "Đà Lạt ắ ộ"}] * 3, ensure_ascii=False)
+    file_path = write(tmp_path, "utf8.json", text)
+    for chunk_size in range(1, 8):
+        assert items_of(file_path, chunk_size) == [{"ward": "Đà Lạt ắ ộ"}] * 3
+
+
+def test_bytes_read_reaches_file_size(tmp_path):
+    file_path = write(tmp_path, "items.json", json.dumps(ITEMS, indent=4))
+    positions = [bytes_read for _, bytes_read in iter_json_items(file_path, 16)]
+    assert positions == sorted(positions)
+    assert positions[-1] == (tmp_path / "items.json").stat().st_size
+
+
+def test_json_lines(tmp_path):
+    lines = "\n".join(json.dumps(item, ensure_ascii=False) for item in ITEMS)
+    file_path = write(tmp_path, "items.jsonl", lines + "\n\n")
+    assert items_of(file_path, 4) == ITEMS
+
+
+@pytest.mark.parametrize("text", ["[]", " [ \n ] ", "﻿[]"])
+def test_empty_array(tmp_path, text):
+    assert items_of(write(tmp_path, "empty.json", text), 1) == []
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a": 1}',
+        '[{"a": 1} {"b": 2}]',
+        '[{"a": 1}, {"b": 2}',
+        '[{"a": 1}, {"b": ',
+        '[{"a": "unterminated}]',
+        "[1, 2,, 3]",
+    ],
+)
+def test_malformed_input_raises(tmp_path, text):
+    file_path = write(tmp_path, "bad.json", text)
+    for chunk_size in (1, 3, 64 * 1024):
+        with pytest.raises(ValueError):
+            items_of(file_path, chunk_size)
+
+
+def test_malformed_item_does_not_read_to_the_end(tmp_path, monkeypatch):
+    tail = ", ".join(json.dumps({"pid": i}) for i in range(2000))
+    file_path = write(tmp_path, "bad.json", '[{"a": oops}, ' + tail + "]")
+    reads = []
+    read = json_stream._TextReader.read
+
+    def counting_read(self, size):
+        reads.append(size)
+        return read(self, size)
+
+    monkeypatch.setattr(json_stream._TextReader, "read", counting_read)
+    with pytest.raises(json.JSONDecodeError):
+        items_of(file_path, 64)
+    assert len(reads) <= 2
@@ -0,0 +1,55 @@
+# tests/test_key_index.py
+from PyQt6.QtCore import Qt
+
+from src.models.product_model import RealEstateProductModel
+
+
+def assert_index_matches_rows(model):
+    for field_name in ("id", "pid"):
+        column = model.fieldIndex(field_name)
+        expected = {}
+        for row in range(model.rowCount()):
+            key = model.data(model.index(row, column), Qt.ItemDataRole.DisplayRole)
+            if key is not None:
+                expected.setdefault(key, []).append(row)
+        assert {
+            key: model.find_rows_by_key(field_name, key, fetch_more=False)
+            for key in expected
+        } == expected
+        assert sum(len(rows) for rows in model._key_index[field_name].values()) == sum(
+            len(rows) for rows in expected.values()
+        )
+
+
+def test_index_follows_fetch_insert_remove_and_reset(product_service, make_product):
+    assert product_service.import_data([make_product(i) for i in range(40)])
+    model = RealEstateProductModel(lazy=True, page_size=10)
+
+    # Selecting (model reset) and fetchMore (rowsInserted at the end).
+    assert model.find_row_by_pid("RE.T.000030") == 30
+    assert_index_matches_rows(model)
+
+    # A buffered row inserted in the middle shifts the rows behind it.
+    assert model.insertRow(5)
+    model.setData(model.index(5, model.fieldIndex("pid")), "RE.T.NEW")
+    assert model.find_row_by_pid("RE.T.NEW") == 5
+    assert model.find_row_by_pid("RE.T.000030") == 31
+    assert_index_matches_rows(model)
+
+    # Reverting removes it again.
+    model.revertAll()
+    assert model.find_row_by_pid("RE.T.NEW") == -1
+    assert model.find_row_by_pid("RE.T.000030") == 30
+    assert_index_matches_rows(model)
+
+    # dataChanged re-keys the edited row.
+    model.setData(model.index(3, model.fieldIndex("pid")), "RE.T.EDITED")
+    assert model.find_row_by_pid("RE.T.EDITED") == 3
+    assert model.find_row_by_key("pid", "RE.T.000003", fetch_more=False) == -1
+    assert_index_matches_rows(model)
+
+    model.revertAll()
+    model.select()
+    assert model.find_row_by_pid("RE.T.000003") == 3
+    assert model.find_row_by_key("pid", "RE.T.EDITED", fetch_more=False) == -1
+    assert_index_matches_rows(model)
@@ -0,0 +1,21 @@
+# tests/test_lazy_lookup.py
+from src.models.product_model import RealEstateProductModel
+from src.services.product_service import RealEstateProductService
+
+
+def test_lookups_do_not_page_a_lazy_model(product_service, make_product):
+    assert product_service.import_data([make_product(i) for i in range(600)])
+    lazy_service = RealEstateProductService(RealEstateProductModel(lazy=True))
+
+    assert lazy_service.initialize_new_pid("bán").startswith("RE.S.")
+    assert lazy_service.read(550).pid == "RE.T.000549"
+    assert lazy_service.read_by_pid("RE.T.000599").id == 600
+    assert lazy_service.read(10_000) is None
+    assert lazy_service.model.rowCount() == 0
+
+    # Once selected, only the first page is loaded; misses stay in SQL.
+    lazy_service.model.ensure_selected()
+    loaded = lazy_service.model.rowCount()
+    assert lazy_service.read(1).pid == "RE.T.000000"
+    assert lazy_service.read_by_pid("RE.T.000599").id == 600
+    assert lazy_service.model.rowCount() == loaded < 600
@@ -0,0 +1,26 @@
+# tests/test_listing_payload_builder.py
+from src.services.listing_payload_builder import ListingPayloadBuilder
+
+
+class ShortTemplateService:
+    """Returns fewer templates than asked for, as get_random_many() does when
+    sampled templates were deleted meanwhile; none for "cho thuê"."""
+
+    def get_random_many(self, part, transaction_type, category, k):
+        if transaction_type == "cho thuê":
+            return []
+        return [f"{part} {i}" for i in range(min(k, 2))]
+
+
+def test_draw_templates_tops_up_missing_templates(qapp, make_product):
+    builder = ListingPayloadBuilder(None, ShortTemplateService(), "")
+    products = [make_product(i) for i in range(5)] + [
+        make_product(5, transaction_type="cho thuê")
+    ]
+
+    pairs = builder._draw_templates(products)
+    assert len(pairs) == len(products)
+    assert pairs[0] == ("", "")
+    for title, description in pairs[1:]:
+        assert title in ("title 0", "title 1")
+        assert description in ("description 0", "description 1")
@@ -0,0 +1,37 @@
+# tests/test_product_search.py
+
+
+def test_search_folds_case_diacritics_and_d_stroke(product_service, make_product):
+    assert product_service.import_data(
+        [
+            make_product(0, district="Đà Lạt", street="đường Trần Phú"),
+            make_product(1, district="huế", street="lê lợi"),
+            make_product(2, district="đà lạt", description="gần chợ ĐÀ LẠT"),
+        ]
+    )
+
+    for text in ("da lat", "Đà Lạt", "DA LAT", "đà lạ"):
+        assert sorted(product_service.search_ids(text)) == [1, 3], text
+    assert product_service.search_ids("duong tran") == [1]
+    assert product_service.search_ids("hue") == [2]
+    assert product_service.search_ids("  ,. ") == []
+
+    # The update and delete triggers keep the index in step.
+    product = product_service.read(2)
+    product.street = "Đinh Tiên Hoàng"
+    assert product_service.update(2, product)
+    assert product_service.search_ids("dinh tien") == [2]
+    assert product_service.search_ids("le loi") == []
+    assert product_service.delete(1)
+    assert product_service.search_ids("da lat") == [3]
+
+
+def test_search_condition_filters_the_model(product_service, make_product):
+    assert product_service.import_data(
+        [make_product(0, ward="Phường Đông Hải"), make_product(1)]
+    )
+    model = product_service.model
+    model.setFilter(product_service.search_condition("dong hai"))
+    model.select()
+    assert model.rowCount() == 1
+    assert product_service.search_condition("") == ""
@@ -0,0 +1,65 @@
+# tests/test_re_template.py
+import random
+from dataclasses import fields
+
+from src.my_constants import ICONS, RE_UNIT
+from src.my_types import RealEstateProductType
+from src.utils.re_template import compile_template, render_many, replace_template
+
+TEMPLATES = [
+    "<icon> Bán nhà <street>, <ward>, <district> <icon>",
+    "<category> <area>m2 - giá <price> <unit> <icon><icon>",
+    "<description> <legal> <unknown> <pid>",
+    "no placeholders at all",
+    "",
+]
+
+
+def replace_template_by_str_replace(
+    product_data: RealEstateProductType, template: str
+) -> str:
+    """The str.replace implementation replaced by the compiled templates."""
+    result = template
+    for field_info in fields(RealEstateProductType):
+        field_value = getattr(product_data, field_info.name, None)
+        if field_value is None:
+            field_value = ""
+        placeholder = f"<{field_info.name}>"
+        if field_info.name in ["street", "district", "ward", "province"]:
+            result = result.replace(placeholder, str(field_value).title())
+        result = result.replace(placeholder, str(field_value).capitalize())
+    if "<unit>" in result:
+        result = result.replace("<unit>", RE_UNIT[product_data.transaction_type])
+    while "<icon>" in result:
+        result = result.replace("<icon>", random.choice(ICONS), 1)
+    return result
+
+
+def test_compiled_output_matches_str_replace(make_product):
+    products = [
+        make_product(1, description="nhà đẹp", legal="sổ hồng"),
+        make_product(2, street="đường 3/2", legal=None),
+    ]
+    for template in TEMPLATES:
+        for product in products:
+            random.seed(7)
+            expected = replace_template_by_str_replace(product, template)
+            random.seed(7)
+            assert replace_template(product, template) == expected
+
+
+def test_render_many_compiles_once(make_product):
+    products = [make_product(i) for i in range(5)]
+    template = "<street> - <area>m2"
+    compile_template.cache_clear()
+    assert render_many(products, template) == [
+        replace_template(product, template) for product in products
+    ]
+    assert compile_template.cache_info().misses == 1
+
+
+def test_field_values_are_not_substituted_again(make_product):
+    # The str.replace implementation substituted "<ward>" inside the
+    # description as well; the compiled template keeps field values verbatim.
+    product = make_product(1, description="gần <ward>")
+    assert replace_template(product, "<description>") == "Gần <ward>"
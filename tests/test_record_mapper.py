@@ -0,0 +1,30 @@
+# tests/test_record_mapper.py
+from src.services import record_mapper
+
+
+def test_numeric_text_conversion():
+    assert record_mapper._to_int("12") == 12
+    assert record_mapper._to_int("12.5") == 12
+    assert record_mapper._to_int("") is None
+    assert record_mapper._to_int("abc") is None
+    assert record_mapper._to_float("1e3") == 1000.0
+    assert record_mapper._to_float("abc") is None
+
+
+def test_read_all_skips_a_malformed_row(product_service, make_product, monkeypatch):
+    assert product_service.import_data(
+        [make_product(0), make_product(1, street="bad"), make_product(2)]
+    )
+
+    build = record_mapper.RecordMapper._build
+
+    def build_or_fail(self, values):
+        instance = build(self, values)
+        if instance.street == "bad":
+            raise ValueError("malformed row")
+        return instance
+
+    monkeypatch.setattr(record_mapper.RecordMapper, "_build", build_or_fail)
+    expected = ["RE.T.000000", "RE.T.000002"]
+    assert [p.pid for p in product_service.read_all()] == expected
+    assert [p.pid for batch in product_service.iter_all() for p in batch] == expected
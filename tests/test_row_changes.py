@@ -0,0 +1,75 @@
+# tests/test_row_changes.py
+from PyQt6.QtCore import Qt
+
+
+def pid_at(model, row):
+    return model.data(model.index(row, model.fieldIndex("pid")))
+
+
+def test_single_row_writes_are_applied_without_select(
+    product_service, make_product, tmp_path
+):
+    model = product_service.model
+    assert product_service.import_data([make_product(i) for i in range(3)])
+    assert model.rowCount() == 3
+
+    resets = []
+    changes = []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.rows_changed.connect(changes.append)
+
+    # Inserted rows are appended after the fetched rows.
+    assert product_service.create(str(tmp_path), [], make_product(10))
+    assert model.rowCount() == 4
+    assert pid_at(model, 3) == "RE.T.000010"
+    assert model.find_row_by_pid("RE.T.000010") == 3
+
+    # Updated rows are re-read in place.
+    product = product_service.read(2)
+    product.street = "đường mới"
+    assert product_service.update(2, product)
+    assert model.data(model.index(1, model.fieldIndex("street"))) == "đường mới"
+
+    # Deleted rows stay as disabled placeholders until the next select().
+    assert product_service.delete(1)
+    assert model.rowCount() == 4
+    assert model.is_row_removed(0)
+    assert model.flags(model.index(0, 0)) == Qt.ItemFlag.NoItemFlags
+    assert model.find_row_by_key("id", 1, fetch_more=False) == -1
+
+    # An appended row is really removed.
+    assert product_service.delete(4)
+    assert model.rowCount() == 3
+
+    assert not resets
+    assert [(c.inserted, c.updated, c.deleted) for c in changes] == [
+        ([4], [], []),
+        ([], [2], []),
+        ([], [], [1]),
+        ([], [], [4]),
+    ]
+
+    model.select()
+    assert [pid_at(model, row) for row in range(model.rowCount())] == [
+        "RE.T.000001",
+        "RE.T.000002",
+    ]
+    assert not model.is_row_removed(0)
+
+
+def test_updated_row_leaving_the_filter_is_removed(
+    product_service, make_product, tmp_path
+):
+    model = product_service.model
+    assert product_service.import_data([make_product(i) for i in range(3)])
+    model.setFilter("status = 1")
+    model.select()
+
+    product = product_service.read(2)
+    product.status = 0
+    assert product_service.update(2, product)
+    assert model.is_row_removed(1)
+
+    # A created row outside the filter is not appended.
+    assert product_service.create(str(tmp_path), [], make_product(10, status=0))
+    assert model.rowCount() == 3
@@ -0,0 +1,57 @@
+# tests/test_thumbnail_cache.py
+import os
+import time
+
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QColor, QImage
+
+from src.views.utils.thumbnail_loader import (
+    ThumbnailLoader,
+    bucket_size,
+    prune_thumbnail_cache,
+    thumbnail_key,
+)
+
+
+def test_target_sizes_share_a_bucket(tmp_path):
+    image_path = tmp_path / "a.jpg"
+    image_path.write_bytes(b"x")
+    assert bucket_size(QSize(100, 80)) == QSize(160, 160)
+    assert bucket_size(QSize(500, 380)) == QSize(640, 640)
+    assert bucket_size(QSize(5000, 10)) == QSize(1280, 1280)
+    assert thumbnail_key(str(image_path), QSize(500, 380)) == thumbnail_key(
+        str(image_path), QSize(520, 400)
+    )
+
+
+def test_prune_drops_old_then_least_recently_used(tmp_path):
+    now = time.time()
+    for name, age in [("old", 40), ("a", 3), ("b", 2), ("c", 1)]:
+        path = tmp_path / "ab" / f"{name}.png"
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(b"x" * 100)
+        os.utime(path, (now - age * 86400, now - age * 86400))
+
+    prune_thumbnail_cache(str(tmp_path), max_bytes=250, max_age_seconds=30 * 86400)
+    assert sorted(os.listdir(tmp_path / "ab")) == ["b.png", "c.png"]
+
+
+def test_loader_delivers_the_requested_size(qapp, tmp_path):
+    image_path = str(tmp_path / "big.png")
+    source = QImage(2000, 1000, QImage.Format.Format_RGB32)
+    source.fill(QColor("red"))
+    assert source.save(image_path)
+
+    loader = ThumbnailLoader(cache_dir=str(tmp_path / "cache"))
+    delivered = []
+    loader.thumbnail_ready.connect(lambda path, image: delivered.append(image))
+    loader.request(image_path, QSize(500, 400))
+    deadline = time.time() + 10
+    while not delivered and time.time() < deadline:
+        qapp.processEvents()
+    assert delivered[0].size() == QSize(500, 250)
+
+    # A slightly different label size is served from the same thumbnail.
+    loader.request(image_path, QSize(520, 400))
+    assert delivered[1].size() == QSize(520, 260)
+    loader.threadpool.waitForDone()
@@ -0,0 +1,43 @@
+# tests/test_transaction.py
+import json
+from dataclasses import asdict
+
+from src.controllers.base_controller import BaseController
+from src.controllers.product_controller import RealEstateProductController
+from src.my_types import RealEstateProductType
+
+
+def test_failed_import_rolls_back_and_leaves_connection_usable(
+    product_service, make_product
+):
+    assert product_service.import_data([make_product(i) for i in range(5)])
+    # Same pids again: UNIQUE(pid) fails the batch.
+    assert not product_service.import_data([make_product(i) for i in range(5)])
+    assert product_service.count() == 5
+
+    record_id = product_service.read_by_ids([1])[0].id
+    assert product_service.delete(record_id)
+    assert product_service.bulk_toggle_status([2, 3])
+    assert product_service.import_data([make_product(i) for i in range(5, 8)])
+    assert product_service.count() == 7
+
+
+def test_streamed_import_is_all_or_nothing(product_service, make_product, tmp_path):
+    controller = RealEstateProductController(product_service)
+    items = [asdict(make_product(i)) for i in range(25)]
+    # A duplicate pid in the third batch fails after two batches were inserted.
+    items[22] = dict(items[0])
+    file_path = tmp_path / "products.json"
+    file_path.write_text(json.dumps(items), encoding="utf8")
+
+    assert not BaseController.import_products(
+        controller, str(file_path), RealEstateProductType, batch_size=10
+    )
+    assert product_service.count() == 0
+
+    items[22] = asdict(make_product(22))
+    file_path.write_text(json.dumps(items), encoding="utf8")
+    assert BaseController.import_products(
+        controller, str(file_path), RealEstateProductType, batch_size=10
+    )
+    assert product_service.count() == 25